@@ -21,8 +21,10 @@ def main() -> None:
         # We choose gunicorn only if reload
         # option is not used, because reload
         # feature doesn't work with Uvicorn workers.
-        from BMC_API.src.api.gunicorn_runner import GunicornApplication
+        from BMC_API.src.api.gunicorn_runner import GunicornApplication, child_exit, setup_multiprocess_metrics
 
+        # Before the workers import prometheus_client, so they share their metrics
+        setup_multiprocess_metrics(settings.metrics_multiproc_dir)
         GunicornApplication(
             "BMC_API.src.api.application:get_app",
             host=settings.host,
@@ -32,6 +34,7 @@ def main() -> None:
             accesslog="-",
             loglevel=settings.log_level.value.lower(),
             access_log_format='%r "-" %s "-" %Tf',  # noqa: WPS323
+            child_exit=child_exit,
         ).run()
 
 
@@ -1,43 +1,36 @@
 # backend/BMC_API/src/api/application.py
 
-from fastapi import FastAPI, Request, Response, status
+from datetime import timedelta
+
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import UJSONResponse
-from slowapi import Limiter
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
-from slowapi.util import get_remote_address
 
 from BMC_API.src.api.exception_handlers import register_exception_handlers
-from BMC_API.src.api.middleware.no_cache_middleware import NoCacheMiddleware
+from BMC_API.src.api.middleware.cache_control_middleware import CacheControlMiddleware
+from BMC_API.src.api.middleware.compression_middleware import CompressionMiddleware
+from BMC_API.src.api.middleware.metrics_middleware import MetricsMiddleware
+from BMC_API.src.api.middleware.profiling_middleware import ProfilingMiddleware
+from BMC_API.src.api.middleware.rate_limit_middleware import RateLimitMiddleware
+from BMC_API.src.api.responses import json_response_class
 from BMC_API.src.api.routes.router import api_router
 from BMC_API.src.core.config.settings import settings
 from BMC_API.src.core.lifetime import lifespan
 from BMC_API.src.core.logging.logging import configure_logging
+from BMC_API.src.core.loop_watchdog import LoopWatchdog
+from BMC_API.src.core.profiler import SamplingProfiler
+from BMC_API.src.core.rate_limit import RateLimit, RateLimiter
+from BMC_API.src.infrastructure.cache.backends import InMemoryCacheBackend
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
+from BMC_API.src.infrastructure.persistence.query_log import QueryLog
+from BMC_API.src.infrastructure.rate_limit.backends import InMemoryRateLimitBackend
 
 API_PREFIX = settings.api_prefix
 
-
-def custom_rate_limit_exceeded_handler(
-    request: Request,
-    exc: RateLimitExceeded,
-) -> Response:
-    """
-    Handles rate limit exceeded exceptions by returning a custom JSON response.
-
-    This function is used as an exception handler for RateLimitExceeded exceptions that hides the details of the rate limit.
-    It returns a JSON response with a 429 status code and a message indicating that the rate limit has been exceeded.
-    Inherited from "slowapi._rate_limit_exceeded_handler"
-
-    Args:
-        request (Request): The current request object.
-        exc (RateLimitExceeded): The RateLimitExceeded exception that was raised.
-
-    Returns:
-        Response: A JSON response with a 429 status code and a message indicating that the rate limit has been exceeded.
-    """
-
-    return UJSONResponse({"error": "Rate limit exceeded."}, status_code=status.HTTP_429_TOO_MANY_REQUESTS)
+# Endpoints issuing tokens or returning account data, their responses are never stored
+AUTH_PATHS = tuple(
+    f"{API_PREFIX}/user/{endpoint}"
+    for endpoint in ("token", "refresh_token", "logout", "me", "confirm_email", "reset_password")
+)
 
 
 def get_app() -> FastAPI:
@@ -59,10 +52,43 @@ def get_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
-        default_response_class=UJSONResponse,
+        default_response_class=json_response_class(),
         lifespan=lifespan,
     )
 
+    # In-process caches, switched to redis backed ones on startup if configured
+    app.state.cache_backend = InMemoryCacheBackend()
+    app.state.repository_cache = (
+        TaggedCache(
+            InMemoryCacheBackend(max_entries=settings.repository_cache_max_entries),
+            expire=timedelta(seconds=settings.repository_cache_ttl_in_sec),
+        )
+        if settings.repository_cache_enabled
+        else None
+    )
+    # Statement log of the database engine, which is created and instrumented on startup
+    app.state.query_log = (
+        QueryLog(settings.db_query_log_size, settings.db_slow_query_threshold_in_ms)
+        if settings.db_query_log_enabled
+        else None
+    )
+    # Detector of callbacks blocking the event loop, started on startup if enabled
+    app.state.loop_watchdog = (
+        LoopWatchdog(
+            settings.event_loop_watchdog_threshold_in_ms / 1000,
+            interval=settings.event_loop_watchdog_interval_in_ms / 1000,
+            report_size=settings.event_loop_watchdog_report_size,
+        )
+        if settings.event_loop_watchdog_enabled
+        else None
+    )
+    # Sampling profiler for admins, it only runs a thread while a profile is taken
+    app.state.profiler = (
+        SamplingProfiler(settings.profiler_interval_in_ms / 1000, settings.profiler_max_duration_in_sec)
+        if settings.profiler_enabled
+        else None
+    )
+
     # 3. Register exception handlers
     register_exception_handlers(app)
 
@@ -83,29 +109,44 @@ def get_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=("Content-Disposition", "Content-Type", "X-Content-Filename"),
+        expose_headers=("Content-Disposition", "Content-Type", "X-Content-Filename", "X-Profiled-Status"),
     )
 
-    # 5. Disable caching to guarantee  serving latest version
-    app.add_middleware(NoCacheMiddleware)
+    # 5. Disable caching of authentication endpoints, other endpoints are validated with ETags
+    app.add_middleware(CacheControlMiddleware, no_store_paths=AUTH_PATHS)
 
     # 6. Add global rate limiter
     """
-    Do not forget to add request: Request to all endpoint functions.
-
-    If you want to exempt a route from the global limit,
-    put @limiter.exempt decorator between route decorator
-    and function just like this:
-
-    @app.route("/someroute")
-    @limiter.exempt
-    def t(request: Request):
-        return PlainTextResponse("I'm unlimited")
-
+    Every request takes a token from the bucket of its user, or of its client address if it is not
+    authenticated. Expensive routes take more tokens, see `rate_limit_route_costs`. The buckets are kept
+    in memory until the lifespan switches them to redis.
     """
-    limiter = Limiter(key_func=get_remote_address, default_limits=[settings.rate_limit])
-    app.state.limiter = limiter
-    app.add_exception_handler(RateLimitExceeded, custom_rate_limit_exceeded_handler)  # type: ignore
-    app.add_middleware(SlowAPIMiddleware)
+    app.state.limiter = RateLimiter(
+        RateLimit.parse(settings.rate_limit),
+        InMemoryRateLimitBackend(max_entries=settings.rate_limit_memory_max_entries),
+        route_costs=settings.rate_limit_route_costs,
+        enabled=settings.rate_limit_enabled,
+    )
+    app.add_middleware(RateLimitMiddleware)
+
+    # 7. Profile requests carrying a profile token in the X-Profile header. Added after the rate limiter, so it
+    #    wraps it: profiles include the rate limiter, and profiled requests still take tokens of their bucket
+    if settings.profiler_enabled:
+        app.add_middleware(ProfilingMiddleware)
+
+    # 8. Compress responses, after the other middleware so every response passes through it
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            content_types=tuple(settings.compression_content_types),
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality,
+            brotli_enabled=settings.compression_brotli_enabled,
+        )
+
+    # 9. Record request metrics, outermost so the durations include all middleware
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
 
     return app
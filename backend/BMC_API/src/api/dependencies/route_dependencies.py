@@ -5,39 +5,63 @@ from fastapi import Depends
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from BMC_API.src.domain.interfaces.cache_backend import CacheBackend
 from BMC_API.src.domain.interfaces.token_cache import TokenCache
-from BMC_API.src.infrastructure.persistence.dependencies import get_db_session
+from BMC_API.src.infrastructure.cache.dependency import get_repository_cache
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
+from BMC_API.src.infrastructure.persistence.dao.cached_dao import CacheInvalidatingDAOMixin, CachedDAOMixin
+from BMC_API.src.infrastructure.persistence.dependencies import get_db_session, get_read_db_session
 
 # Define type variables for repository and service.
 RepoT = TypeVar("RepoT")
 ServiceT = TypeVar("ServiceT")
 
 
-def get_repository(repository_class: Type[RepoT]) -> Callable[..., RepoT]:
+def get_repository(repository_class: Type[RepoT], read_only: bool = False) -> Callable[..., RepoT]:
     """
     Generic dependency that creates a repository instance given a repository class.
     Assumes that the repository class accepts an AsyncSession in its constructor.
+    Repositories using CachedDAOMixin or CacheInvalidatingDAOMixin also get the repository cache of the application.
+    Read-only repositories get a session of the read engine, use them only in endpoints that do not write.
     """
+    session_dependency = get_read_db_session if read_only else get_db_session
 
-    def dependency(session: Annotated[AsyncSession, Depends(get_db_session)]) -> RepoT:
+    if issubclass(repository_class, (CachedDAOMixin, CacheInvalidatingDAOMixin)):
+
+        def cached_dependency(
+            session: Annotated[AsyncSession, Depends(session_dependency)],
+            cache: Annotated[Optional[TaggedCache], Depends(get_repository_cache)],
+        ) -> RepoT:
+            return repository_class(session, cache=cache)
+
+        return cached_dependency
+
+    def dependency(session: Annotated[AsyncSession, Depends(session_dependency)]) -> RepoT:
         return repository_class(session)
 
     return dependency
 
 
+def _no_cache_backend() -> None:
+    return None
+
+
 def get_service(
     service_class: Type[ServiceT],
     repository_dependency: Callable[..., RepoT],
     dto_class: Optional[Type] = None,
     token_cache: Optional[TokenCache] = None,
+    cache_dependency: Optional[Callable[..., CacheBackend]] = None,
 ) -> Callable[..., ServiceT]:
     """
     Generic dependency that creates a service instance given a service class and a repository dependency.
     Assumes that the service class accepts the repository instance in its constructor.
+    If a cache dependency is given, the resolved backend is passed to the service as `cache_backend`.
     """
 
     def dependency(
         repository: Annotated[RepoT, Depends(repository_dependency)],
+        cache_backend: Annotated[Optional[CacheBackend], Depends(cache_dependency or _no_cache_backend)],
     ) -> ServiceT:
         kwargs = {"repository": repository}
         if dto_class is not None:
@@ -46,6 +70,8 @@ def get_service(
             kwargs["dto_class"] = dto_class
         if token_cache is not None:
             kwargs["token_cache"] = token_cache
+        if cache_backend is not None:
+            kwargs["cache_backend"] = cache_backend
 
         return service_class(**kwargs)
 
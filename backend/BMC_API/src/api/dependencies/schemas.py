@@ -1,6 +1,9 @@
 from typing import Any, Dict, Generic, List, TypeVar
 
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
+
+from BMC_API.src.api.responses import PayloadJSONResponse
 
 T = TypeVar("T")
 
@@ -19,6 +22,7 @@ class SearchRequest(BaseModel):
                 "field__contains": "some text",
                 "field__like": "some text",
                 "field__ilike": "some text",
+                "challenge_search__search": "some text",
                 "field__lt": "2022-01-01T00:00:00Z",
                 "field__between": [
                     "2021-01-01T00:00:00Z",
@@ -47,7 +51,8 @@ class SearchRequestChallenge(SearchRequest):
 
     output_filters_task: List[str] | None = Field(
         default=None,
-        title="Dictionary containing column names as keys and values to filter on task object (optional).",
+        title="List of task column names to include in the tasks of each challenge (optional).",
+        examples=[["id", "task_name"]],
     )
 
 
@@ -60,6 +65,21 @@ class PaginationResponse(BaseModel, Generic[T]):
     content: List[T] | None = None
 
 
+def pagination_json_response(
+    content: List[Any] | None,
+    total_pages: int | None,
+    total_records: int | None,
+    exclude_none: bool = False,
+) -> PayloadJSONResponse:
+    """
+    JSON response of a page whose content is already validated, e.g. the DTOs of `BaseService.list`.
+    The page is serialized in one pass, instead of being dumped and validated again against the response model.
+    Routes keep their `response_model` for the documentation.
+    """
+    page = PaginationResponse.model_construct(total_pages=total_pages, total_records=total_records, content=content)
+    return PayloadJSONResponse(to_json(page, exclude_none=exclude_none))
+
+
 class BulkOperationResponse(BaseModel, Generic[T]):
     """
     Generic response model for bulk operations.
@@ -10,6 +10,7 @@ from BMC_API.src.core.exceptions import (
     InvalidTokenException,
     NotFoundException,
     RepositoryException,
+    SearchUnavailableException,
     UserAlreadyExistsException,
     UserNotAuthenticatedException,
     UserNotAuthorizedException,
@@ -74,6 +75,10 @@ def register_exception_handlers(app):
             headers=auth_header,
         )
 
+    @app.exception_handler(SearchUnavailableException)
+    async def search_unavailable_exception_handler(request: Request, exc: SearchUnavailableException):
+        return JSONResponse(status_code=status.HTTP_409_CONFLICT, content={"detail": str(exc)})
+
     @app.exception_handler(ConferenceLockedException)
     async def conference_locked_exception_handler(request: Request, exc: ConferenceLockedException):
         return JSONResponse(
@@ -1,6 +1,9 @@
+import os
+from pathlib import Path
 from typing import Any
 
 from gunicorn.app.base import BaseApplication
+from gunicorn.arbiter import Arbiter
 from gunicorn.util import import_app
 from uvicorn.workers import UvicornWorker as BaseUvicornWorker
 
@@ -28,6 +31,32 @@ class UvicornWorker(BaseUvicornWorker):
     }
 
 
+def setup_multiprocess_metrics(directory: str) -> None:
+    """
+    Enable the multiprocess mode of prometheus_client, the workers write their metrics to files in
+    PROMETHEUS_MULTIPROC_DIR, `directory` unless it is set, and every worker serves the metrics of all.
+    It has to be called before prometheus_client is imported. Files of previous runs are removed.
+
+    :param directory: directory shared by the workers.
+    """
+    path = Path(os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", directory))
+    path.mkdir(parents=True, exist_ok=True)
+    for file in path.glob("*.db"):
+        file.unlink()
+    # Imported now, `child_exit` runs in a signal handler of the main process where imports can deadlock
+    import prometheus_client.multiprocess  # noqa: F401, WPS433 (Found nested import)
+
+
+def child_exit(server: Arbiter, worker: BaseUvicornWorker) -> None:
+    """
+    Gunicorn hook in the main process, removes the live gauges of an exited worker, e.g. its requests in
+    flight, from the aggregated metrics.
+    """
+    from prometheus_client import multiprocess  # noqa: WPS433 (Found nested import)
+
+    multiprocess.mark_process_dead(worker.pid)
+
+
 class GunicornApplication(BaseApplication):
     """
     Custom gunicorn application.
@@ -0,0 +1,32 @@
+# backend/BMC_API/src/api/middleware/cache_control_middleware.py
+from typing import Iterable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from BMC_API.src.api.middleware.headers import send_with_headers
+
+NO_STORE_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, proxy-revalidate, max-age=0",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+
+class CacheControlMiddleware:
+    """
+    Forbid storing responses of authentication endpoints, e.g. issued tokens. Other responses are
+    validated with ETags by their routes, which set their own Cache-Control.
+    """
+
+    def __init__(self, app: ASGIApp, no_store_paths: Iterable[str] = ()) -> None:
+        """
+        :param app: wrapped application.
+        :param no_store_paths: path prefixes of the endpoints whose responses must not be stored.
+        """
+        self.app = app
+        self.no_store_paths = tuple(no_store_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.no_store_paths):
+            send = send_with_headers(send, lambda headers: headers.update(NO_STORE_HEADERS))
+        await self.app(scope, receive, send)
@@ -0,0 +1,186 @@
+# backend/BMC_API/src/api/middleware/compression_middleware.py
+import gzip
+import zlib
+from typing import Iterable, List, Optional, Tuple
+
+from loguru import logger
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # Optional dependency, responses are only compressed with gzip without it
+except ImportError:  # pragma: no cover
+    brotli = None
+
+# Responses without a body or with a part of one
+_SKIPPED_STATUS_CODES = (204, 206, 304)
+
+
+def accepted_encodings(accept_encoding: str) -> dict:
+    """Content codings of an Accept-Encoding header and their quality values."""
+    encodings = {}
+    for item in accept_encoding.split(","):
+        coding, _, parameters = item.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = parameters.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        encodings[coding.strip().lower()] = quality
+    return encodings
+
+
+def choose_encoding(accept_encoding: str, encodings: Iterable[str]) -> Optional[str]:
+    """
+    Available encoding with the highest quality value of the client, ties are broken by the order of `encodings`.
+    None if the client accepts none of them, or prefers an explicitly listed identity coding.
+    """
+    accepted = accepted_encodings(accept_encoding)
+    chosen, chosen_quality = None, 0.0
+    for encoding in encodings:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > chosen_quality:
+            chosen, chosen_quality = encoding, quality
+    if chosen_quality < accepted.get("identity", 0.0):
+        return None
+    return chosen
+
+
+class _Compressor:
+    """Streaming gzip or brotli compressor, every chunk is flushed so streamed responses are not held back."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self.encoding = encoding
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == "br":
+            chunk = self._compressor.process(data)
+            return chunk + (self._compressor.finish() if final else self._compressor.flush())
+        chunk = self._compressor.compress(data)
+        return chunk + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+def compress(data: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    """Compress a complete body."""
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip, whichever the client prefers of the available ones.
+    Only bodies of the allowed content types and at least `minimum_size` bytes are compressed,
+    so PDF and ZIP downloads, which are already compressed, are sent as they are.
+    Streamed responses are compressed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Tuple[str, ...] = ("application/json", "text/"),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        brotli_enabled: bool = True,
+    ) -> None:
+        """
+        :param app: wrapped application.
+        :param minimum_size: smallest body in bytes that is compressed.
+        :param content_types: media types to compress, entries ending with "/" match all subtypes.
+        :param gzip_level: gzip compression level, 1 to 9.
+        :param brotli_quality: brotli quality, 0 to 11. Low values compress about as well as gzip, but faster.
+        :param brotli_enabled: whether brotli is offered, it needs the brotli package.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = tuple(content_types)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings: List[str] = ["gzip"]
+        if brotli_enabled:
+            if brotli is not None:
+                self.encodings.insert(0, "br")
+            else:
+                logger.warning("brotli is not installed, responses are compressed with gzip only.")
+
+    def is_compressible(self, content_type: str) -> bool:
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        return any(
+            media_type.startswith(allowed) if allowed.endswith("/") else media_type == allowed
+            for allowed in self.content_types
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk tells whether the body is compressed
+                start_message = message
+                headers = Headers(raw=message["headers"])
+                passthrough = (
+                    message["status"] in _SKIPPED_STATUS_CODES
+                    or "content-encoding" in headers
+                    or not self.is_compressible(headers.get("content-type", ""))
+                )
+                if passthrough:
+                    await send(message)
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                # Strong ETags of the uncompressed body do not match the compressed one byte for byte
+                if headers.get("ETag", "").startswith('"'):
+                    headers["ETag"] = "W/" + headers["ETag"]
+                if more_body:
+                    del headers["Content-Length"]
+                    compressed = compressor.compress(body, final=False)
+                else:
+                    compressed = compress(body, encoding, self.gzip_level, self.brotli_quality)
+                    headers["Content-Length"] = str(len(compressed))
+                await send(start_message)
+                await send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+                return
+
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": compressor.compress(body, final=not more_body),
+                    "more_body": more_body,
+                }
+            )
+
+        await self.app(scope, receive, send_compressed)
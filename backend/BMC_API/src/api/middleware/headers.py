@@ -0,0 +1,23 @@
+# backend/BMC_API/src/api/middleware/headers.py
+from typing import Callable
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message, Send
+
+
+def send_with_headers(send: Send, inject: Callable[[MutableHeaders], None]) -> Send:
+    """
+    Wrap the ASGI send callable of a request so `inject` can add or change headers of the response.
+    Only the start message is touched, body messages, e.g. chunks of streamed downloads, pass as they are.
+
+    :param send: send callable of the request.
+    :param inject: called with the mutable headers of the response start message.
+    :return: send callable to pass to the wrapped application.
+    """
+
+    async def wrapped_send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            inject(MutableHeaders(scope=message))
+        await send(message)
+
+    return wrapped_send
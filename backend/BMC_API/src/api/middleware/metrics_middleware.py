@@ -0,0 +1,48 @@
+# backend/BMC_API/src/api/middleware/metrics_middleware.py
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from BMC_API.src.core.metrics import QueryStats, metrics, request_query_stats
+
+# Label of requests no route matched, so scanners probing random paths do not create new series
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Record the duration, in-flight count and database statements of every HTTP request.
+    Requests are labelled with the path template of their route, e.g. /api/v2/challenge/{id}.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        query_stats = QueryStats()
+        token = request_query_stats.set(query_stats)
+        metrics.http_requests_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            metrics.http_requests_in_flight.dec()
+            request_query_stats.reset(token)
+            # The router stores the matched route in the scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            metrics.http_request_duration.labels(scope["method"], route, status_code).observe(duration)
+            metrics.db_queries_per_request.labels(route).observe(query_stats.count)
+            metrics.db_query_duration_per_request.labels(route).observe(query_stats.duration)
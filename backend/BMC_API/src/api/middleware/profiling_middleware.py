@@ -0,0 +1,84 @@
+# backend/BMC_API/src/api/middleware/profiling_middleware.py
+import asyncio
+from typing import get_args
+
+from fastapi import status
+from fastapi.responses import UJSONResponse
+from jose import JWTError, jwt
+from loguru import logger
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.core.profiler import ProfileFormat, ProfilerBusyError, SamplingProfiler
+
+PROFILE_HEADER = "x-profile"
+PROFILE_FORMAT_HEADER = "x-profile-format"
+
+
+def profile_token_subject(token: str) -> str | None:
+    """Admin that issued a profile token, None if the token is invalid, expired or not a profile token."""
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+    return payload.get("sub") if payload.get("type") == "profile" else None
+
+
+class ProfilingMiddleware:
+    """
+    Profile single requests carrying a profile token, issued to admins by `POST /admin/monitoring/profile/token`,
+    in the X-Profile header. The request is handled as usual, but its response is replaced by the profile
+    of its task, in the format of the X-Profile-Format header. The status of the handled response is kept
+    in the X-Profiled-Status header. Requests without the header pass untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or PROFILE_HEADER.encode() not in (name for name, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        profiler: SamplingProfiler | None = scope["app"].state.profiler
+        admin = profile_token_subject(headers[PROFILE_HEADER])
+        if profiler is None or admin is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_format: ProfileFormat = headers.get(PROFILE_FORMAT_HEADER, "speedscope")
+        if profile_format not in get_args(ProfileFormat):
+            profile_format = "speedscope"
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def discard_response(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        name = f"{scope['method']} {scope['path']}"
+        logger.info(f"Profiling {name} for {admin}")
+        try:
+            with profiler.session(name, task=asyncio.current_task()) as profile:
+                try:
+                    await self.app(scope, receive, discard_response)
+                except Exception:
+                    logger.exception(f"Profiled request {name} failed")
+        except ProfilerBusyError as exc:
+            response = UJSONResponse({"error": str(exc)}, status_code=status.HTTP_409_CONFLICT)
+            await response(scope, receive, send)
+            return
+
+        content, media_type, file_name = profile.render(profile_format)
+        response = Response(
+            content,
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="{file_name}"',
+                "X-Profiled-Status": str(status_code),
+            },
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,82 @@
+# backend/BMC_API/src/api/middleware/rate_limit_middleware.py
+from typing import Callable, Iterable
+
+from fastapi import status
+from fastapi.responses import UJSONResponse
+from jose import JWTError, jwt
+from starlette.datastructures import Headers
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from BMC_API.src.api.middleware.headers import send_with_headers
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.core.rate_limit import RateLimiter
+
+
+def rate_limit_key(scope: Scope) -> str:
+    """
+    Bucket of a request: the user of a valid bearer token, so users behind a shared address
+    do not exhaust each other's limit, otherwise the client address.
+    """
+    scheme, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            subject = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]).get("sub")
+        except JWTError:
+            subject = None
+        if subject:
+            return f"user:{subject}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else '127.0.0.1'}"
+
+
+def route_name(routes: Iterable[BaseRoute], scope: Scope) -> str | None:
+    """Name of the route handling the request, the middleware runs before routing."""
+    for route in routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "name", None)
+    return None
+
+
+class RateLimitMiddleware:
+    """
+    Apply the `RateLimiter` of `app.state.limiter` to every request. Responses carry X-RateLimit-* headers,
+    rejected requests get 429 Too Many Requests with a Retry-After header.
+
+    It wraps the send callable instead of running the request in a separate task like `BaseHTTPMiddleware`,
+    so streamed responses pass as they are.
+    """
+
+    def __init__(self, app: ASGIApp, key_func: Callable[[Scope], str] = rate_limit_key) -> None:
+        """
+        :param app: wrapped application.
+        :param key_func: bucket of a request.
+        """
+        self.app = app
+        self.key_func = key_func
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        application = scope["app"]
+        limiter: RateLimiter = application.state.limiter
+        cost = limiter.cost(route_name(application.routes, scope)) if limiter.route_costs else 1
+        if not limiter.enabled or cost <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        result = await limiter.acquire(self.key_func(scope), cost)
+        headers = result.headers()
+        if not result.allowed:
+            response = UJSONResponse(
+                {"error": "Rate limit exceeded."}, status_code=status.HTTP_429_TOO_MANY_REQUESTS, headers=headers
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(
+            scope, receive, send_with_headers(send, lambda response_headers: response_headers.update(headers))
+        )
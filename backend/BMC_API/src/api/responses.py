@@ -0,0 +1,96 @@
+# backend/BMC_API/src/api/responses.py
+from typing import Any, Mapping, Type
+
+import ujson
+from fastapi import Response, status
+from fastapi.responses import FileResponse, JSONResponse
+from loguru import logger
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.core.etag import entity_etag, etag_matches
+
+# Responses validated with an ETag may be stored by the browser, but are revalidated before every use
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+# Headers a 304 response repeats from the full response (RFC 9110, 15.4.5)
+_NOT_MODIFIED_HEADERS = ("cache-control", "content-location", "date", "etag", "expires", "vary")
+
+try:
+    import orjson  # Responses are encoded with ujson in environments installed without it
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class PayloadJSONResponse(JSONResponse):
+    """
+    JSON response that takes pre-encoded payloads: bytes, e.g. cached listings, are sent as they are
+    and pydantic models are encoded by their own serializer, without a detour through dictionaries.
+    Other content is encoded with ujson, like `UJSONResponse`.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            return to_json(content)
+        return self.dumps(content)
+
+    @staticmethod
+    def dumps(content: Any) -> bytes:
+        return ujson.dumps(content, ensure_ascii=False).encode("utf-8")
+
+
+class ORJSONPayloadResponse(PayloadJSONResponse):
+    """`PayloadJSONResponse` encoding other content with orjson."""
+
+    @staticmethod
+    def dumps(content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def json_response_class() -> Type[PayloadJSONResponse]:
+    """
+    Default response class of the application, see `settings.json_response_backend`.
+    Falls back to ujson if orjson is configured but not installed.
+    """
+    if settings.json_response_backend == "orjson":
+        if orjson is not None:
+            return ORJSONPayloadResponse
+        logger.warning("orjson is not installed, responses are encoded with ujson instead.")
+    return PayloadJSONResponse
+
+
+def not_modified_response(headers: Mapping[str, str]) -> Response:
+    """304 Not Modified response with the validator and caching headers of the full response."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={name: value for name, value in headers.items() if name.lower() in _NOT_MODIFIED_HEADERS},
+    )
+
+
+def conditional_entity_response(entity: Any, if_none_match: str | None) -> Response:
+    """
+    Response of a get endpoint validated with the weak ETag of the entity, see `entity_etag`.
+    Clients sending a matching If-None-Match header get 304 Not Modified without a body. The entity is
+    serialized once, for both the ETag and the body.
+    """
+    body = to_json(entity)
+    headers = {"ETag": entity_etag(body), "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if etag_matches(if_none_match, headers["ETag"]):
+        return not_modified_response(headers)
+    return PayloadJSONResponse(body, headers=headers)
+
+
+def conditional_file_response(response: FileResponse, if_none_match: str | None) -> Response:
+    """
+    File response validated with the strong ETag Starlette derives from the size and modification time
+    of the file. Clients sending a matching If-None-Match header get 304 Not Modified, the file is not read.
+    """
+    response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+    if "etag" in response.headers and etag_matches(if_none_match, response.headers["etag"]):
+        return not_modified_response(response.headers)
+    return response
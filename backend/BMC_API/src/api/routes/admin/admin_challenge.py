@@ -4,23 +4,28 @@
 from datetime import datetime
 from typing import Annotated, Any, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, Path, Query, status
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, Header, Path, Query, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from loguru import logger
 
 # from BMC_API.src.api.dependencies.route_dependencies import get_repository, get_service
 from BMC_API.src.api.dependencies.schemas import (
     BulkOperationResponse,
     PaginationResponse,
-    SearchRequest,
+    SearchRequestChallenge,
+    pagination_json_response,
 )
+from BMC_API.src.api.responses import conditional_entity_response, conditional_file_response
 from BMC_API.src.api.schemas.user_schema import UserInDB
-from BMC_API.src.application.dependencies import get_challenge_service_admin
+from BMC_API.src.application.dependencies import (
+    get_challenge_read_service_admin,
+    get_challenge_service_admin,
+)
 from BMC_API.src.application.dto.challenge_dto import (
-    ChallengeHistoryModelDTO,
     ChallengeInputAdminDTO,
     ChallengeModelStatusUpdateDTO,
     ChallengeResponseAdminDTO,
+    ChallengeSearchResultDTO,
     ChallengeUpdateAdminDTO,
 )
 from BMC_API.src.application.interfaces.authentication import (
@@ -41,9 +46,10 @@ router = APIRouter(
 @router.get("/{id:int}", response_model=ChallengeResponseAdminDTO)
 async def get_challenge_route_admin(
     id: Annotated[int, Path(title="The ID of the item to get", ge=1)],
-    service: Annotated[ChallengeService, Depends(get_challenge_service_admin)],
+    service: Annotated[ChallengeService, Depends(get_challenge_read_service_admin)],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
-) -> Optional[ChallengeResponseAdminDTO]:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     Retrieve a challenge by its ID.
 
@@ -58,23 +64,52 @@ async def get_challenge_route_admin(
     **Returns:**
 
     * `Optional[ChallengeResponseAdminDTO]`: The challenge details if found; otherwise, None.
+      Validated with an ETag, a matching If-None-Match header is answered with 304 Not Modified.
     """
     logger.info(f"Received admin request to get challenge with id {id} by {current_active_user.email}")
     entity = await service.get(id=id)
     logger.info(f"Challenge with id {id} retrieved successfully by {current_active_user.email}.")
-    return entity
+    return conditional_entity_response(entity, if_none_match)
+
+
+@router.get("/search", response_model=List[ChallengeSearchResultDTO])
+async def search_challenges_route_admin(
+    q: Annotated[str, Query(min_length=1, max_length=500, description="Search terms")],
+    service: Annotated[ChallengeService, Depends(get_challenge_read_service_admin)],
+    current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
+    limit: Annotated[int, Query(ge=1, le=200)] = 20,
+) -> List[ChallengeSearchResultDTO]:
+    """
+    Full-text search over challenges and their tasks.
+
+    All terms have to appear, as word prefixes, in the indexed text of a challenge or of one of its tasks,
+    e.g. names, keywords, abstracts and data or metric descriptions. Only available for SQLite databases,
+    other databases get a 409 response.
+
+    **Parameters:**
+
+    * `q (str)`: Search terms.
+    * `limit (int)`: Maximum number of challenges, 20 by default.
+
+    **Returns:**
+
+    * `List[ChallengeSearchResultDTO]`: Matching challenges, most relevant first, with text snippets
+      of the matches.
+    """
+    logger.info(f"Received admin request to search challenges by {current_active_user.email}")
+    return await service.search(q, limit)
 
 
 @router.post("/all", response_model=PaginationResponse, response_model_exclude_none=True)
 async def list_challenges_route_admin(
-    service: Annotated[ChallengeService, Depends(get_challenge_service_admin)],
+    service: Annotated[ChallengeService, Depends(get_challenge_read_service_admin)],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
     limit: int | None = None,
     offset: int | None = None,
-    search_request: SearchRequest | None = None,
+    search_request: SearchRequestChallenge | None = None,
     sort_by: str | None = "id",
     sort_desc: bool | None = False,
-) -> PaginationResponse[Optional[ChallengeResponseAdminDTO]]:
+) -> Response:
     """
     Retrieve a paginated list of challenges for admin users.
 
@@ -89,10 +124,13 @@ async def list_challenges_route_admin(
 
     * `offset (Optional[int])`: The starting index for the records to return. Defaults to None.
 
-    * `search_request (Optional[SearchRequest])`: An object that may contain:
+    * `search_request (Optional[SearchRequestChallenge])`: An object that may contain:
         * `search_filters`: Conditions for filtering the challenge records.
 
         * `output_filters`: Fields to include in the response.
+
+        * `output_filters_task`: Fields of the tasks to include in "challenge_tasks". Only these task columns
+          are loaded, without `output_filters` all challenge fields are returned next to them.
     * `sort_by (Optional[str])`: The field name to sort the results by (default is "id").
 
     * `sort_desc (Optional[bool])`: Determines if sorting should be in descending order (default is False).
@@ -110,6 +148,11 @@ async def list_challenges_route_admin(
     logger.info(f"Received admin request to get multiple entities by {current_active_user.email}")
     search_filters = search_request.search_filters if search_request and search_request.search_filters else None
     output_filters = search_request.output_filters if search_request and search_request.output_filters else None
+    nested_output_filters = (
+        {"challenge_tasks": search_request.output_filters_task}
+        if search_request and search_request.output_filters_task
+        else None
+    )
 
     entities, total_pages, total_records = await service.list(
         limit=limit,
@@ -118,12 +161,9 @@ async def list_challenges_route_admin(
         output_filters=output_filters,
         sort_by=sort_by,
         sort_desc=sort_desc,
+        nested_output_filters=nested_output_filters,
     )
-    return PaginationResponse(
-        total_pages=total_pages,
-        total_records=total_records,
-        content=entities,
-    )
+    return pagination_json_response(entities, total_pages, total_records, exclude_none=True)
 
 
 @router.post("/create", response_model=ChallengeResponseAdminDTO, status_code=status.HTTP_201_CREATED)
@@ -336,11 +376,12 @@ async def download_challenge_document_route_admin(
     id: Annotated[int, Path(title="The ID of the item to download", ge=1)],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
     service: Annotated[ChallengeService, Depends(get_challenge_service_admin)],
-) -> FileResponse:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     logger.info(f"Received admin request to download challenge with id {id} by {current_active_user.email}")
     file = await service.download_challenge(id=id)
     logger.info(f"Challenge with id {id} retrieved successfully by {current_active_user.email}.")
-    return file
+    return conditional_file_response(file, if_none_match)
 
 
 @router.post(
@@ -470,17 +511,13 @@ async def bulk_prune_challenges_route_admin(
 async def get_challenge_history_admin(
     id: int,
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
-    service: Annotated[ChallengeService, Depends(get_challenge_service_admin)],
-) -> PaginationResponse[Optional[List[ChallengeHistoryModelDTO]]]:
+    service: Annotated[ChallengeService, Depends(get_challenge_read_service_admin)],
+) -> Response:
     logger.info(f"Received admin request to get histories of challenge with id {id} by {current_active_user.email}")
 
     entities, total_pages, total_records = await service.challenge_histories(id=id)
     logger.info("Challenge histories fetched successfully.")
-    return PaginationResponse(
-        total_pages=total_pages,
-        total_records=total_records,
-        content=entities,
-    )
+    return pagination_json_response(entities, total_pages, total_records)
 
 
 @router.delete(
@@ -4,7 +4,7 @@
 from datetime import datetime
 from typing import Annotated, Any, Dict, List, Optional
 
-from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Header, Path, Response, status
 from loguru import logger
 
 from BMC_API.src.api.dependencies.route_dependencies import get_repository, get_service
@@ -12,9 +12,11 @@ from BMC_API.src.api.dependencies.schemas import (
     BulkOperationResponse,
     PaginationResponse,
     SearchRequest,
+    pagination_json_response,
 )
 
 # from pydantic import EmailStr
+from BMC_API.src.api.responses import conditional_entity_response
 from BMC_API.src.api.schemas.user_schema import UserInDB
 from BMC_API.src.application.dto.conference_dto import (
     ConferenceCreateAdminDTO,
@@ -30,6 +32,7 @@ from BMC_API.src.application.use_cases.conference_use_cases import ConferenceSer
 
 # from BMC_API.src.application.use_cases.user_use_cases import UserService
 from BMC_API.src.domain.value_objects.enums.user_enums import Roles
+from BMC_API.src.infrastructure.cache.dependency import get_cache_backend
 from BMC_API.src.infrastructure.persistence.dao.conference_dao import (
     SQLAlchemyConferenceRepository,
 )
@@ -41,16 +44,29 @@ router = APIRouter(
 
 # Dependency functions
 repository_dependency = get_repository(SQLAlchemyConferenceRepository)
-service_dependency = get_service(ConferenceService, repository_dependency, dto_class=ConferenceResponseAdminDTO)
+service_dependency = get_service(
+    ConferenceService,
+    repository_dependency,
+    dto_class=ConferenceResponseAdminDTO,
+    cache_dependency=get_cache_backend,
+)
+read_repository_dependency = get_repository(SQLAlchemyConferenceRepository, read_only=True)
+read_service_dependency = get_service(
+    ConferenceService,
+    read_repository_dependency,
+    dto_class=ConferenceResponseAdminDTO,
+    cache_dependency=get_cache_backend,
+)
 
 
 # Admin routes for conference management
 @router.get("/{id:int}", response_model=Optional[ConferenceResponseAdminDTO])
 async def get_conference_route_admin(
     id: Annotated[int, Path(title="The ID of the item to get", ge=1)],
-    service: Annotated[ConferenceService, Depends(service_dependency)],
+    service: Annotated[ConferenceService, Depends(read_service_dependency)],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
-) -> Optional[ConferenceResponseAdminDTO]:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     Retrieve a conference by its ID.
 
@@ -65,23 +81,24 @@ async def get_conference_route_admin(
     **Returns:**
 
     * `Optional[ConferenceResponseAdminDTO]`: The conference details if found; otherwise, None.
+      Validated with an ETag, a matching If-None-Match header is answered with 304 Not Modified.
     """
     logger.info(f"Received admin request to get conference with id {id} by {current_active_user.email}")
     entity: ConferenceResponseAdminDTO = await service.get(id=id)
     logger.info(f"Conference with id {id} retrieved  by {current_active_user.email}")
-    return entity
+    return conditional_entity_response(entity, if_none_match)
 
 
 @router.post("/all", response_model=PaginationResponse, response_model_exclude_none=True)
 async def list_conferences_route_admin(
-    service: Annotated[ConferenceService, Depends(service_dependency)],
+    service: Annotated[ConferenceService, Depends(read_service_dependency)],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
     limit: int | None = None,
     offset: int | None = None,
     search_request: SearchRequest | None = None,
     sort_by: str | None = "id",
     sort_desc: bool | None = False,
-) -> PaginationResponse:
+) -> Response:
     """
     Retrieve a paginated list of conferences for admin users.
 
@@ -126,11 +143,7 @@ async def list_conferences_route_admin(
         sort_by=sort_by,
         sort_desc=sort_desc,
     )
-    return PaginationResponse(
-        total_pages=total_pages,
-        total_records=total_records,
-        content=entities,
-    )
+    return pagination_json_response(entities, total_pages, total_records, exclude_none=True)
 
 
 @router.post(
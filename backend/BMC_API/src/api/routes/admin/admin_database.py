@@ -1,13 +1,25 @@
 # backend/BMC_API/src/api/routes/admin.py
 # Exceptions raised the routes here will be caught by the global exception handlers.
 
+import asyncio
 import os
-from typing import Annotated
+import uuid
+from typing import Annotated, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from fastapi.responses import FileResponse, JSONResponse
 from loguru import logger
+from starlette.background import BackgroundTask
 
+from BMC_API.src.api.schemas.cache_schema import RepositoryCacheStatsDTO
+from BMC_API.src.api.schemas.database_schema import (
+    DatabaseSnapshotDTO,
+    JobRunDTO,
+    JobsReportDTO,
+    JobSummaryDTO,
+    SlowQueriesReportDTO,
+    SlowQueryDTO,
+)
 from BMC_API.src.api.schemas.user_schema import UserInDB
 from BMC_API.src.application.interfaces.authentication import (
     validate_active_user_password_dependency,
@@ -15,11 +27,26 @@ from BMC_API.src.application.interfaces.authentication import (
 from BMC_API.src.application.interfaces.authorization import RoleChecker
 
 # from BMC_API.src.application.use_cases.user_use_cases import UserService
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.core.jobs import job_history, job_leader
 from BMC_API.src.domain.value_objects.enums.user_enums import Roles
+from BMC_API.src.infrastructure.cache.dependency import get_repository_cache
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
+from BMC_API.src.infrastructure.persistence.backup import (
+    BACKUP_EXTENSION,
+    backup_extension,
+)
 from BMC_API.src.infrastructure.persistence.dependencies import (
     backup_database,
     delete_db_backups,
+    get_query_log,
+    snapshot_database,
 )
+from BMC_API.src.infrastructure.persistence.incremental_backup import (
+    list_snapshots,
+    restore_snapshot,
+)
+from BMC_API.src.infrastructure.persistence.query_log import QueryLog
 
 router = APIRouter(
     dependencies=[Depends(RoleChecker([Roles.ADMIN]))]
@@ -33,10 +60,10 @@ async def database_backup_and_download(file_name: str | None = None) -> FileResp
         os.stat(backup_file_location)
         if not file_name:
             file_name = os.path.basename(backup_file_location)
-        elif not file_name.endswith(".sqlite3"):
-            file_name = f"{file_name}.sqlite3"
         else:
-            file_name = f"{file_name}"
+            # Keep the extension of the created file, e.g. .sqlite3.gz for compressed backups
+            extension = backup_extension(backup_file_location) or BACKUP_EXTENSION
+            file_name = f"{file_name.removesuffix(backup_extension(file_name))}{extension}"
 
         return FileResponse(
             path=backup_file_location,
@@ -87,3 +114,119 @@ async def delete_database_backups(
         status_code=200,
         content={"message": message, "deleted_files": deleted_files},
     )
+
+
+@router.get("/snapshots", response_model=List[DatabaseSnapshotDTO])
+async def list_database_snapshots() -> List[DatabaseSnapshotDTO]:
+    """
+    List incremental snapshots of the database, oldest first.
+    """
+    manifests = await asyncio.to_thread(list_snapshots, str(settings.backup_folder))
+    return [DatabaseSnapshotDTO.from_manifest(manifest) for manifest in manifests]
+
+
+@router.post("/snapshots", response_model=DatabaseSnapshotDTO)
+async def create_database_snapshot() -> DatabaseSnapshotDTO:
+    """
+    Create an incremental snapshot of the database now. Only chunks changed since earlier snapshots are written.
+    Snapshots are only available for SQLite databases.
+    """
+    if settings.db_backend != "sqlite":
+        raise HTTPException(status_code=409, detail="Snapshots are only available for SQLite databases.")
+    try:
+        manifest = await snapshot_database()
+    except Exception as e:
+        logger.error(str(e))
+        raise HTTPException(status_code=503, detail="Something went wrong. Please contact the admins")
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="Database file not found. Please contact the admins")
+    return DatabaseSnapshotDTO.from_manifest(manifest)
+
+
+@router.get("/snapshots/{snapshot_id}/download")
+async def restore_and_download_database_snapshot(
+    snapshot_id: Annotated[str, Path(pattern=r"^[\w-]+$")],
+) -> FileResponse:
+    """
+    Restore a snapshot into a database file and download it. The live database is not touched.
+    """
+    backup_folder = str(settings.backup_folder)
+    target = os.path.join(backup_folder, f".restore_{uuid.uuid4().hex}.sqlite3")
+    try:
+        await asyncio.to_thread(restore_snapshot, backup_folder, snapshot_id, target)
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        raise HTTPException(status_code=404, detail="Snapshot not found.")
+    except Exception as e:
+        logger.error(str(e))
+        raise HTTPException(status_code=503, detail="Something went wrong. Please contact the admins")
+
+    return FileResponse(
+        path=target,
+        media_type="application/octet-stream",
+        filename=f"{snapshot_id}.sqlite3",
+        background=BackgroundTask(os.remove, target),
+    )
+
+
+@router.get("/jobs", response_model=JobsReportDTO)
+async def periodic_jobs_report(limit: Annotated[int, Query(ge=1, le=1000)] = 50) -> JobsReportDTO:
+    """
+    Get the leader worker of the periodic backup and cleanup jobs, duration statistics per job
+    and the most recent runs.
+    """
+    runs = [JobRunDTO(**run) for run in await asyncio.to_thread(job_history.read)]
+    summary = []
+    for job in sorted({run.job for run in runs}):
+        job_runs = [run for run in runs if run.job == job]
+        durations = [run.duration_ms for run in job_runs]
+        summary.append(
+            JobSummaryDTO(
+                job=job,
+                runs=len(job_runs),
+                failures=sum(run.status == "failed" for run in job_runs),
+                avg_duration_ms=round(sum(durations) / len(durations), 2),
+                max_duration_ms=max(durations),
+                last_run=job_runs[-1],
+            )
+        )
+    return JobsReportDTO(
+        leader_pid=await asyncio.to_thread(job_leader.leader_pid),
+        worker_pid=os.getpid(),
+        worker_is_leader=job_leader.is_leader,
+        summary=summary,
+        runs=runs[::-1][:limit],
+    )
+
+
+@router.get("/cache_stats", response_model=RepositoryCacheStatsDTO)
+async def repository_cache_stats(
+    cache: Annotated[Optional[TaggedCache], Depends(get_repository_cache)],
+) -> RepositoryCacheStatsDTO:
+    """
+    Get hit, miss and eviction counters of the repository result cache of the worker that serves the request.
+    """
+    if cache is None:
+        return RepositoryCacheStatsDTO(enabled=False)
+    return RepositoryCacheStatsDTO(enabled=True, **cache.stats())
+
+
+@router.get("/slow_queries", response_model=SlowQueriesReportDTO)
+async def slow_queries_report(
+    query_log: Annotated[Optional[QueryLog], Depends(get_query_log)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    order_by: Literal["max", "total", "avg"] = "max",
+) -> SlowQueriesReportDTO:
+    """
+    Get the slowest statement shapes of the worker that serves the request, with the query plan
+    captured on their first slow execution and the trace id of their slowest execution.
+    """
+    if query_log is None:
+        return SlowQueriesReportDTO(enabled=False, worker_pid=os.getpid())
+    return SlowQueriesReportDTO(
+        enabled=True,
+        worker_pid=os.getpid(),
+        slow_threshold_ms=query_log.slow_threshold_ms,
+        recorded=query_log.recorded,
+        queries=[SlowQueryDTO(**query) for query in query_log.top(limit, order_by)],
+    )
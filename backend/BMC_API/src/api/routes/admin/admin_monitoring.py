@@ -0,0 +1,96 @@
+# backend/BMC_API/src/api/routes/admin/admin_monitoring.py
+# Exceptions raised the routes here will be caught by the global exception handlers.
+
+import asyncio
+import os
+from datetime import timedelta
+from typing import Annotated, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from loguru import logger
+
+from BMC_API.src.api.schemas.monitoring_schema import EventLoopBlockDTO, EventLoopBlocksReportDTO, ProfileTokenDTO
+from BMC_API.src.api.schemas.user_schema import UserInDB
+from BMC_API.src.application.interfaces.authentication import auth, get_current_active_user_dependency
+from BMC_API.src.application.interfaces.authorization import RoleChecker
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.core.loop_watchdog import LoopWatchdog, get_loop_watchdog
+from BMC_API.src.core.profiler import ProfileFormat, ProfilerBusyError, SamplingProfiler, get_profiler
+from BMC_API.src.domain.value_objects.enums.user_enums import Roles
+
+router = APIRouter(
+    dependencies=[Depends(RoleChecker([Roles.ADMIN]))]
+)  # IMPORTANT: dependency injection among all endpoints here for role checking
+
+
+@router.get("/event_loop_blocks", response_model=EventLoopBlocksReportDTO)
+async def event_loop_blocks_report(
+    watchdog: Annotated[Optional[LoopWatchdog], Depends(get_loop_watchdog)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 10,
+    order_by: Literal["total", "max", "count"] = "total",
+) -> EventLoopBlocksReportDTO:
+    """
+    Get the locations that blocked the event loop of the worker that serves the request longer than the
+    watchdog threshold, with the stack and trace id of their longest block.
+    """
+    if watchdog is None:
+        return EventLoopBlocksReportDTO(enabled=False, worker_pid=os.getpid())
+    return EventLoopBlocksReportDTO(
+        enabled=True,
+        worker_pid=os.getpid(),
+        threshold_ms=watchdog.threshold * 1000,
+        blocks_detected=watchdog.blocks_detected,
+        max_lag_ms=round(watchdog.max_lag * 1000, 3),
+        blocks=[EventLoopBlockDTO(**block) for block in watchdog.top(limit, order_by)],
+    )
+
+
+@router.post("/profile", response_class=Response)
+async def profile_worker(
+    profiler: Annotated[Optional[SamplingProfiler], Depends(get_profiler)],
+    duration: Annotated[float, Query(gt=0, le=settings.profiler_max_duration_in_sec)] = 10.0,
+    interval_ms: Annotated[Optional[float], Query(ge=1, le=1000)] = None,
+    profile_format: Annotated[ProfileFormat, Query(alias="format")] = "speedscope",
+    threads: Literal["loop", "all"] = "loop",
+    include_idle: bool = False,
+) -> Response:
+    """
+    Take a sampling profile of the worker that serves the request for `duration` seconds, and download it
+    as a speedscope file or in the collapsed stack format of flame graphs. By default, only the event loop
+    thread is sampled and the samples of an idle loop are left out.
+    """
+    if profiler is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="The profiler is disabled.")
+    try:
+        with profiler.session(
+            f"Worker {os.getpid()}",
+            interval=interval_ms / 1000 if interval_ms else None,
+            threads=threads,
+            include_idle=include_idle,
+        ) as profile:
+            await asyncio.sleep(duration)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    logger.info(f"Profiled worker {os.getpid()} for {profile.duration:.1f} s, {profile.sample_count} samples")
+    content, media_type, file_name = profile.render(profile_format)
+    return Response(
+        content, media_type=media_type, headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
+    )
+
+
+@router.post("/profile/token", response_model=ProfileTokenDTO)
+async def create_profile_token(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user_dependency)],
+    profiler: Annotated[Optional[SamplingProfiler], Depends(get_profiler)],
+) -> ProfileTokenDTO:
+    """
+    Create a short-lived token to profile single requests: a request with the token in the X-Profile header
+    is handled as usual, but answered with the profile of its handling, in the format of the X-Profile-Format
+    header ("speedscope" or "collapsed"). The status of the handled response is in the X-Profiled-Status header.
+    """
+    if profiler is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="The profiler is disabled.")
+    expires_in = timedelta(minutes=settings.profiler_token_expire_minutes)
+    token = auth.create_token(data={"sub": current_user.email, "type": "profile"}, expires_delta=expires_in)
+    return ProfileTokenDTO(profile_token=token, expires_in=int(expires_in.total_seconds()))
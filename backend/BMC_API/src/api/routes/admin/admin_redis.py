@@ -1,41 +1,72 @@
 # backend/BMC_API/src/api/routes/admin/admin_redis.py
 
-from typing import Annotated, List
+import json
+from typing import Annotated, AsyncGenerator
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from redis.asyncio import ConnectionPool, Redis
 
-from BMC_API.src.api.schemas.redis_schema import RedisValueDTO
+from BMC_API.src.api.schemas.redis_schema import (
+    RedisDeleteProgressDTO,
+    RedisPoolStatsDTO,
+    RedisScanPageDTO,
+    RedisValueDTO,
+)
 from BMC_API.src.api.schemas.user_schema import UserInDB
 from BMC_API.src.application.interfaces.authentication import (
     validate_active_user_password_dependency,
 )
 from BMC_API.src.application.interfaces.authorization import RoleChecker
 from BMC_API.src.domain.value_objects.enums.user_enums import Roles
-from BMC_API.src.infrastructure.external_services.redis.dependency import get_redis_pool
+from BMC_API.src.infrastructure.external_services.redis.dependency import (
+    get_redis_client,
+    get_redis_pool,
+)
 
 router = APIRouter(
     dependencies=[Depends(RoleChecker([Roles.ADMIN]))]
 )  # IMPORTANT: dependency injection among all endpoints here for role checking
 
+# Upper bound for SCAN COUNT hints and UNLINK chunks accepted from clients
+MAX_SCAN_PAGE_SIZE = 1000
+# SCAN calls per listing request, so sparse patterns do not walk the whole keyspace in one request
+MAX_SCAN_ROUND_TRIPS = 10
+
 
 @router.get("/health")
 async def redis_health(
-    redis_pool: Annotated[ConnectionPool, Depends(get_redis_pool)],
+    redis: Annotated[Redis, Depends(get_redis_client)],
 ) -> None:
     """
     Checks the health of a Redis server.
     """
-    async with Redis(connection_pool=redis_pool) as redis:
-        try:
-            await redis.ping()
-        except Exception as e:
-            logger.error(e)
-            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    try:
+        await redis.ping()
+    except Exception as e:
+        logger.error(e)
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
     return {"message": "Redis server works"}
 
 
+@router.get(
+    "/pool",
+    response_model=RedisPoolStatsDTO,
+    summary="Get connection pool metrics of this worker (Admin)",
+)
+async def redis_pool_stats(
+    redis_pool: Annotated[ConnectionPool, Depends(get_redis_pool)],
+) -> RedisPoolStatsDTO:
+    """
+    Get utilization and connection wait-time metrics of the redis connection pool of the worker
+    that serves the request.
+    """
+    if not hasattr(redis_pool, "stats"):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pool metrics are not available.")
+    return RedisPoolStatsDTO(**redis_pool.stats())
+
+
 @router.get(
     "/",
     response_model=RedisValueDTO,
@@ -43,69 +74,87 @@ async def redis_health(
 )
 async def get_redis_value(
     key: str,
-    redis_pool: Annotated[ConnectionPool, Depends(get_redis_pool)],
+    redis: Annotated[Redis, Depends(get_redis_client)],
 ) -> RedisValueDTO:
     """
     Get value from redis.
     """
-    async with Redis(connection_pool=redis_pool) as redis:
-        try:
-            redis_value = await redis.get(key)
-            if not redis_value:
-                raise
-            else:
-                return RedisValueDTO(
-                    key=key,
-                    value=redis_value,
-                )
-        except Exception as e:
-            if "No active exception" in str(e):
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Key not found.")
-            else:
-                raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    try:
+        redis_value = await redis.get(key)
+        if not redis_value:
+            raise
+        else:
+            return RedisValueDTO(
+                key=key,
+                value=redis_value,
+            )
+    except Exception as e:
+        if "No active exception" in str(e):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Key not found.")
+        else:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
 
 
 @router.get(
     "/all_keys",
-    response_model=List[RedisValueDTO],
-    summary="Get all redis values (Admin)",
+    response_model=RedisScanPageDTO,
+    summary="Get redis values page by page (Admin)",
 )
 async def get_all_redis_values(
-    redis_pool: Annotated[ConnectionPool, Depends(get_redis_pool)],
-) -> RedisValueDTO:
+    redis: Annotated[Redis, Depends(get_redis_client)],
+    match: Annotated[str, Query(description="Glob-style pattern the keys must match.")] = "*",
+    count: Annotated[int, Query(ge=1, le=MAX_SCAN_PAGE_SIZE, description="Page size hint for SCAN.")] = 100,
+    cursor: Annotated[int, Query(ge=0, description="Cursor from the previous page. 0 starts a new scan.")] = 0,
+) -> RedisScanPageDTO:
     """
-    Get all values from redis. Requires admin access.
+    Get values from redis with cursor-based SCAN. Requires admin access.
+
+    Keys are never listed with `KEYS *`, so the server is not blocked on large keyspaces.
+    Follow `next_cursor` until `complete` is true to iterate the whole keyspace. A page may hold fewer keys
+    than `count`, or none, if the pattern is sparse: each request stops after a bounded number of SCAN calls.
     """
-    async with Redis(connection_pool=redis_pool) as redis:
-        try:
-            keys = await redis.keys("*")
-
-            if not keys:
-                raise
-            else:
-                values = await redis.mget(keys)
-                # results = list(zip(keys, values))
-                results = []
-
-                # convert keys and values to strings
-                for key, value in zip(keys, values):
-                    key_str = key.decode("utf-8", errors="ignore")
-                    value_str = value.decode("utf-8", errors="ignore") if value is not None else None
-                    results.append(
-                        RedisValueDTO(
-                            key=key_str,
-                            value=value_str,
-                        )
-                    )
-                return results
+    try:
+        keys = []
+        next_cursor = cursor
+        # SCAN may return fewer keys than requested (or none) while the scan is not finished
+        for _ in range(MAX_SCAN_ROUND_TRIPS):
+            next_cursor, batch = await redis.scan(cursor=next_cursor, match=match, count=count)
+            keys.extend(batch)
+            if next_cursor == 0 or len(keys) >= count:
+                break
 
-        except Exception as e:
-            if "No active exception" in str(e):
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No data found.")
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        if not keys and cursor == 0 and next_cursor == 0:
+            raise
+
+        values = await redis.mget(keys) if keys else []
+        total_keys = await redis.dbsize()
+
+        results = []
+        # convert keys and values to strings
+        for key, value in zip(keys, values):
+            key_str = key.decode("utf-8", errors="ignore")
+            value_str = value.decode("utf-8", errors="ignore") if value is not None else None
+            results.append(
+                RedisValueDTO(
+                    key=key_str,
+                    value=value_str,
                 )
+            )
+        return RedisScanPageDTO(
+            content=results,
+            cursor=cursor,
+            next_cursor=next_cursor,
+            complete=next_cursor == 0,
+            total_keys=total_keys,
+        )
+
+    except Exception as e:
+        if "No active exception" in str(e):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No data found.")
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
 
 
 @router.post(
@@ -114,18 +163,17 @@ async def get_all_redis_values(
 )
 async def set_redis_value(
     redis_value: RedisValueDTO,
-    redis_pool: Annotated[ConnectionPool, Depends(get_redis_pool)],
+    redis: Annotated[Redis, Depends(get_redis_client)],
 ) -> None:
     """
     Set value in redis.
     """
     if redis_value.value is not None:
-        async with Redis(connection_pool=redis_pool) as redis:
-            try:
-                await redis.set(name=redis_value.key, value=redis_value.value)
-            except Exception as e:
-                logger.error(e)
-                raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        try:
+            await redis.set(name=redis_value.key, value=redis_value.value)
+        except Exception as e:
+            logger.error(e)
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
         return {"message": "key-value pair successfully stored in Redis database."}
 
 
@@ -135,28 +183,55 @@ async def set_redis_value(
 )
 async def delete_redis_key(
     key: str,
-    redis_pool: Annotated[ConnectionPool, Depends(get_redis_pool)],
+    redis: Annotated[Redis, Depends(get_redis_client)],
 ) -> None:
     """
     Delete key&value pair from redis.
     """
 
-    async with Redis(connection_pool=redis_pool) as redis:
-        try:
-            redis_value = await redis.get(key)
-            if not redis_value:
-                raise
-        except Exception as e:
-            if "No active exception" in str(e):
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Key not found.")
-            else:
-                HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
-        try:
-            await redis.delete(key)
-        except Exception as e:
-            logger.error(e)
-            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
-        return {"message": "key-value pair successfully deleted from Redis database."}
+    try:
+        redis_value = await redis.get(key)
+        if not redis_value:
+            raise
+    except Exception as e:
+        if "No active exception" in str(e):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Key not found.")
+        else:
+            HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    try:
+        await redis.delete(key)
+    except Exception as e:
+        logger.error(e)
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return {"message": "key-value pair successfully deleted from Redis database."}
+
+
+async def _unlink_in_chunks(redis: Redis, match: str, chunk_size: int) -> AsyncGenerator[RedisDeleteProgressDTO, None]:
+    """
+    Walk the keyspace with SCAN and remove matching keys with UNLINK, one chunk at a time.
+
+    UNLINK frees the values in a background thread of Redis, and the chunks keep both
+    the server and the API worker from handling the whole keyspace at once.
+    Yields the progress after each chunk.
+    """
+    scanned = 0
+    deleted = 0
+    chunk = []
+    async for key in redis.scan_iter(match=match, count=chunk_size):
+        chunk.append(key)
+        scanned += 1
+        if len(chunk) >= chunk_size:
+            deleted += await redis.unlink(*chunk)
+            chunk = []
+            yield RedisDeleteProgressDTO(scanned=scanned, deleted=deleted, complete=False)
+    if chunk:
+        deleted += await redis.unlink(*chunk)
+    yield RedisDeleteProgressDTO(
+        scanned=scanned,
+        deleted=deleted,
+        complete=True,
+        message="All key-value pairs successfully deleted from Redis database.",
+    )
 
 
 @router.delete(
@@ -165,19 +240,36 @@ async def delete_redis_key(
 )
 async def delete_all_redis_keys(
     current_active_user: Annotated[UserInDB, Depends(validate_active_user_password_dependency)],
-    redis_pool: Annotated[ConnectionPool, Depends(get_redis_pool)],
-) -> None:
+    redis: Annotated[Redis, Depends(get_redis_client)],
+    match: Annotated[str, Query(description="Glob-style pattern the deleted keys must match.")] = "*",
+    chunk_size: Annotated[int, Query(ge=1, le=MAX_SCAN_PAGE_SIZE, description="Keys unlinked per round trip.")] = 500,
+    stream: Annotated[bool, Query(description="Stream progress as newline-delimited JSON.")] = False,
+):
     """
     Delete ALL key&value pair from redis. Requires admin access and password validation.
+
+    Keys are removed in chunks with SCAN + UNLINK. With `stream=true` the progress after each
+    chunk is streamed as newline-delimited JSON, otherwise the final counts are returned.
     """
+    if stream:
+
+        async def progress_lines() -> AsyncGenerator[str, None]:
+            try:
+                async for progress in _unlink_in_chunks(redis, match, chunk_size):
+                    yield progress.model_dump_json() + "\n"
+            except Exception as e:
+                logger.error(e)
+                yield json.dumps({"error": "Redis server unavailable."}) + "\n"
+
+        return StreamingResponse(progress_lines(), media_type="application/x-ndjson")
+
     try:
-        async with Redis(connection_pool=redis_pool) as redis:
-            keys = await redis.keys("*")
-            await redis.delete(*keys)
+        async for progress in _unlink_in_chunks(redis, match, chunk_size):
+            logger.info(f"Deleting redis keys: {progress.deleted} deleted, {progress.scanned} scanned")
     except Exception as e:
         logger.error(e)
         if "No active exception" in str(e):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Key not found.")
         else:
             raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
-    return {"message": "All key-value pairs successfully deleted from Redis database."}
+    return {"message": progress.message, "scanned": progress.scanned, "deleted": progress.deleted}
@@ -4,7 +4,7 @@
 from datetime import datetime
 from typing import Annotated, Any, Dict, List, Optional
 
-from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Header, Path, Response, status
 from loguru import logger
 
 from BMC_API.src.api.dependencies.route_dependencies import get_repository, get_service
@@ -12,10 +12,11 @@ from BMC_API.src.api.dependencies.schemas import (
     BulkOperationResponse,
     PaginationResponse,
     SearchRequest,
+    pagination_json_response,
 )
+from BMC_API.src.api.responses import conditional_entity_response
 from BMC_API.src.api.schemas.user_schema import UserInDB
 from BMC_API.src.application.dto.task_dto import (
-    TaskHistoryModelDTO,
     TaskInputAdminDTO,
     TaskResponseAdminDTO,
     TaskUpdateAdminDTO,
@@ -36,6 +37,8 @@ from BMC_API.src.infrastructure.persistence.dao.task_history_dao import (
 # Dependency functions
 repository_dependency = get_repository(SQLAlchemyTaskRepository)
 service_dependency = get_service(TaskService, repository_dependency, dto_class=TaskResponseAdminDTO)
+read_repository_dependency = get_repository(SQLAlchemyTaskRepository, read_only=True)
+read_service_dependency = get_service(TaskService, read_repository_dependency, dto_class=TaskResponseAdminDTO)
 
 task_history_repository_dependency = get_repository(SQLAlchemyTaskHistoryRepository)
 task_history_service_dependency = get_service(
@@ -53,9 +56,10 @@ router = APIRouter(
 @router.get("/{id:int}", response_model=TaskResponseAdminDTO)
 async def get_task_route_admin(
     id: Annotated[int, Path(title="The ID of the item to get", ge=1)],
-    service: Annotated[TaskService, Depends(service_dependency)],
+    service: Annotated[TaskService, Depends(read_service_dependency)],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
-) -> Optional[TaskResponseAdminDTO]:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     Retrieve a task by its ID.
 
@@ -70,23 +74,24 @@ async def get_task_route_admin(
     **Returns:**
 
     * `Optional[TaskResponseAdminDTO]`: The task details if found; otherwise, None.
+      Validated with an ETag, a matching If-None-Match header is answered with 304 Not Modified.
     """
     logger.info(f"Received admin request to get task with id {id} by {current_active_user.email}")
     entity = await service.get(id=id)
     logger.info(f"Task with id {id} retrieved successfully by {current_active_user.email}.")
-    return entity
+    return conditional_entity_response(entity, if_none_match)
 
 
 @router.post("/all", response_model=PaginationResponse, response_model_exclude_none=True)
 async def list_tasks_route_admin(
-    service: Annotated[TaskService, Depends(service_dependency)],
+    service: Annotated[TaskService, Depends(read_service_dependency)],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
     limit: int | None = None,
     offset: int | None = None,
     search_request: SearchRequest | None = None,
     sort_by: str | None = "id",
     sort_desc: bool | None = False,
-) -> PaginationResponse[Optional[TaskResponseAdminDTO]]:
+) -> Response:
     """
     Retrieve a paginated list of tasks for admin users.
 
@@ -131,11 +136,7 @@ async def list_tasks_route_admin(
         sort_by=sort_by,
         sort_desc=sort_desc,
     )
-    return PaginationResponse(
-        total_pages=total_pages,
-        total_records=total_records,
-        content=entities,
-    )
+    return pagination_json_response(entities, total_pages, total_records, exclude_none=True)
 
 
 @router.post("/create", response_model=TaskResponseAdminDTO, status_code=status.HTTP_201_CREATED)
@@ -266,17 +267,13 @@ async def bulk_delete_tasks_route_admin(
 async def get_task_history_admin(
     id: int,
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
-    service: Annotated[TaskService, Depends(service_dependency)],
-) -> PaginationResponse[Optional[List[TaskHistoryModelDTO]]]:
+    service: Annotated[TaskService, Depends(read_service_dependency)],
+) -> Response:
     logger.info(f"Received admin request to get histories of task with id {id} by {current_active_user.email}")
 
     entities, total_pages, total_records = await service.task_histories(id=id)
     logger.info("Task histories fetched successfully.")
-    return PaginationResponse(
-        total_pages=total_pages,
-        total_records=total_records,
-        content=entities,
-    )
+    return pagination_json_response(entities, total_pages, total_records)
 
 
 @router.delete(
@@ -4,7 +4,7 @@
 from datetime import datetime
 from typing import Annotated, Any, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Path, status
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, Header, HTTPException, Path, Response, status
 from loguru import logger
 
 # from pydantic import EmailStr
@@ -13,7 +13,9 @@ from BMC_API.src.api.dependencies.schemas import (
     BulkOperationResponse,
     PaginationResponse,
     SearchRequest,
+    pagination_json_response,
 )
+from BMC_API.src.api.responses import conditional_entity_response
 from BMC_API.src.api.schemas.user_schema import UserInDB
 from BMC_API.src.application.dto.user_dto import (
     UserCreateAdminDTO,
@@ -29,6 +31,8 @@ from BMC_API.src.application.use_cases.admin_use_cases import AdminUserService
 
 # from BMC_API.src.application.use_cases.user_use_cases import UserService
 from BMC_API.src.domain.value_objects.enums.user_enums import Roles
+from BMC_API.src.infrastructure.external_services.redis.dependency import get_token_cache
+from BMC_API.src.infrastructure.external_services.redis.token_cache_impl import RedisTokenCache
 from BMC_API.src.infrastructure.persistence.dao.user_dao import SQLAlchemyUserRepository
 
 router = APIRouter(
@@ -64,32 +68,35 @@ def _validate_self_update(user_id: int, current_user_id: int, update: Dict[str,
 # Dependency functions
 repository_dependency = get_repository(SQLAlchemyUserRepository)
 service_dependency = get_service(AdminUserService, repository_dependency, dto_class=UserResponseAdminDTO)
+read_repository_dependency = get_repository(SQLAlchemyUserRepository, read_only=True)
+read_service_dependency = get_service(AdminUserService, read_repository_dependency, dto_class=UserResponseAdminDTO)
 
 
 # Admin routes for user management
 @router.get("/{id:int}", response_model=Optional[UserResponseAdminDTO])
 async def get_user_route_admin(
     id: Annotated[int, Path(title="The ID of the item to get", ge=1)],
-    service: Annotated[AdminUserService, Depends(service_dependency)],
-) -> Optional[UserResponseAdminDTO]:
+    service: Annotated[AdminUserService, Depends(read_service_dependency)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     logger.info(f"Received admin request to get user with id: {id}")
     user: UserResponseAdminDTO = await service.get(id=id)
     if not user:
         logger.info(f"User with id: {id} not found")
     else:
         logger.info(f"User with id: {id} retrieved")
-    return user
+    return conditional_entity_response(user, if_none_match)
 
 
 @router.post("/all", response_model=PaginationResponse, response_model_exclude_none=True)
 async def list_users_route_admin(
-    service: Annotated[AdminUserService, Depends(service_dependency)],
+    service: Annotated[AdminUserService, Depends(read_service_dependency)],
     limit: int | None = None,
     offset: int | None = None,
     search_request: SearchRequest | None = None,
     sort_by: str | None = "id",
     sort_desc: bool | None = False,
-) -> PaginationResponse[Optional[UserResponseAdminDTO]]:
+) -> Response:
     search_filters = search_request.search_filters if search_request and search_request.search_filters else None
     output_filters = search_request.output_filters if search_request and search_request.output_filters else None
 
@@ -101,11 +108,7 @@ async def list_users_route_admin(
         sort_by=sort_by,
         sort_desc=sort_desc,
     )
-    return PaginationResponse(
-        total_pages=total_pages,
-        total_records=total_records,
-        content=user_list,
-    )
+    return pagination_json_response(user_list, total_pages, total_records, exclude_none=True)
 
 
 @router.post("/create", response_model=UserResponseAdminDTO, status_code=status.HTTP_201_CREATED)
@@ -144,9 +147,11 @@ async def update_user_route_admin(
     ],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
     service: Annotated[AdminUserService, Depends(service_dependency)],
+    token_cache: Annotated[RedisTokenCache, Depends(get_token_cache)],
 ) -> UserResponseAdminDTO:
     """
     Update an existing user's details with admin rights. The user ID is taken from the URI.
+    Disabling a user revokes their refresh tokens.
     """
 
     logger.info(f"Received admin request to update user with id: {id}")
@@ -154,7 +159,7 @@ async def update_user_route_admin(
     requested_update = model_update.model_dump(include=model_update.model_fields_set)
     _validate_self_update(id, current_active_user.id, requested_update)
     entity_data["modified_time"] = datetime.now()
-    updated_user = await service.update(id=id, user_update=entity_data)
+    updated_user = await service.update(id=id, user_update=entity_data, token_cache=token_cache)
     logger.info(f"User with id {id} updated successfully by {current_active_user.email}.")
     return updated_user
 
@@ -171,10 +176,12 @@ async def bulk_update_users_route_admin(
     ],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
     service: Annotated[AdminUserService, Depends(service_dependency)],
+    token_cache: Annotated[RedisTokenCache, Depends(get_token_cache)],
 ) -> BulkOperationResponse[UserResponseAdminDTO]:
     """
     Bulk update multiple users' details with admin rights.
     Each update in the list must contain the user ID and the fields to update.
+    Disabling users revokes their refresh tokens in a single round trip.
     """
     logger.info(f"Received admin request to bulk update {len(updates)} users")
     for update in updates:
@@ -183,7 +190,7 @@ async def bulk_update_users_route_admin(
             _validate_self_update(user_id, current_active_user.id, update)
         else:
             _validate_role_update(update)
-    results = await service.update_bulk(updates=updates)
+    results = await service.update_bulk(updates=updates, token_cache=token_cache)
     logger.info(results.detail, f"Requested by {current_active_user.email}.")
     return results
 
@@ -4,13 +4,14 @@
 from datetime import datetime
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, Path, status
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, Header, Path, Response, status
+from fastapi.responses import JSONResponse
 from loguru import logger
 
 from BMC_API.src.api.dependencies.route_dependencies import get_repository
+from BMC_API.src.api.responses import conditional_entity_response, conditional_file_response
 from BMC_API.src.api.schemas.user_schema import UserInDB
-from BMC_API.src.application.dependencies import get_challenge_service
+from BMC_API.src.application.dependencies import get_challenge_read_service, get_challenge_service
 from BMC_API.src.application.dto.challenge_dto import (
     ChallengeModelBaseOutputDTO,
     ChallengeModelCreateDTO,
@@ -33,6 +34,7 @@ from BMC_API.src.infrastructure.persistence.dao.challenge_dao import (
 
 # Dependency functions
 repository_dependency = get_repository(SQLAlchemyChallengeRepository)
+read_repository_dependency = get_repository(SQLAlchemyChallengeRepository, read_only=True)
 
 
 ownership_check = ownership_checker_dependency(
@@ -41,6 +43,12 @@ ownership_check = ownership_checker_dependency(
     repository_dependency=repository_dependency,
     get_model_id=lambda id: int(id),
 )
+read_ownership_check = ownership_checker_dependency(
+    service_class=ChallengeService,
+    model_id_field="challenge_owner_id",
+    repository_dependency=read_repository_dependency,
+    get_model_id=lambda id: int(id),
+)
 
 # Router
 router = APIRouter(
@@ -52,10 +60,11 @@ router = APIRouter(
 @router.get("/{id:int}", response_model=Optional[ChallengeModelBaseOutputDTO])
 async def get_challenge_route(
     id: Annotated[int, Path(title="The ID of the item to get", ge=1)],
-    service: Annotated[ChallengeService, Depends(get_challenge_service)],
+    service: Annotated[ChallengeService, Depends(get_challenge_read_service)],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
-    _ownership: Annotated[bool, Depends(ownership_check)],
-) -> Optional[ChallengeModelBaseOutputDTO]:
+    _ownership: Annotated[bool, Depends(read_ownership_check)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     Retrieve a challenge by its ID.
 
@@ -70,11 +79,12 @@ async def get_challenge_route(
     **Returns:**
 
     * `Optional[ChallengeModelBaseOutputDTO]`: The challenge details if found; otherwise, None.
+      Validated with an ETag, a matching If-None-Match header is answered with 304 Not Modified.
     """
     logger.info(f"Received request to get challenge with id {id} by {current_active_user.email}")
     entity = await service.get(id=id)
     logger.info(f"Challenge with id {id} retrieved successfully by {current_active_user.email}.")
-    return entity
+    return conditional_entity_response(entity, if_none_match)
 
 
 @router.post("/create", response_model=ChallengeModelBaseOutputDTO, status_code=status.HTTP_201_CREATED)
@@ -222,8 +232,9 @@ async def download_challenge_document_route(
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
     service: Annotated[ChallengeService, Depends(get_challenge_service)],
     _ownership: Annotated[bool, Depends(ownership_check)],
-) -> FileResponse:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     logger.info(f"Received request to download challenge with id {id} by {current_active_user.email}")
     file = await service.download_challenge(id=id)
     logger.info(f"Challenge with id {id} retrieved successfully by {current_active_user.email}.")
-    return file
+    return conditional_file_response(file, if_none_match)
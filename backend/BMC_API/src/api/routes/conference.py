@@ -3,13 +3,16 @@
 
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response, status
 from loguru import logger
 
 from BMC_API.src.api.dependencies.route_dependencies import get_repository, get_service
 from BMC_API.src.api.dependencies.schemas import PaginationResponse
+from BMC_API.src.api.responses import PayloadJSONResponse
 from BMC_API.src.application.dto.conference_dto import ConferenceModelBaseOutputDTO
 from BMC_API.src.application.use_cases.conference_use_cases import ConferenceService
+from BMC_API.src.core.etag import etag_matches
+from BMC_API.src.infrastructure.cache.dependency import get_cache_backend
 from BMC_API.src.infrastructure.persistence.dao.conference_dao import (
     SQLAlchemyConferenceRepository,
 )
@@ -18,27 +21,34 @@ router = APIRouter()
 
 
 # Dependency functions
-repository_dependency = get_repository(SQLAlchemyConferenceRepository)
-service_dependency = get_service(ConferenceService, repository_dependency, dto_class=ConferenceModelBaseOutputDTO)
+repository_dependency = get_repository(SQLAlchemyConferenceRepository, read_only=True)
+service_dependency = get_service(
+    ConferenceService,
+    repository_dependency,
+    dto_class=ConferenceModelBaseOutputDTO,
+    cache_dependency=get_cache_backend,
+)
 
 
-@router.get("/all_limited", response_model=PaginationResponse)
+@router.get("/all_limited", response_model=PaginationResponse[Optional[ConferenceModelBaseOutputDTO]])
 async def get_all_conferences_limited_route(
     service: Annotated[ConferenceService, Depends(service_dependency)],
-) -> PaginationResponse[Optional[ConferenceModelBaseOutputDTO]]:
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
+    """
+    List all conferences open for submission.
+
+    The serialized listing is cached and validated with an ETag, clients sending a matching
+    If-None-Match header get 304 Not Modified without a body.
+    """
     logger.info("Received request to get all conferences open for submission")
-    (
-        entities,
-        total_pages,
-        total_records,
-    ) = await service.list_conferences_open_for_submission_limited(offset=0, limit=0)
-
-    if not entities:
-        logger.info("No conference found")
-    else:
-        logger.info("Conferences retrieved")
-    return PaginationResponse(
-        total_pages=total_pages,
-        total_records=total_records,
-        content=entities,
-    )
+    payload = await service.list_conferences_open_for_submission_cached()
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(if_none_match, payload.etag):
+        logger.info("Conferences not modified")
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    logger.info("Conferences retrieved")
+    # Already encoded, sent without decoding and encoding again
+    return PayloadJSONResponse(payload.body, headers=headers)
@@ -1,13 +1,49 @@
-from fastapi import APIRouter
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from prometheus_client.exposition import choose_encoder
+
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.core.metrics import scrape_registry
 
 router = APIRouter()
 
 
+def ensure_metrics_scraper(authorization: Annotated[str | None, Header()] = None) -> None:
+    """
+    Only scrapers holding the `metrics_scrape_token` read the metrics, e.g. Prometheus with
+    `authorization: {credentials: <token>}` in its scrape config.
+    """
+    if not settings.metrics_scrape_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No metrics scrape token is configured.")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token.encode(), settings.metrics_scrape_token.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics scrape token.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
 @router.get("/health")
-def health_check() -> None:
+def health_check() -> dict:
     """
     Checks the health of a project.
 
     It returns 200 if the project is healthy.
     """
     return {"message": "Yes, it works!"}
+
+
+@router.get("/metrics", response_class=Response, dependencies=[Depends(ensure_metrics_scraper)])
+async def prometheus_metrics(request: Request) -> Response:
+    """
+    Metrics in the Prometheus text format, or in the OpenMetrics format if the scraper accepts it, e.g. request
+    latencies, database statements per request, PDF render durations and the event loop lag. Requires the
+    `metrics_scrape_token` as bearer token.
+
+    Under gunicorn the metrics of all workers are aggregated, see `scrape_registry`.
+    """
+    encoder, content_type = choose_encoder(request.headers.get("accept"))
+    return Response(encoder(scrape_registry()), media_type=content_type)
@@ -18,6 +18,7 @@ from BMC_API.src.api.routes.admin import (
     admin_challenge,
     admin_conference,
     admin_database,
+    admin_monitoring,
     admin_redis,
     admin_task,
     admin_user,
@@ -58,3 +59,8 @@ api_router.include_router(
     prefix="/admin/redis",
     tags=["Admin (Redis)"],
 )
+api_router.include_router(
+    admin_monitoring.router,
+    prefix="/admin/monitoring",
+    tags=["Admin (Monitoring)"],
+)
@@ -4,10 +4,11 @@
 from datetime import datetime
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Body, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Header, Path, Response, status
 from loguru import logger
 
 from BMC_API.src.api.dependencies.route_dependencies import get_repository, get_service
+from BMC_API.src.api.responses import conditional_entity_response
 from BMC_API.src.api.schemas.user_schema import UserInDB
 from BMC_API.src.application.dto.challenge_dto import ChallengeModelBaseOutputDTO
 from BMC_API.src.application.dto.task_dto import (
@@ -32,6 +33,8 @@ from BMC_API.src.infrastructure.persistence.dao.task_dao import SQLAlchemyTaskRe
 # Dependency functions
 repository_dependency = get_repository(SQLAlchemyTaskRepository)
 service_dependency = get_service(TaskService, repository_dependency, dto_class=TaskModelBaseOutputDTO)
+read_repository_dependency = get_repository(SQLAlchemyTaskRepository, read_only=True)
+read_service_dependency = get_service(TaskService, read_repository_dependency, dto_class=TaskModelBaseOutputDTO)
 challenge_repository_dependency = get_repository(SQLAlchemyChallengeRepository)
 challenge_service_dependency = get_service(
     ChallengeService, challenge_repository_dependency, dto_class=ChallengeModelBaseOutputDTO
@@ -43,6 +46,12 @@ ownership_check = ownership_checker_dependency(
     repository_dependency=repository_dependency,
     get_model_id=lambda id: int(id),
 )
+read_ownership_check = ownership_checker_dependency(
+    service_class=TaskService,
+    model_id_field="task_owner_id",
+    repository_dependency=read_repository_dependency,
+    get_model_id=lambda id: int(id),
+)
 
 # Router
 router = APIRouter(
@@ -54,10 +63,11 @@ router = APIRouter(
 @router.get("/{id:int}", response_model=Optional[TaskModelBaseOutputDTO])
 async def get_task_route(
     id: Annotated[int, Path(title="The ID of the item to get", ge=1)],
-    service: Annotated[TaskService, Depends(service_dependency)],
+    service: Annotated[TaskService, Depends(read_service_dependency)],
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
-    _ownership: Annotated[bool, Depends(ownership_check)],
-) -> Optional[TaskModelBaseOutputDTO]:
+    _ownership: Annotated[bool, Depends(read_ownership_check)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     Retrieve a task by its ID.
 
@@ -72,11 +82,12 @@ async def get_task_route(
     **Returns:**
 
     * `Optional[TaskModelBaseOutputDTO]`: The task details if found; otherwise, None.
+      Validated with an ETag, a matching If-None-Match header is answered with 304 Not Modified.
     """
     logger.info(f"Received request to get task with id {id} by {current_active_user.email}")
     entity = await service.get(id=id)
     logger.info(f"Task with id {id} retrieved successfully by {current_active_user.email}.")
-    return entity
+    return conditional_entity_response(entity, if_none_match)
 
 
 @router.post("/create", response_model=TaskModelBaseOutputDTO, status_code=status.HTTP_201_CREATED)
@@ -10,6 +10,7 @@ from fastapi import (
     Depends,
     HTTPException,
     Query,
+    Response,
     status,
 )
 from fastapi.security import OAuth2PasswordRequestForm
@@ -17,7 +18,7 @@ from loguru import logger
 from pydantic import EmailStr
 
 from BMC_API.src.api.dependencies.route_dependencies import get_repository, get_service
-from BMC_API.src.api.dependencies.schemas import PaginationResponse
+from BMC_API.src.api.dependencies.schemas import PaginationResponse, pagination_json_response
 from BMC_API.src.api.schemas.user_schema import UserInDB
 from BMC_API.src.application.dto.challenge_dto import ChallengeModelBaseOutputDTO
 from BMC_API.src.application.dto.task_dto import TaskModelBaseOutputDTO
@@ -58,10 +59,11 @@ repository_dependency = get_repository(SQLAlchemyUserRepository)
 service_dependency = get_service(UserService, repository_dependency, dto_class=UserResponseDTO)
 service_dependency_admin = get_service(AdminUserService, repository_dependency, dto_class=UserResponseAdminDTO)
 
-task_repository_dependency = get_repository(SQLAlchemyTaskRepository)
+# Only used by the read-only my_tasks and my_challenges endpoints
+task_repository_dependency = get_repository(SQLAlchemyTaskRepository, read_only=True)
 task_service_dependency = get_service(TaskService, task_repository_dependency, dto_class=TaskModelBaseOutputDTO)
 
-challenge_repository_dependency = get_repository(SQLAlchemyChallengeRepository)
+challenge_repository_dependency = get_repository(SQLAlchemyChallengeRepository, read_only=True)
 challenge_service_dependency = get_service(
     ChallengeService, challenge_repository_dependency, dto_class=ChallengeModelBaseOutputDTO
 )
@@ -280,7 +282,7 @@ async def my_challenges_route(
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
     limit: int | None = None,
     offset: int | None = None,
-) -> PaginationResponse[Optional[TaskModelBaseOutputDTO]]:
+) -> Response:
     """
     Retrieve challenges associated with the current user.
 
@@ -293,11 +295,7 @@ async def my_challenges_route(
         sort_by="challenge_created_time",
         sort_desc=True,
     )
-    return PaginationResponse(
-        total_pages=total_pages,
-        total_records=total_records,
-        content=entity_list,
-    )
+    return pagination_json_response(entity_list, total_pages, total_records)
 
 
 @router.get("/my_tasks", response_model=PaginationResponse)
@@ -307,7 +305,7 @@ async def my_tasks_route(
     current_active_user: Annotated[UserInDB, Depends(ensure_current_active_user)],
     limit: int | None = None,
     offset: int | None = None,
-) -> PaginationResponse[Optional[TaskModelBaseOutputDTO]]:
+) -> Response:
     """
     Retrieve tasks associated with the current user.
 
@@ -316,8 +314,4 @@ async def my_tasks_route(
     entity_list, total_pages, total_records = await task_service.list(
         limit=limit, offset=offset, search_filters={"task_owner_id": current_active_user.id}
     )
-    return PaginationResponse(
-        total_pages=total_pages,
-        total_records=total_records,
-        content=entity_list,
-    )
+    return pagination_json_response(entity_list, total_pages, total_records)
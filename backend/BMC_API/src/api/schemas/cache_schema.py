@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class RepositoryCacheStatsDTO(BaseModel):
+    """DTO for counters of the repository result cache of one worker."""
+
+    enabled: bool
+    backend: str | None = None
+    hits: int = 0
+    misses: int = 0
+    hit_ratio: float = 0.0
+    evictions: int | None = None  # None for backends that evict on their own, e.g. redis maxmemory
+    invalidations: int = 0  # Invalidated tags
@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+
+class DatabaseSnapshotDTO(BaseModel):
+    """DTO for an incremental database snapshot."""
+
+    id: str
+    created: datetime
+    size: int  # Bytes of the restored database
+    chunk_count: int
+    new_chunks: int  # Chunks written by this snapshot, the others were shared with earlier snapshots
+
+    @classmethod
+    def from_manifest(cls, manifest: dict) -> "DatabaseSnapshotDTO":
+        return cls(chunk_count=len(manifest["chunks"]), **manifest)
+
+
+class JobRunDTO(BaseModel):
+    """DTO for one run of a periodic job."""
+
+    job: str
+    started: datetime
+    duration_ms: float
+    status: str  # "succeeded" or "failed"
+    error: str | None = None
+    worker_pid: int
+
+
+class JobSummaryDTO(BaseModel):
+    """DTO for the run statistics of a periodic job."""
+
+    job: str
+    runs: int
+    failures: int
+    avg_duration_ms: float
+    max_duration_ms: float
+    last_run: JobRunDTO
+
+
+class JobsReportDTO(BaseModel):
+    """DTO for leader election state and recent runs of periodic jobs."""
+
+    leader_pid: int | None
+    worker_pid: int  # Worker that served the request
+    worker_is_leader: bool
+    summary: List[JobSummaryDTO]
+    runs: List[JobRunDTO]  # Newest first
+
+
+class SlowQueryDTO(BaseModel):
+    """DTO for the statistics of one statement shape in the query log."""
+
+    sql: str  # Normalized statement, literals replaced by "?"
+    count: int
+    slow_count: int  # Executions above the slow query threshold
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+    avg_rows: float | None  # None if the driver does not report row counts
+    last_seen: datetime
+    slowest_trace_id: str | int  # OpenTelemetry trace of the slowest execution, 0 outside of a trace
+    slowest_span_id: str | int
+    plan: List[str] | None = None  # Captured on the first slow execution
+
+
+class SlowQueriesReportDTO(BaseModel):
+    """DTO for the slowest statement shapes of one worker."""
+
+    enabled: bool
+    worker_pid: int
+    slow_threshold_ms: float | None = None
+    recorded: int = 0  # Executions since startup, the buffer keeps only the most recent ones
+    queries: List[SlowQueryDTO] = []
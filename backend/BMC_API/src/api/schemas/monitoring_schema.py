@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+
+class EventLoopBlockDTO(BaseModel):
+    """DTO for the blocks of the event loop at one location."""
+
+    location: str  # Innermost application frame of the stack, "path:line in function"
+    count: int
+    total_ms: float
+    max_ms: float
+    last_seen: datetime
+    stack: List[str]  # Stack of the longest block, outermost frame first
+    task: str | None = None  # Task running on the loop during the longest block, None for plain callbacks
+    trace_id: str | int  # OpenTelemetry trace of the longest block, 0 outside of a trace
+    span_id: str | int
+
+
+class EventLoopBlocksReportDTO(BaseModel):
+    """DTO for the callbacks that blocked the event loop of one worker."""
+
+    enabled: bool
+    worker_pid: int
+    threshold_ms: float | None = None
+    blocks_detected: int = 0  # Blocks since startup, the report keeps a limited number of locations
+    max_lag_ms: float = 0.0
+    blocks: List[EventLoopBlockDTO] = []
+
+
+class ProfileTokenDTO(BaseModel):
+    """DTO for a token that profiles the requests carrying it in the X-Profile header."""
+
+    profile_token: str
+    header: str = "X-Profile"
+    expires_in: int  # Seconds
@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic import BaseModel
 
 
@@ -12,3 +14,36 @@ class RedisExistsDTO(BaseModel):
     """DTO for redis existence."""
 
     key_exists: bool | None  # noqa: WPS110
+
+
+class RedisScanPageDTO(BaseModel):
+    """DTO for one page of a cursor-based SCAN over redis keys."""
+
+    content: List[RedisValueDTO]
+    cursor: int  # Cursor this page was requested with
+    next_cursor: int  # Pass as `cursor` to get the next page. 0 means the scan is complete.
+    complete: bool
+    total_keys: int | None = None  # Size of the keyspace, to show scan progress
+
+
+class RedisDeleteProgressDTO(BaseModel):
+    """DTO for progress of a chunked delete over redis keys."""
+
+    scanned: int
+    deleted: int
+    complete: bool
+    message: str | None = None
+
+
+class RedisPoolStatsDTO(BaseModel):
+    """DTO for utilization and wait-time metrics of the redis connection pool."""
+
+    max_connections: int
+    created_connections: int
+    in_use_connections: int
+    idle_connections: int
+    utilization: float  # in_use_connections / max_connections
+    acquired_count: int
+    timeout_count: int  # Failed acquisitions, e.g. no free connection within the pool timeout
+    avg_wait_ms: float
+    max_wait_ms: float
@@ -1,4 +1,6 @@
 # application/dependencies.py
+from typing import Callable, Type
+
 from fastapi import Depends
 
 from BMC_API.src.api.dependencies.route_dependencies import get_repository
@@ -44,59 +46,51 @@ from BMC_API.src.infrastructure.persistence.dao.task_history_dao import (
 from BMC_API.src.infrastructure.persistence.dao.user_dao import SQLAlchemyUserRepository
 
 
-def get_challenge_service(
-    conference_repo: ConferenceRepositoryProtocol = Depends(get_repository(SQLAlchemyConferenceRepository)),
-    challenge_repo: ChallengeRepositoryProtocol = Depends(get_repository(SQLAlchemyChallengeRepository)),
-    task_repo: TaskRepositoryProtocol = Depends(get_repository(SQLAlchemyTaskRepository)),
-    challenge_history_repo: ChallengeHistoryRepositoryProtocol = Depends(
-        get_repository(SQLAlchemyChallengeHistoryRepository)
-    ),
-    task_history_repo: TaskHistoryRepositoryProtocol = Depends(get_repository(SQLAlchemyTaskHistoryRepository)),
-    user_repo: UserRepositoryProtocol = Depends(get_repository(SQLAlchemyUserRepository)),
-):
-    # build the helpers
-    conference_svc = ConferenceService(conference_repo)
-    task_svc = TaskService(task_repo)
-    challenge_hist_svc = ChallengeHistoryService(challenge_history_repo)
-    task_hist_svc = TaskHistoryService(task_history_repo)
-    user_svc = UserService(user_repo)
-    # finally build the main service
-    return ChallengeService(
-        repository=challenge_repo,
-        dto_class=ChallengeModelBaseOutputDTO,
-        # now pass in all the helpers it needs:
-        conference_service=conference_svc,
-        task_service=task_svc,
-        challenge_history_service=challenge_hist_svc,
-        task_history_service=task_hist_svc,
-        user_service=user_svc,
-    )
+def _challenge_service_dependency(dto_class: Type, read_only: bool = False) -> Callable[..., ChallengeService]:
+    """
+    Dependency building a ChallengeService with its helper services. With read_only, all repositories
+    use a session of the read engine, for endpoints that do not write.
+    """
+
+    def dependency(
+        conference_repo: ConferenceRepositoryProtocol = Depends(
+            get_repository(SQLAlchemyConferenceRepository, read_only=read_only)
+        ),
+        challenge_repo: ChallengeRepositoryProtocol = Depends(
+            get_repository(SQLAlchemyChallengeRepository, read_only=read_only)
+        ),
+        task_repo: TaskRepositoryProtocol = Depends(get_repository(SQLAlchemyTaskRepository, read_only=read_only)),
+        challenge_history_repo: ChallengeHistoryRepositoryProtocol = Depends(
+            get_repository(SQLAlchemyChallengeHistoryRepository, read_only=read_only)
+        ),
+        task_history_repo: TaskHistoryRepositoryProtocol = Depends(
+            get_repository(SQLAlchemyTaskHistoryRepository, read_only=read_only)
+        ),
+        user_repo: UserRepositoryProtocol = Depends(get_repository(SQLAlchemyUserRepository, read_only=read_only)),
+    ) -> ChallengeService:
+        # build the helpers
+        conference_svc = ConferenceService(conference_repo)
+        task_svc = TaskService(task_repo)
+        challenge_hist_svc = ChallengeHistoryService(challenge_history_repo)
+        task_hist_svc = TaskHistoryService(task_history_repo)
+        user_svc = UserService(user_repo)
+        # finally build the main service
+        return ChallengeService(
+            repository=challenge_repo,
+            dto_class=dto_class,
+            # now pass in all the helpers it needs:
+            conference_service=conference_svc,
+            task_service=task_svc,
+            challenge_history_service=challenge_hist_svc,
+            task_history_service=task_hist_svc,
+            user_service=user_svc,
+        )
+
+    return dependency
 
 
-def get_challenge_service_admin(
-    conference_repo: ConferenceRepositoryProtocol = Depends(get_repository(SQLAlchemyConferenceRepository)),
-    challenge_repo: ChallengeRepositoryProtocol = Depends(get_repository(SQLAlchemyChallengeRepository)),
-    task_repo: TaskRepositoryProtocol = Depends(get_repository(SQLAlchemyTaskRepository)),
-    challenge_history_repo: ChallengeHistoryRepositoryProtocol = Depends(
-        get_repository(SQLAlchemyChallengeHistoryRepository)
-    ),
-    task_history_repo: TaskHistoryRepositoryProtocol = Depends(get_repository(SQLAlchemyTaskHistoryRepository)),
-    user_repo: UserRepositoryProtocol = Depends(get_repository(SQLAlchemyUserRepository)),
-):
-    # build the helpers
-    conference_svc = ConferenceService(conference_repo)
-    task_svc = TaskService(task_repo)
-    challenge_hist_svc = ChallengeHistoryService(challenge_history_repo)
-    task_hist_svc = TaskHistoryService(task_history_repo)
-    user_svc = UserService(user_repo)
-    # finally build the main service
-    return ChallengeService(
-        repository=challenge_repo,
-        dto_class=ChallengeResponseAdminDTO,
-        # now pass in all the helpers it needs:
-        conference_service=conference_svc,
-        task_service=task_svc,
-        challenge_history_service=challenge_hist_svc,
-        task_history_service=task_hist_svc,
-        user_service=user_svc,
-    )
+get_challenge_service = _challenge_service_dependency(ChallengeModelBaseOutputDTO)
+get_challenge_service_admin = _challenge_service_dependency(ChallengeResponseAdminDTO)
+# Read-only endpoints, e.g. get and list
+get_challenge_read_service = _challenge_service_dependency(ChallengeModelBaseOutputDTO, read_only=True)
+get_challenge_read_service_admin = _challenge_service_dependency(ChallengeResponseAdminDTO, read_only=True)
@@ -124,3 +124,22 @@ class ChallengeHistoryFilters(BaseModel):
     old_status: Optional[str] = None
     new_status: Optional[str] = None
     version: Optional[int] = None
+
+
+# Models for full-text search
+
+
+class ChallengeSearchSnippetDTO(BaseModel):
+    source: str  # "challenge" or "task"
+    task_id: int | None = None
+    task_name: str | None = None
+    text: str  # HTML escaped, matched terms are wrapped in <b></b>
+
+
+class ChallengeSearchResultDTO(BaseModel):
+    id: int
+    challenge_acronym: str | None = None
+    challenge_name: str | None = None
+    challenge_status: str | None = None
+    score: float  # Higher is more relevant
+    snippets: list[ChallengeSearchSnippetDTO]
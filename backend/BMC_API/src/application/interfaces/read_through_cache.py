@@ -0,0 +1,64 @@
+# backend/BMC_API/src/application/interfaces/read_through_cache.py
+from datetime import timedelta
+from typing import Awaitable, Callable
+
+from loguru import logger
+from pydantic import BaseModel
+
+from BMC_API.src.core.etag import compute_etag
+from BMC_API.src.domain.interfaces.cache_backend import CacheBackend
+
+
+class CachedPayload(BaseModel):
+    """Serialized response body together with its weak entity tag, the body may be sent compressed."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "CachedPayload":
+        return cls(body=body, etag=compute_etag(body, weak=True))
+
+    def encode(self) -> bytes:
+        return self.etag.encode("ascii") + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, value: bytes) -> "CachedPayload":
+        etag, body = value.split(b"\n", 1)
+        return cls(body=body, etag=etag.decode("ascii"))
+
+
+class ReadThroughCache:
+    """
+    Read-through cache of serialized payloads.
+
+    On a miss the loader builds the payload, which is stored with its ETag so
+    hits can be answered without touching the database or serializing again.
+    Cache errors never fail the request, the loader is used instead.
+    """
+
+    def __init__(self, backend: CacheBackend, expire: timedelta | None = None) -> None:
+        self.backend = backend
+        self.expire = expire
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[bytes]]) -> CachedPayload:
+        try:
+            cached = await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+            cached = None
+        if cached is not None:
+            return CachedPayload.decode(cached)
+
+        payload = CachedPayload.from_body(await loader())
+        try:
+            await self.backend.set(key, payload.encode(), expire=self.expire)
+        except Exception as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+        return payload
+
+    async def invalidate(self, *keys: str) -> None:
+        try:
+            await self.backend.delete(*keys)
+        except Exception as e:
+            logger.error(f"Cache invalidation failed for {keys}: {e}")
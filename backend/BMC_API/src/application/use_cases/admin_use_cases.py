@@ -1,6 +1,6 @@
 # application/use_cases/admin_use_cases.py
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Type
 
 from fastapi import BackgroundTasks
@@ -23,7 +23,7 @@ from BMC_API.src.core.config.settings import settings
 from BMC_API.src.core.exceptions import RepositoryException, UserAlreadyExistsException
 from BMC_API.src.core.validation_errors import format_validation_error
 from BMC_API.src.domain.entities.user_model import UserModel
-from BMC_API.src.domain.interfaces.token_cache import TokenCache
+from BMC_API.src.domain.interfaces.token_cache import TokenCache, revoked_user_key
 from BMC_API.src.domain.repositories.user_repository import UserRepositoryProtocol
 
 
@@ -84,6 +84,7 @@ class AdminUserService(BaseService[UserModel, UserResponseAdminDTO]):
         self,
         id: int,
         user_update: Dict,
+        token_cache: Optional[TokenCache] = None,
     ) -> UserResponseAdminDTO:
         if id is None:
             raise ValueError("id must be provided for update.")
@@ -96,9 +97,33 @@ class AdminUserService(BaseService[UserModel, UserResponseAdminDTO]):
             except ValidationError as e:
                 logger.error(e)
                 raise RepositoryException(message=str(e.errors()[0]["msg"]))
-        return await super().update(id=id, model_update=user_update)
+        updated = await super().update(id=id, model_update=user_update)
+        if user_update.get("disabled") is not None:
+            await self.sync_token_revocations([updated], token_cache)
+        return updated
+
+    async def sync_token_revocations(
+        self, users: List[UserResponseAdminDTO], token_cache: Optional[TokenCache] = None
+    ) -> None:
+        """
+        Revoke the refresh tokens of disabled users until the longest-lived of them expires, and lift the
+        revocation of enabled users, in one round trip each. Access tokens of disabled users are rejected by
+        `ensure_current_active_user` anyway. The disabled flag stays authoritative, so a failing cache is logged.
+        """
+        cache = token_cache if token_cache is not None else self.token_cache
+        if cache is None:
+            return
+        now = str(datetime.now())
+        expire = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        try:
+            await cache.set_many({revoked_user_key(user.email): (now, expire) for user in users if user.disabled})
+            await cache.delete_many(revoked_user_key(user.email) for user in users if not user.disabled)
+        except Exception as e:
+            logger.warning(f"Error revoking the refresh tokens of disabled users: {e}")
 
-    async def update_bulk(self, updates: List[Dict[str, Any]]) -> BulkOperationResponse[UserResponseAdminDTO]:
+    async def update_bulk(
+        self, updates: List[Dict[str, Any]], token_cache: Optional[TokenCache] = None
+    ) -> BulkOperationResponse[UserResponseAdminDTO]:
         prepared_updates = []
         failed_results = []
 
@@ -123,6 +148,8 @@ class AdminUserService(BaseService[UserModel, UserResponseAdminDTO]):
             prepared_updates.append({"id": entity_id, **validated_data, "modified_time": datetime.now()})
 
         result = await super().update_bulk(prepared_updates)
+        toggled_ids = {update["id"] for update in prepared_updates if update.get("disabled") is not None}
+        await self.sync_token_revocations([user for user in result.successful if user.id in toggled_ids], token_cache)
         result.failed.extend(failed_results)
         result.detail = f"Bulk update completed: {len(result.successful)} successful, {len(result.failed)} failed."
         return result
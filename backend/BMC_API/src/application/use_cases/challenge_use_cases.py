@@ -13,7 +13,7 @@ from urllib.parse import quote
 from fastapi import BackgroundTasks, HTTPException
 from fastapi.responses import FileResponse, StreamingResponse
 from loguru import logger
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +22,7 @@ from BMC_API.src.application.dto.challenge_dto import (
     ChallengeHistoryModelDTO,
     ChallengeModelBaseOutputDTO,
     ChallengeModelUpdateDTO,
+    ChallengeSearchResultDTO,
     ChallengeUpdateAdminDTO,
 )
 from BMC_API.src.application.dto.task_dto import (
@@ -29,7 +30,7 @@ from BMC_API.src.application.dto.task_dto import (
     TaskModelUpdateDTO,
 )
 from BMC_API.src.application.interfaces.email_scheduler import EmailSchedulerService
-from BMC_API.src.application.use_cases.base_use_cases import BaseService
+from BMC_API.src.application.use_cases.base_use_cases import BaseService, list_adapter
 from BMC_API.src.application.use_cases.challenge_history_use_cases import (
     ChallengeHistoryService,
 )
@@ -39,6 +40,7 @@ from BMC_API.src.application.use_cases.task_use_cases import TaskService
 from BMC_API.src.application.use_cases.user_use_cases import UserService
 from BMC_API.src.core.config.settings import settings
 from BMC_API.src.core.exceptions import RepositoryException, NotFoundException
+from BMC_API.src.core.metrics import metrics
 from BMC_API.src.domain.entities.challenge_model import ChallengeModel
 from BMC_API.src.domain.interfaces.token_cache import TokenCache
 from BMC_API.src.domain.repositories.challenge_repository import (
@@ -379,7 +381,8 @@ class ChallengeService(BaseService[ChallengeModel, ChallengeModelBaseOutputDTO])
                 task_list,
             )
 
-        proposal_file_name = convert_challenge_to_pdf(challenge_to_pdf, task_list_to_pdf)
+        with metrics.pdf_render_duration.time():
+            proposal_file_name = convert_challenge_to_pdf(challenge_to_pdf, task_list_to_pdf)
         file_full_path = os.path.join(settings.submissions_folder, proposal_file_name)
         os.stat(file_full_path)
         return proposal_file_name
@@ -388,13 +391,41 @@ class ChallengeService(BaseService[ChallengeModel, ChallengeModelBaseOutputDTO])
         obj = await super().get_raw(id)
         if obj.histories:
             return (
-                TypeAdapter(List[ChallengeHistoryModelDTO]).validate_python(obj.histories),
+                list_adapter(ChallengeHistoryModelDTO).validate_python(obj.histories),
                 1,
                 len(obj.histories),
             )
         else:
             raise RepositoryException(f"No history found for challenge {id}")
 
+    async def search(self, terms: str, limit: int) -> List[ChallengeSearchResultDTO]:
+        """
+        Full-text search over challenges and their tasks, most relevant first.
+
+        Args:
+            terms: Plain search terms, all of them have to match
+            limit: Maximum number of challenges
+
+        Returns:
+            Matching challenges with their relevance score and text snippets
+        """
+        matches = await self.repository.search(terms, limit)
+        if not matches:
+            return []
+
+        challenges, *_ = await self.repository.list(
+            search_filters={"id__in": [match["challenge_id"] for match in matches]},
+            output_filters=["id", "challenge_acronym", "challenge_name", "challenge_status"],
+        )
+        challenges_by_id = {challenge["id"]: challenge for challenge in challenges}
+        return [
+            ChallengeSearchResultDTO(
+                **challenges_by_id[match["challenge_id"]], score=match["score"], snippets=match["snippets"]
+            )
+            for match in matches
+            if match["challenge_id"] in challenges_by_id
+        ]
+
     async def update_challenge(self, id: int, model_update: Dict) -> ChallengeModelBaseOutputDTO:
         challenge_obj = await self.get_raw(id)
         current_status = challenge_obj.challenge_status
@@ -623,7 +654,8 @@ class ChallengeService(BaseService[ChallengeModel, ChallengeModelBaseOutputDTO])
             proposal_file_name = obj.challenge_file
             file_full_path = os.path.join(settings.submissions_folder, proposal_file_name)
 
-            os.stat(file_full_path)
+            # Known before the response is sent, so the ETag can be checked against If-None-Match
+            stat_result = os.stat(file_full_path)
             headers = {
                 "X-Content-Filename": quote(
                     proposal_file_name
@@ -634,6 +666,7 @@ class ChallengeService(BaseService[ChallengeModel, ChallengeModelBaseOutputDTO])
                 media_type="application/pdf",
                 filename=proposal_file_name,
                 headers=headers,
+                stat_result=stat_result,
             )
         except RuntimeError as e:
             logger.error(str(e))
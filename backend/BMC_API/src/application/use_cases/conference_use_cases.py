@@ -1,34 +1,73 @@
 # application/use_cases/conference_use_cases.py
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Type
 
 from pydantic import BaseModel, ValidationError
 
-from BMC_API.src.api.dependencies.schemas import BulkOperationResponse
+from BMC_API.src.api.dependencies.schemas import (
+    BulkOperationResponse,
+    PaginationResponse,
+)
 from BMC_API.src.application.dto.conference_dto import (
     ConferenceModelBaseOutputDTO,
     ConferenceResponseAdminDTO,
     ConferenceUpdateAdminDTO,
 )
+from BMC_API.src.application.interfaces.read_through_cache import (
+    CachedPayload,
+    ReadThroughCache,
+)
 from BMC_API.src.application.use_cases.base_use_cases import BaseService
+from BMC_API.src.core.config.settings import settings
 from BMC_API.src.core.validation_errors import format_validation_error
 from BMC_API.src.domain.entities.conference_model import ConferenceModel
+from BMC_API.src.domain.interfaces.cache_backend import CacheBackend
 from BMC_API.src.domain.interfaces.token_cache import TokenCache
 from BMC_API.src.domain.repositories.conference_repository import (
     ConferenceRepositoryProtocol,
 )
 
 
+OPEN_CONFERENCES_CACHE_KEY = "conferences:open_for_submission"
+
+
 class ConferenceService(BaseService[ConferenceModel, ConferenceModelBaseOutputDTO]):
     def __init__(
         self,
         repository: ConferenceRepositoryProtocol,
         dto_class: Optional[Type[BaseModel]] = None,
         token_cache: Optional[TokenCache] = None,
+        cache_backend: Optional[CacheBackend] = None,
     ) -> None:
         super().__init__(repository, dto_class)
         self.token_cache = token_cache
+        self.listing_cache = (
+            ReadThroughCache(cache_backend, expire=timedelta(seconds=settings.conference_cache_ttl_in_sec))
+            if cache_backend is not None
+            else None
+        )
+
+    async def list_conferences_open_for_submission_cached(self) -> CachedPayload:
+        """
+        Serialized listing of all conferences open for submission, served from the listing cache when possible.
+        Empty listings raise NotFoundException and are not cached.
+        """
+
+        async def load() -> bytes:
+            entities, total_pages, total_records = await self.list_conferences_open_for_submission_limited(
+                offset=0, limit=0
+            )
+            response = PaginationResponse(total_pages=total_pages, total_records=total_records, content=entities)
+            return response.model_dump_json().encode("utf-8")
+
+        if self.listing_cache is None:
+            return CachedPayload.from_body(await load())
+        return await self.listing_cache.get_or_load(OPEN_CONFERENCES_CACHE_KEY, load)
+
+    async def invalidate_listing_cache(self) -> None:
+        if self.listing_cache is not None:
+            await self.listing_cache.invalidate(OPEN_CONFERENCES_CACHE_KEY)
 
     async def list_conferences_open_for_submission_limited(
         self, offset: int = 0, limit: int = 50
@@ -61,6 +100,27 @@ class ConferenceService(BaseService[ConferenceModel, ConferenceModelBaseOutputDT
             prepared_updates.append({"id": entity_id, **validated_data, "modified_time": datetime.now()})
 
         result = await super().update_bulk(updates=prepared_updates)
+        await self.invalidate_listing_cache()
         result.failed.extend(failed_results)
         result.detail = f"Bulk update completed: {len(result.successful)} successful, {len(result.failed)} failed."
         return result
+
+    async def create(self, model_create: Dict) -> ConferenceResponseAdminDTO:
+        created = await super().create(model_create=model_create)
+        await self.invalidate_listing_cache()
+        return created
+
+    async def update(self, id: int, model_update: Dict) -> ConferenceResponseAdminDTO:
+        updated = await super().update(id=id, model_update=model_update)
+        await self.invalidate_listing_cache()
+        return updated
+
+    async def delete(self, id: int) -> Dict:
+        result = await super().delete(id=id)
+        await self.invalidate_listing_cache()
+        return result
+
+    async def delete_bulk(self, ids: List[int]) -> BulkOperationResponse[Any]:
+        result = await super().delete_bulk(ids=ids)
+        await self.invalidate_listing_cache()
+        return result
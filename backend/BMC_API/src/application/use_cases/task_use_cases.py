@@ -4,7 +4,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Type
 
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel
 
 from BMC_API.src.api.dependencies.schemas import BulkOperationResponse
 from BMC_API.src.application.dto.task_dto import (
@@ -12,7 +12,7 @@ from BMC_API.src.application.dto.task_dto import (
     TaskModelBaseOutputDTO,
     TaskUpdateAdminDTO,
 )
-from BMC_API.src.application.use_cases.base_use_cases import BaseService
+from BMC_API.src.application.use_cases.base_use_cases import BaseService, list_adapter
 from BMC_API.src.core.exceptions import RepositoryException
 from BMC_API.src.domain.entities.task_model import TaskModel
 from BMC_API.src.domain.interfaces.token_cache import TokenCache
@@ -34,7 +34,7 @@ class TaskService(BaseService[TaskModel, TaskModelBaseOutputDTO]):
         obj = await super().get_raw(id)
         if obj.histories:
             return (
-                TypeAdapter(List[TaskHistoryModelDTO]).validate_python(obj.histories),
+                list_adapter(TaskHistoryModelDTO).validate_python(obj.histories),
                 1,
                 len(obj.histories),
             )
@@ -1,7 +1,7 @@
 # application/use_cases/user_use_cases.py
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Type
+from typing import Dict, Optional, Tuple, Type
 
 from fastapi import BackgroundTasks
 
@@ -30,7 +30,7 @@ from BMC_API.src.core.exceptions import (
     UserNotFoundException,
 )
 from BMC_API.src.domain.entities.user_model import UserModel
-from BMC_API.src.domain.interfaces.token_cache import TokenCache
+from BMC_API.src.domain.interfaces.token_cache import TokenCache, revoked_user_key
 from BMC_API.src.domain.repositories.user_repository import UserRepositoryProtocol
 
 
@@ -157,9 +157,14 @@ class UserService(BaseService[UserModel, UserResponseDTO]):
         if refresh_token_type is not None and refresh_token_type != "refresh":
             raise InvalidTokenException(message="Invalid refresh token")
 
-        # 3. Check if refresh_token is stored Redis database before
+        # 3. Check if refresh_token is stored Redis database before, or the user was disabled by an admin
         cache = token_cache if token_cache is not None else self.token_cache
-        is_refresh_token_blacklisted = await cache.get_token(refresh_token)
+        if email is not None:
+            is_refresh_token_blacklisted, is_user_revoked = await cache.get_many(
+                [refresh_token, revoked_user_key(email)]
+            )
+        else:
+            is_refresh_token_blacklisted, is_user_revoked = await cache.get_token(refresh_token), None
         if is_refresh_token_blacklisted:
             """
             If someone is trying to use blacklisted token, this can mean that the token is stolen. In this case user is disabled. Admin is notified about the situation
@@ -167,17 +172,35 @@ class UserService(BaseService[UserModel, UserResponseDTO]):
             if email is not None:
                 user, *_ = await user_service_admin.list(search_filters={"email": email})
                 user_id = user[0].id
-                await user_service_admin.update(id=user_id, user_update={"disabled": True})
+                await user_service_admin.update(id=user_id, user_update={"disabled": True}, token_cache=cache)
+
+                # Revoke the access token presented together with the stolen refresh token as well
+                await cache.set_many(self._blacklist_entries(token_data))
 
                 # TODO: Send admin an e-mail about this
                 logger.warning(f"User [{email}] disabled because of usage of blacklisted token [{refresh_token}]!")
 
             raise InvalidTokenException(message="Invalid refresh token")  # Just send general error, don't give detail.
+        if is_user_revoked:
+            raise InvalidTokenException(message="Invalid refresh token")
 
         # 4. If to issue found, continue token refreshing procedure
         bearer_tokens: Token = auth.generate_bearer_tokens(TokenData(email=email))
         return bearer_tokens
 
+    @staticmethod
+    def _blacklist_entries(token_data: Token) -> Dict[str, Tuple[str, timedelta]]:
+        """
+        Build the TokenCache entries that blacklist the given token pair until each token expires.
+        """
+        now = str(datetime.now())
+        entries = {}
+        if token_data.access_token:
+            entries[token_data.access_token] = (now, timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+        if token_data.refresh_token:
+            entries[token_data.refresh_token] = (now, timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS))
+        return entries
+
     async def logout_user(self, token_data: Token, token_cache: TokenCache = None) -> None:
         access_token_payload = auth.decode_token(token_data.access_token)
         access_token_type = access_token_payload.get("type", None)
@@ -193,16 +216,7 @@ class UserService(BaseService[UserModel, UserResponseDTO]):
 
         cache = token_cache if token_cache is not None else self.token_cache
         try:
-            await cache.set_token(
-                key=token_data.access_token,
-                value=str(datetime.now()),
-                expire=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
-            )
-            await cache.set_token(
-                key=token_data.refresh_token,
-                value=str(datetime.now()),
-                expire=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
-            )
+            await cache.set_many(self._blacklist_entries(token_data))
         except Exception as e:
             raise RepositoryException("Error setting token in cache") from e
 
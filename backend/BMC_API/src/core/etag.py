@@ -0,0 +1,29 @@
+import hashlib
+
+
+def compute_etag(body: bytes, weak: bool = False) -> str:
+    """Return a quoted entity tag for the given response body."""
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def entity_etag(body: bytes) -> str:
+    """
+    Weak entity tag of the serialized DTO of a get endpoint. It covers every field, e.g. the last login time
+    of a user that changes without its modification time.
+    """
+    return compute_etag(body, weak=True)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match request header against an entity tag.
+
+    Uses the weak comparison required for If-None-Match (RFC 9110, 13.1.2).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque_tag for candidate in if_none_match.split(","))
@@ -109,6 +109,17 @@ class InvalidTokenException(RepositoryException):
         super().__init__(message)
 
 
+class SearchUnavailableException(RepositoryException):
+    """Exception raised for full-text searches on databases without a search index."""
+
+    default_message: str = "Full-text search is only available for SQLite databases."
+
+    def __init__(self, message: Optional[str] = None) -> None:
+        if message is None:
+            message = self.default_message
+        super().__init__(message)
+
+
 class ConferenceLockedException(RepositoryException):
     """Exception raised if conference is not open for submissions."""
 
@@ -0,0 +1,140 @@
+# backend/BMC_API/src/core/jobs.py
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, List
+
+from loguru import logger
+
+from BMC_API.src.core.config.settings import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # Windows, every worker runs the jobs
+
+
+class LeaderLock:
+    """
+    Inter-process leader election with an exclusive, non-blocking file lock.
+
+    The first worker that locks the file becomes the leader and keeps the lock for its lifetime.
+    The OS releases it when the process exits, so another worker takes over on its next attempt.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.is_leader = False
+        self._file = None
+
+    def try_acquire(self) -> bool:
+        if self.is_leader:
+            return True
+        if fcntl is None:  # pragma: no cover
+            self.is_leader = True
+            return True
+
+        lock_file = open(self.path, "a+")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._file = lock_file
+        self.is_leader = True
+        logger.info(f"Worker {os.getpid()} is the leader for periodic jobs.")
+        return True
+
+    def leader_pid(self) -> int | None:
+        """PID of the current leader, as written into the lock file."""
+        try:
+            with open(self.path) as lock_file:
+                return int(lock_file.read().strip())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def release(self) -> None:
+        if self._file is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        self.is_leader = False
+
+
+class JobHistory:
+    """
+    Recent job runs, kept in a JSON file so every worker can read what the leader did.
+    The methods do blocking file I/O, call them in a worker thread from async code.
+    """
+
+    def __init__(self, path: str, size: int) -> None:
+        self.path = path
+        self.size = size
+        self._lock = threading.Lock()  # Jobs finishing together must not drop each other's runs
+
+    def read(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.path) as history_file:
+                return json.load(history_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def append(self, run: Dict[str, Any]) -> None:
+        with self._lock:
+            runs = (self.read() + [run])[-self.size :]
+            temp_path = f"{self.path}.{uuid.uuid4().hex}.tmp"
+            with open(temp_path, "w") as history_file:
+                json.dump(runs, history_file)
+            os.replace(temp_path, self.path)
+
+
+job_leader = LeaderLock(settings.jobs_lock_file)
+job_history = JobHistory(settings.jobs_history_file, settings.jobs_history_size)
+
+
+def leader_job(name: str) -> Callable[[Callable[[], Awaitable[Any]]], Callable[[], Awaitable[None]]]:
+    """
+    Decorator for periodic jobs. The job only runs in the leader worker, and each run is recorded
+    with its duration and outcome. Put it below `repeat_every`, so followers retry the election every period.
+
+    :param name: job name in the history.
+    """
+
+    def decorator(func: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[None]]:
+        @wraps(func)
+        async def wrapper() -> None:
+            if not job_leader.try_acquire():
+                logger.debug(f"{name} (periodic job) skipped, another worker is the leader.")
+                return
+
+            started = datetime.now()
+            start = time.perf_counter()
+            error = None
+            try:
+                await func()
+            except Exception as e:
+                error = str(e)
+                raise
+            finally:
+                run = {
+                    "job": name,
+                    "started": started.isoformat(),
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                    "status": "failed" if error is not None else "succeeded",
+                    "error": error,
+                    "worker_pid": os.getpid(),
+                }
+                await asyncio.to_thread(job_history.append, run)
+
+        return wrapper
+
+    return decorator
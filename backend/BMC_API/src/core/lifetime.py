@@ -1,5 +1,6 @@
 # backend/BMC_API/src/core/lifetime.py
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi_utilities import repeat_every
@@ -17,9 +18,12 @@ from opentelemetry.sdk.resources import (
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.trace import set_tracer_provider
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from BMC_API.src.core.config.settings import settings
+from BMC_API.src.core.jobs import job_leader, leader_job
+from BMC_API.src.core.metrics import monitor_event_loop_lag
+from BMC_API.src.infrastructure.cache.backends import RedisCacheBackend
 from BMC_API.src.infrastructure.external_services.redis.lifetime import (
     init_redis,
     shutdown_redis,
@@ -27,7 +31,12 @@ from BMC_API.src.infrastructure.external_services.redis.lifetime import (
 from BMC_API.src.infrastructure.persistence.dependencies import (
     backup_database,
     clean_database_backups,
+    snapshot_database,
 )
+from BMC_API.src.infrastructure.persistence.engine import create_db_engine, create_read_engine
+from BMC_API.src.infrastructure.persistence.query_log import instrument_engine, instrument_request_query_stats
+from BMC_API.src.infrastructure.persistence.sqlite import verify_sqlite_pragmas
+from BMC_API.src.infrastructure.rate_limit.backends import RedisRateLimitBackend
 from BMC_API.src.initial_data import create_initial_data
 
 
@@ -41,7 +50,11 @@ def _setup_db(app: FastAPI) -> None:  # pragma: no cover
 
     :param app: fastAPI application.
     """
-    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo, echo_pool=False)
+    engine = create_db_engine(echo_pool=False)
+    if app.state.query_log is not None:
+        instrument_engine(engine, app.state.query_log)
+    if settings.metrics_enabled:
+        instrument_request_query_stats(engine)
     session_factory = async_sessionmaker(
         engine,
         expire_on_commit=False,
@@ -49,6 +62,17 @@ def _setup_db(app: FastAPI) -> None:  # pragma: no cover
     app.state.db_engine = engine
     app.state.db_session_factory = session_factory
 
+    # Sessions of read-only endpoints, the writer serves them if there is no read engine
+    read_engine = create_read_engine(echo_pool=False)
+    if read_engine is not None and app.state.query_log is not None:
+        instrument_engine(read_engine, app.state.query_log)
+    if read_engine is not None and settings.metrics_enabled:
+        instrument_request_query_stats(read_engine)
+    app.state.db_read_engine = read_engine
+    app.state.db_read_session_factory = (
+        async_sessionmaker(read_engine, expire_on_commit=False) if read_engine is not None else session_factory
+    )
+
 
 def setup_opentelemetry(app: FastAPI) -> None:  # pragma: no cover
     """
@@ -117,13 +141,19 @@ def stop_opentelemetry(app: FastAPI) -> None:  # pragma: no cover
 
 
 @repeat_every(seconds=settings.db_file_backup_period_in_sec, logger=logger)
+@leader_job("backup_database")
 async def backup_database_task():
     logger.info("backup_database (periodic job) started.")
-    await backup_database()
+    # Incremental snapshots are SQLite page copies, other backends are always dumped in full
+    if settings.db_backup_mode == "incremental" and settings.db_backend == "sqlite":
+        await snapshot_database()
+    else:
+        await backup_database()
     logger.info("backup_database (periodic job) completed.")
 
 
 @repeat_every(seconds=settings.db_file_backups_clean_period_in_sec, logger=logger)
+@leader_job("clean_database_backups")
 async def clean_database_backups_task():
     logger.info("clean_database_backups (periodic job) started.")
     await clean_database_backups(age_limit=settings.db_file_backups_age_limit_in_day)
@@ -141,15 +171,39 @@ async def lifespan(app: FastAPI):
     # 1. Startup actions
     logger.info(f"Server starting on root folder: {settings.root_dir}")
     _setup_db(app)
+    await verify_sqlite_pragmas(app.state.db_engine)
     await create_initial_data(app)
     setup_opentelemetry(app)
     init_redis(app)
+    if settings.cache_backend == "redis":
+        app.state.cache_backend = RedisCacheBackend(app.state.redis)
+        if app.state.repository_cache is not None:
+            app.state.repository_cache.backend = RedisCacheBackend(app.state.redis, prefix="dao:")
+    if settings.rate_limit_backend == "redis":
+        app.state.limiter.backend = RedisRateLimitBackend(
+            app.state.redis,
+            fallback=app.state.limiter.backend,
+            timeout=settings.rate_limit_redis_timeout_in_ms / 1000,
+            retry_after=settings.rate_limit_redis_retry_in_sec,
+        )
     await backup_database_task()
     await clean_database_backups_task()
+    monitors = []
+    if settings.metrics_enabled:
+        monitors.append(asyncio.create_task(monitor_event_loop_lag(settings.metrics_event_loop_lag_interval_in_sec)))
+    if app.state.loop_watchdog is not None:
+        monitors.append(asyncio.create_task(app.state.loop_watchdog.run()))
     logger.info("Server started successfully")
     yield
     # 2. Shutdown actions
+    for monitor in monitors:
+        monitor.cancel()
+        with suppress(asyncio.CancelledError):
+            await monitor
+    job_leader.release()
     await app.state.db_engine.dispose()
+    if app.state.db_read_engine is not None:
+        await app.state.db_read_engine.dispose()
     await shutdown_redis(app)
     stop_opentelemetry(app)
     logger.info("Server shutdown successfully")
@@ -1,9 +1,11 @@
+import contextvars
 import logging
 import sys
-from typing import Any, Union
+from typing import Any, Tuple, Union
 
 from loguru import logger
-from opentelemetry.trace import INVALID_SPAN, INVALID_SPAN_CONTEXT, get_current_span
+from opentelemetry.context import Context as TraceContext
+from opentelemetry.trace import INVALID_SPAN, INVALID_SPAN_CONTEXT, Span, get_current_span
 
 from BMC_API.src.core.config.settings import settings
 
@@ -42,6 +44,37 @@ class InterceptHandler(logging.Handler):
         )
 
 
+def _span_ids(span: Span) -> Tuple[Union[str, int], Union[str, int]]:
+    if span != INVALID_SPAN:
+        span_context = span.get_span_context()
+        if span_context != INVALID_SPAN_CONTEXT:
+            return format(span_context.trace_id, "032x"), format(span_context.span_id, "016x")
+    return 0, 0
+
+
+def current_trace_ids() -> Tuple[Union[str, int], Union[str, int]]:
+    """
+    Returns trace and span id of the current OpenTelemetry span as hex strings, 0 outside of a span.
+
+    :return: tuple of trace id and span id.
+    """
+    return _span_ids(get_current_span())
+
+
+def context_trace_ids(context: contextvars.Context) -> Tuple[Union[str, int], Union[str, int]]:
+    """
+    Returns trace and span id of the OpenTelemetry span that is current in another context,
+    e.g. the context of a task running on the event loop while it is inspected from another thread.
+
+    :param context: context of a task, see `asyncio.Task.get_context`.
+    :return: tuple of trace id and span id.
+    """
+    for value in context.values():
+        if isinstance(value, TraceContext):
+            return _span_ids(get_current_span(value))
+    return 0, 0
+
+
 def record_formatter(record: dict[str, Any]) -> str:  # pragma: no cover
     """
     Formats the record.
@@ -61,14 +94,7 @@ def record_formatter(record: dict[str, Any]) -> str:  # pragma: no cover
         "- <level>{message}</level>\n"
     )
 
-    span = get_current_span()
-    record["extra"]["span_id"] = 0
-    record["extra"]["trace_id"] = 0
-    if span != INVALID_SPAN:
-        span_context = span.get_span_context()
-        if span_context != INVALID_SPAN_CONTEXT:
-            record["extra"]["span_id"] = format(span_context.span_id, "016x")
-            record["extra"]["trace_id"] = format(span_context.trace_id, "032x")
+    record["extra"]["trace_id"], record["extra"]["span_id"] = current_trace_ids()
 
     if record["exception"]:
         log_format = f"{log_format}{{exception}}"
@@ -0,0 +1,163 @@
+# backend/BMC_API/src/core/loop_watchdog.py
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Literal, Optional
+
+from loguru import logger
+from starlette.requests import Request
+
+from BMC_API.src.core.logging.logging import context_trace_ids
+
+_APPLICATION_PACKAGE = f"{os.sep}BMC_API{os.sep}"
+
+
+def short_path(filename: str) -> str:
+    """Path of application modules from the package on, e.g. BMC_API/src/core/jobs.py."""
+    index = filename.rfind(_APPLICATION_PACKAGE)
+    return filename[index + 1 :] if index >= 0 else filename
+
+
+def _location(frame: traceback.FrameSummary) -> str:
+    return f"{short_path(frame.filename)}:{frame.lineno} in {frame.name}"
+
+
+class LoopWatchdog:
+    """
+    Detector of callbacks that block the event loop of the worker.
+
+    A heartbeat task wakes up every `interval` seconds and a watchdog thread checks that it does. When a wake-up
+    is overdue by more than `threshold` seconds, a single callback keeps the loop busy, so the thread captures
+    the stack of the loop thread and the task running on it. Once the loop resumes, the block is logged with
+    its duration and the trace id of the task, and added to a report grouped by the innermost application frame
+    of the stack, e.g. the line calling bcrypt or reportlab.
+    """
+
+    def __init__(self, threshold: float, interval: float = 0.02, report_size: int = 50, stack_limit: int = 40) -> None:
+        """
+        :param threshold: seconds a callback may block the loop before its stack is captured.
+        :param interval: seconds between wake-ups of the heartbeat.
+        :param report_size: locations kept in the report, those with the least blocked time are dropped first.
+        :param stack_limit: innermost frames of a captured stack.
+        """
+        self.threshold = threshold
+        self.interval = interval
+        self.report_size = report_size
+        self.stack_limit = stack_limit
+        self.blocks_detected = 0
+        self.max_lag = 0.0
+        self._blocks: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._deadline: Optional[float] = None  # Monotonic time the heartbeat is due to wake up
+
+    async def run(self) -> None:
+        """
+        Heartbeat of the event loop, runs until cancelled. The watchdog thread runs as long as the heartbeat.
+        """
+        loop = asyncio.get_running_loop()
+        stop = threading.Event()
+        watcher = threading.Thread(
+            target=self._watch, args=(loop, threading.get_ident(), stop), name="event-loop-watchdog", daemon=True
+        )
+        watcher.start()
+        try:
+            while True:
+                self._deadline = time.monotonic() + self.interval
+                await asyncio.sleep(self.interval)
+                lag = max(0.0, time.monotonic() - self._deadline)
+                self.max_lag = max(self.max_lag, lag)
+                with self._lock:
+                    pending, self._pending = self._pending, None
+                # A stack captured just as the loop resumed belongs to a shorter block
+                if pending is not None and lag >= self.threshold:
+                    self._record(pending, lag)
+        finally:
+            self._deadline = None
+            stop.set()
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, loop_thread_id: int, stop: threading.Event) -> None:
+        captured_deadline = None
+        while not stop.wait(min(self.interval, self.threshold / 4)):
+            deadline = self._deadline
+            if deadline is None or deadline == captured_deadline or time.monotonic() - deadline < self.threshold:
+                continue
+            frame = sys._current_frames().get(loop_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame, limit=self.stack_limit)
+            del frame
+            task = asyncio.current_task(loop)
+            trace_id, span_id = context_trace_ids(task.get_context()) if task is not None else (0, 0)
+            with self._lock:
+                self._pending = {
+                    "stack": stack,
+                    "task": task.get_name() if task is not None else None,
+                    "trace_id": trace_id,
+                    "span_id": span_id,
+                }
+            captured_deadline = deadline
+
+    def _record(self, pending: Dict[str, Any], lag: float) -> None:
+        stack: List[traceback.FrameSummary] = pending["stack"]
+        application_frames = [frame for frame in stack if _APPLICATION_PACKAGE in frame.filename]
+        location = _location((application_frames or stack)[-1])
+        formatted_stack = [_location(frame) for frame in stack]
+        lag_ms = lag * 1000
+        self.blocks_detected += 1
+        logger.warning(
+            f"Event loop blocked for {lag_ms:.0f} ms at {location} (task={pending['task']}, "
+            f"trace_id={pending['trace_id']}, span_id={pending['span_id']})\n" + "\n".join(formatted_stack)
+        )
+
+        entry = self._blocks.get(location)
+        if entry is None:
+            entry = self._blocks[location] = {"location": location, "count": 0, "total_ms": 0.0, "max_ms": 0.0}
+        entry["count"] += 1
+        entry["total_ms"] += lag_ms
+        entry["last_seen"] = datetime.now(timezone.utc)
+        if lag_ms >= entry["max_ms"]:
+            entry.update(
+                max_ms=lag_ms,
+                stack=formatted_stack,
+                task=pending["task"],
+                trace_id=pending["trace_id"],
+                span_id=pending["span_id"],
+            )
+        if len(self._blocks) > self.report_size:
+            least = min(self._blocks.values(), key=lambda block: block["total_ms"])
+            del self._blocks[least["location"]]
+
+    def top(self, limit: int = 10, order_by: Literal["total", "max", "count"] = "total") -> List[Dict[str, Any]]:
+        """
+        Blocking locations, ranked by their total or longest blocked time, or by the number of blocks.
+
+        :param limit: number of locations.
+        :param order_by: "total", "max" or "count".
+        :return: list of location statistics, with the stack and trace of the longest block.
+        """
+        key = "count" if order_by == "count" else f"{order_by}_ms"
+        ranked = sorted(self._blocks.values(), key=lambda block: block[key], reverse=True)
+        return [
+            {**block, "total_ms": round(block["total_ms"], 3), "max_ms": round(block["max_ms"], 3)}
+            for block in ranked[:limit]
+        ]
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self.blocks_detected = 0
+        self.max_lag = 0.0
+
+
+def get_loop_watchdog(request: Request) -> LoopWatchdog | None:
+    """
+    Returns the event loop watchdog of the worker, None if `event_loop_watchdog_enabled` is off.
+
+    :param request: current request.
+    :returns: loop watchdog.
+    """
+    return request.app.state.loop_watchdog
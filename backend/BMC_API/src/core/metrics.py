@@ -0,0 +1,111 @@
+# backend/BMC_API/src/core/metrics.py
+import asyncio
+import os
+from contextvars import ContextVar
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.multiprocess import MultiProcessCollector
+
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class QueryStats:
+    """Statements executed while handling one request."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+
+
+# Statements of the current request, set by `MetricsMiddleware`, None outside of requests
+request_query_stats: ContextVar[QueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+class Metrics:
+    """
+    Metrics of the application, shared by all modules of the worker. They are kept in a registry of their own,
+    so the metrics endpoint serves the application metrics only and not those of the default registry of
+    `prometheus_client`. In multiprocess mode, see `scrape_registry`, the values are written to the files of
+    the worker instead.
+    """
+
+    def __init__(self) -> None:
+        self.registry = CollectorRegistry()
+        self.http_request_duration = Histogram(
+            "bmc_http_request_duration_seconds",
+            "Duration of HTTP requests until the last byte of the response was sent.",
+            ("method", "route", "status"),
+            registry=self.registry,
+        )
+        self.http_requests_in_flight = Gauge(
+            "bmc_http_requests_in_flight",
+            "HTTP requests currently being handled.",
+            registry=self.registry,
+            multiprocess_mode="livesum",
+        )
+        self.db_queries_per_request = Histogram(
+            "bmc_db_queries_per_request",
+            "Database statements executed per HTTP request.",
+            ("route",),
+            buckets=COUNT_BUCKETS,
+            registry=self.registry,
+        )
+        self.db_query_duration_per_request = Histogram(
+            "bmc_db_query_duration_per_request_seconds",
+            "Total execution time of the database statements of an HTTP request.",
+            ("route",),
+            registry=self.registry,
+        )
+        self.pdf_render_duration = Histogram(
+            "bmc_pdf_render_duration_seconds", "Duration of rendering challenge proposal PDFs.", registry=self.registry
+        )
+        self.emails = Counter(
+            "bmc_emails",
+            "Emails handed to the mail server, by template and outcome.",
+            ("template", "outcome"),
+            registry=self.registry,
+        )
+        self.redis_command_duration = Histogram(
+            "bmc_redis_command_duration_seconds",
+            "Duration of redis commands.",
+            ("command",),
+            buckets=FAST_BUCKETS,
+            registry=self.registry,
+        )
+        self.event_loop_lag = Histogram(
+            "bmc_event_loop_lag_seconds",
+            "Delay of a scheduled wake-up of the event loop, the time other callbacks blocked it.",
+            buckets=FAST_BUCKETS,
+            registry=self.registry,
+        )
+
+
+metrics = Metrics()
+
+
+def scrape_registry() -> CollectorRegistry:
+    """
+    Registry served to scrapers. With PROMETHEUS_MULTIPROC_DIR set, e.g. by the gunicorn runner, every worker
+    writes its metrics to files in that directory and the metrics of all workers are aggregated from them,
+    whichever worker handles the scrape. Otherwise the metrics of this process.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return metrics.registry
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    return registry
+
+
+async def monitor_event_loop_lag(interval: float) -> None:
+    """
+    Sample the event loop lag every `interval` seconds: the time a sleep overshoots its deadline is the time
+    the loop was busy with other callbacks. Runs until cancelled.
+
+    :param interval: seconds between samples.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = loop.time() + interval
+        await asyncio.sleep(interval)
+        metrics.event_loop_lag.observe(max(0.0, loop.time() - scheduled))
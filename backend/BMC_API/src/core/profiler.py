@@ -0,0 +1,279 @@
+# backend/BMC_API/src/core/profiler.py
+import asyncio
+import asyncio.runners
+import concurrent.futures.thread
+import json
+import queue
+import selectors
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import CodeType, FrameType
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple
+
+from starlette.requests import Request
+
+from BMC_API.src.core.loop_watchdog import short_path
+
+ProfileFormat = Literal["speedscope", "collapsed"]
+
+# Frames of a sample, outermost first: code objects of functions, or labels of threads and awaits
+Stack = Tuple[CodeType | str, ...]
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Label of the leaf of samples taken while the profiled task was suspended, e.g. waiting for the database
+AWAIT_FRAME = "(await)"
+
+# Modules whose frames on top of a stack mean that the thread is waiting: the selector of the event loop,
+# a C event loop like uvloop called from asyncio.run, or threads of the pool waiting for work
+_IDLE_FILES = frozenset(
+    module.__file__ for module in (selectors, asyncio.runners, threading, queue, concurrent.futures.thread)
+)
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while the worker is already being profiled."""
+
+
+def _frame_label(frame: CodeType | str) -> str:
+    if isinstance(frame, str):
+        return frame
+    return f"{frame.co_qualname} ({short_path(frame.co_filename)}:{frame.co_firstlineno})"
+
+
+def _thread_stack(frame: Optional[FrameType], limit: int, root: Optional[FrameType] = None) -> Optional[Stack]:
+    """
+    Functions of the stack of a thread. With `root`, only the frames from `root` on, None if `root` is not
+    in the stack.
+    """
+    codes: List[CodeType] = []
+    while frame is not None and len(codes) < limit:
+        codes.append(frame.f_code)
+        if frame is root:
+            break
+        frame = frame.f_back
+    else:
+        if root is not None:
+            return None
+    codes.reverse()
+    return tuple(codes)
+
+
+def _await_stack(coroutine: Any, limit: int) -> Stack:
+    """Functions of the chain of awaits of a suspended coroutine, the outermost first."""
+    codes: List[CodeType] = []
+    while coroutine is not None and len(codes) < limit:
+        frame = getattr(coroutine, "cr_frame", None) or getattr(coroutine, "gi_frame", None)
+        if frame is None:
+            break
+        codes.append(frame.f_code)
+        coroutine = getattr(coroutine, "cr_await", None) or getattr(coroutine, "gi_yieldfrom", None)
+    return (*codes, AWAIT_FRAME)
+
+
+class Profile:
+    """Stack samples of a profile, aggregated by identical stacks."""
+
+    def __init__(self, name: str, interval: float) -> None:
+        """
+        :param name: description of the profiled work, e.g. the request.
+        :param interval: seconds between samples.
+        """
+        self.name = name
+        self.interval = interval
+        self.started_at = datetime.now(timezone.utc)
+        self.duration = 0.0
+        self.sample_count = 0
+        self.idle_count = 0  # Samples of waiting threads, left out of the profile
+        self._stacks: Dict[Stack, int] = {}
+
+    def add(self, stack: Stack) -> None:
+        self._stacks[stack] = self._stacks.get(stack, 0) + 1
+        self.sample_count += 1
+
+    def stacks(self) -> List[Tuple[List[str], int]]:
+        """Sampled stacks as lists of "function (path:line)" labels with their number of samples."""
+        return [([_frame_label(frame) for frame in stack], count) for stack, count in self._stacks.items()]
+
+    def collapsed(self) -> str:
+        """
+        Profile in the collapsed stack format of FlameGraph, one "outer;inner count" line per stack,
+        which flamegraph.pl, speedscope and most flame graph viewers read.
+        """
+        lines = [";".join(label.replace(";", ":") for label in labels) + f" {count}" for labels, count in self.stacks()]
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self) -> Dict[str, Any]:
+        """Profile in the file format of speedscope, weighted by the sampled milliseconds."""
+        frame_indexes: Dict[str, int] = {}
+        frames: List[Dict[str, Any]] = []
+        samples: List[List[int]] = []
+        weights: List[float] = []
+        for stack, count in self._stacks.items():
+            sample = []
+            for frame in stack:
+                label = _frame_label(frame)
+                if label not in frame_indexes:
+                    frame_indexes[label] = len(frames)
+                    if isinstance(frame, str):
+                        frames.append({"name": frame})
+                    else:
+                        frames.append(
+                            {
+                                "name": frame.co_qualname,
+                                "file": short_path(frame.co_filename),
+                                "line": frame.co_firstlineno,
+                            }
+                        )
+                sample.append(frame_indexes[label])
+            samples.append(sample)
+            weights.append(round(count * self.interval * 1000, 3))
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": self.name,
+            "exporter": "BMC_API",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": self.name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": round(sum(weights), 3),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+    def render(self, profile_format: ProfileFormat) -> Tuple[bytes, str, str]:
+        """
+        :param profile_format: "speedscope" or "collapsed".
+        :return: content, media type and file name of the profile.
+        """
+        stamp = self.started_at.strftime("%Y%m%dT%H%M%SZ")
+        if profile_format == "collapsed":
+            return self.collapsed().encode(), "text/plain; charset=utf-8", f"profile-{stamp}.collapsed.txt"
+        return json.dumps(self.speedscope()).encode(), "application/json", f"profile-{stamp}.speedscope.json"
+
+
+class SamplingProfiler:
+    """
+    Sampling profiler of the worker. While a profile is taken, a thread captures the stack of the event loop
+    thread, or of all threads, every `interval` seconds. It neither traces function calls nor installs hooks,
+    so the profiled code runs at full speed, and no thread runs between profiles. One profile is taken at a time.
+    """
+
+    def __init__(self, interval: float, max_duration: float, max_depth: int = 128) -> None:
+        """
+        :param interval: default seconds between samples.
+        :param max_duration: seconds after which a profile stops sampling, even if it was not stopped.
+        :param max_depth: innermost frames of a sampled stack.
+        """
+        self.interval = interval
+        self.max_duration = max_duration
+        self.max_depth = max_depth
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    @contextmanager
+    def session(
+        self,
+        name: str,
+        interval: Optional[float] = None,
+        threads: Literal["loop", "all"] = "loop",
+        include_idle: bool = False,
+        task: Optional[asyncio.Task] = None,
+    ) -> Iterator[Profile]:
+        """
+        Sample the worker until the block exits or `max_duration` passes. Must be entered on the event loop thread.
+
+        :param name: description of the profiled work.
+        :param interval: seconds between samples, `interval` of the profiler by default.
+        :param threads: "loop" for the event loop thread, "all" for every thread, e.g. those of the thread pool.
+        :param include_idle: keep samples of threads waiting for work.
+        :param task: only sample this task, e.g. the task of a request. While it is suspended, the sample
+            is its chain of awaits.
+        :raises ProfilerBusyError: if a profile is already being taken.
+        :return: profile, complete when the block exits.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile of this worker is already being taken.")
+        profile = Profile(name, interval or self.interval)
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=self._sample,
+            args=(profile, stop, threading.get_ident(), threads, include_idle, task),
+            name="sampling-profiler",
+            daemon=True,
+        )
+        start = time.perf_counter()
+        try:
+            sampler.start()
+            yield profile
+        finally:
+            stop.set()
+            sampler.join()
+            profile.duration = min(time.perf_counter() - start, self.max_duration)
+            self._lock.release()
+
+    def _sample(
+        self,
+        profile: Profile,
+        stop: threading.Event,
+        loop_thread_id: int,
+        threads: Literal["loop", "all"],
+        include_idle: bool,
+        task: Optional[asyncio.Task],
+    ) -> None:
+        own_thread_id = threading.get_ident()
+        deadline = time.monotonic() + self.max_duration
+        while not stop.wait(profile.interval) and time.monotonic() < deadline:
+            frames = sys._current_frames()
+            if task is not None:
+                if task.done():
+                    break
+                stack = self._task_stack(task, frames.get(loop_thread_id))
+                if stack is not None:
+                    profile.add(stack)
+            elif threads == "all":
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for thread_id, frame in frames.items():
+                    if thread_id != own_thread_id:
+                        self._add(profile, _thread_stack(frame, self.max_depth), include_idle, names.get(thread_id))
+            else:
+                self._add(profile, _thread_stack(frames.get(loop_thread_id), self.max_depth), include_idle)
+            del frames
+
+    def _task_stack(self, task: asyncio.Task, loop_frame: Optional[FrameType]) -> Optional[Stack]:
+        coroutine = task.get_coro()
+        if asyncio.current_task(task.get_loop()) is not task:
+            return _await_stack(coroutine, self.max_depth)
+        # None if the task was suspended before the frame was captured, the next sample catches up
+        return _thread_stack(loop_frame, self.max_depth, root=coroutine.cr_frame)
+
+    @staticmethod
+    def _add(profile: Profile, stack: Stack, include_idle: bool, thread_name: Optional[str] = None) -> None:
+        if not stack:
+            return
+        if not include_idle and stack[-1].co_filename in _IDLE_FILES:
+            profile.idle_count += 1
+            return
+        profile.add((f"thread {thread_name}", *stack) if thread_name else stack)
+
+
+def get_profiler(request: Request) -> SamplingProfiler | None:
+    """
+    Returns the sampling profiler of the worker, None if `profiler_enabled` is off.
+
+    :param request: current request.
+    :returns: sampling profiler.
+    """
+    return request.app.state.profiler
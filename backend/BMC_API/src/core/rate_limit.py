@@ -0,0 +1,109 @@
+# backend/BMC_API/src/core/rate_limit.py
+import re
+from typing import Mapping, Tuple
+
+from BMC_API.src.domain.interfaces.rate_limit_backend import RateLimitBackend
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_LIMIT_PATTERN = re.compile(r"^\s*(\d+)\s*(?:/|per)\s*(\d+)?\s*(second|minute|hour|day)s?\s*$", re.IGNORECASE)
+
+
+class RateLimit:
+    """
+    `amount` requests per `period` seconds, enforced as a token bucket: the bucket holds up to `amount`
+    tokens and refills continuously at `amount / period` tokens per second.
+    """
+
+    def __init__(self, amount: int, period: float) -> None:
+        self.amount = amount
+        self.period = period
+
+    @classmethod
+    def parse(cls, text: str) -> "RateLimit":
+        """Parse limits like "4/second", "100 per minute" or "1000/5 minutes"."""
+        match = _LIMIT_PATTERN.match(text)
+        if match is None:
+            raise ValueError(f"Invalid rate limit: {text!r}")
+        amount, multiplier, period = match.groups()
+        return cls(int(amount), int(multiplier or 1) * _PERIODS[period.lower()])
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self.amount / self.period
+
+    def __str__(self) -> str:
+        return f"{self.amount}/{self.period:g}s"
+
+
+class RateLimitResult:
+    """Outcome of taking tokens from a bucket."""
+
+    def __init__(self, allowed: bool, limit: RateLimit, remaining: float, cost: int) -> None:
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        self.cost = cost
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the bucket holds enough tokens for the request, 0 if it was allowed."""
+        if self.allowed:
+            return 0.0
+        return (self.cost - self.remaining) / self.limit.rate
+
+    @property
+    def reset_after(self) -> float:
+        """Seconds until the bucket is full again."""
+        return (self.limit.amount - self.remaining) / self.limit.rate
+
+    def headers(self) -> dict:
+        headers = {
+            "X-RateLimit-Limit": str(self.limit.amount),
+            "X-RateLimit-Remaining": str(int(self.remaining)),
+            "X-RateLimit-Reset": str(int(-(-self.reset_after // 1))),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, int(-(-self.retry_after // 1))))
+        return headers
+
+
+def take_tokens(tokens: float, elapsed: float, limit: RateLimit, cost: int) -> Tuple[bool, float]:
+    """
+    Refill a bucket holding `tokens` for the `elapsed` seconds since its last update and take `cost` tokens.
+    The redis backend runs the same steps in a Lua script.
+
+    :return: whether the tokens were taken, and the tokens left in the bucket.
+    """
+    tokens = min(limit.amount, tokens + max(0.0, elapsed) * limit.rate)
+    if tokens >= cost:
+        return True, tokens - cost
+    return False, tokens
+
+
+class RateLimiter:
+    """
+    Global rate limit of the application, checked by `RateLimitMiddleware` for every request.
+
+    Requests of the routes in `route_costs` take that many tokens instead of one, so expensive endpoints
+    exhaust the limit sooner; a cost of 0 exempts a route. Costs above the limit are capped to it,
+    such requests need a full bucket.
+    """
+
+    def __init__(
+        self,
+        limit: RateLimit,
+        backend: RateLimitBackend,
+        route_costs: Mapping[str, int] | None = None,
+        enabled: bool = True,
+    ) -> None:
+        self.limit = limit
+        self.backend = backend
+        self.route_costs = dict(route_costs or {})
+        self.enabled = enabled
+
+    def cost(self, route_name: str | None) -> int:
+        return min(self.route_costs.get(route_name, 1), self.limit.amount)
+
+    async def acquire(self, key: str, cost: int = 1) -> RateLimitResult:
+        return await self.backend.acquire(key, self.limit, cost)
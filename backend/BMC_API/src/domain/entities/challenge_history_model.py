@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql.schema import Column, ForeignKey
+from sqlalchemy.sql.schema import Column, ForeignKey, Index
 from sqlalchemy.sql.sqltypes import JSON, DateTime, Integer, String
 
 from BMC_API.src.infrastructure.persistence.base import Base
@@ -21,3 +21,5 @@ class ChallengeHistoryModel(Base):
     challenge = relationship("ChallengeModel", back_populates="histories", lazy="selectin")
     changes = Column(JSON)
     snapshot = Column(JSON)
+
+    __table_args__ = (Index("ix_challenge_histories_challenge_id_timestamp", challenge_id, timestamp.desc()),)
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql.schema import Column, ForeignKey
+from sqlalchemy.sql.schema import Column, ForeignKey, Index
 from sqlalchemy.sql.sqltypes import JSON, Boolean, DateTime, Integer, String
 
 from BMC_API.src.domain.value_objects.enums.challenge_enums import ChallengeStatus
@@ -64,3 +64,9 @@ class ChallengeModel(Base):
     challenge_lighthouse_compute_per_participant = Column(String)
     challenge_lncs_proceedings = Column(String)
     challenge_esr_collaboration = Column(String)
+
+    __table_args__ = (
+        Index("ix_challenges_owner_id_created_time", challenge_owner_id, challenge_created_time.desc()),
+        Index("ix_challenges_conference_id_status", challenge_conference_id, challenge_status),
+        Index("ix_challenges_status", challenge_status),
+    )
@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql.schema import Column, ForeignKey
+from sqlalchemy.sql.schema import Column, ForeignKey, Index
 from sqlalchemy.sql.sqltypes import JSON, DateTime, Integer, String
 
 from BMC_API.src.infrastructure.persistence.base import Base
@@ -22,3 +22,5 @@ class TaskHistoryModel(Base):
     task = relationship("TaskModel", back_populates="histories", lazy="selectin")
     changes = Column(JSON)
     snapshot = Column(JSON)
+
+    __table_args__ = (Index("ix_task_histories_task_id_timestamp", task_id, timestamp.desc()),)
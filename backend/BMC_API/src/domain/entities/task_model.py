@@ -1,5 +1,5 @@
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql.schema import Column, ForeignKey
+from sqlalchemy.sql.schema import Column, ForeignKey, Index
 from sqlalchemy.sql.sqltypes import JSON, Boolean, DateTime, Integer, String
 
 from BMC_API.src.domain.value_objects.enums.challenge_enums import ChallengeStatus
@@ -98,3 +98,8 @@ class TaskModel(Base):
     task_statistical_analyses_test_for_significance = Column(String)
     task_statistical_analyses_missing_data_handling = Column(String)
     task_statistical_analyses_software = Column(String)
+
+    __table_args__ = (
+        Index("ix_tasks_task_challenge_id", task_challenge_id),
+        Index("ix_tasks_task_owner_id", task_owner_id),
+    )
@@ -0,0 +1,13 @@
+# backend/BMC_API/src/domain/interfaces/cache_backend.py
+from datetime import timedelta
+from typing import Iterable, List, Protocol
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def get_many(self, keys: Iterable[str]) -> List[bytes | None]: ...
+
+    async def set(self, key: str, value: bytes, expire: timedelta | None = None) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
@@ -0,0 +1,9 @@
+# backend/BMC_API/src/domain/interfaces/rate_limit_backend.py
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from BMC_API.src.core.rate_limit import RateLimit, RateLimitResult
+
+
+class RateLimitBackend(Protocol):
+    async def acquire(self, key: str, limit: "RateLimit", cost: int = 1) -> "RateLimitResult": ...
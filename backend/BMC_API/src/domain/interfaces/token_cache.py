@@ -1,6 +1,6 @@
 # backend/BMC_API/src/domain/interfaces/token_cache.py
 from datetime import timedelta
-from typing import Protocol
+from typing import Iterable, List, Mapping, Protocol, Tuple
 
 
 class TokenCache(Protocol):
@@ -9,3 +9,14 @@ class TokenCache(Protocol):
     async def get_token(self, key: str) -> str | None: ...
 
     async def delete_token(self, key: str) -> None: ...
+
+    async def set_many(self, tokens: Mapping[str, Tuple[str, timedelta]]) -> None: ...
+
+    async def get_many(self, keys: Iterable[str]) -> List[str | None]: ...
+
+    async def delete_many(self, keys: Iterable[str]) -> None: ...
+
+
+def revoked_user_key(email: str) -> str:
+    """Key of the entry that revokes the refresh tokens of a disabled user."""
+    return f"revoked_user:{email}"
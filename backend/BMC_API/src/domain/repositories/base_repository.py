@@ -16,6 +16,7 @@ class BaseRepositoryProtocol(Protocol[TInput, TOutput]):
         output_filters: List[str] | None = None,
         sort_by: str | None = "id",
         sort_desc: bool | None = False,
+        nested_output_filters: Dict[str, List[str]] | None = None,
     ) -> Optional[List[TOutput]]: ...
     async def create(self, obj: TInput) -> TOutput: ...
     async def update(self, id: int, obj: TInput) -> Optional[TOutput]: ...
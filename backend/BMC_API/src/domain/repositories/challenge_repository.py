@@ -8,6 +8,7 @@ from BMC_API.src.api.dependencies.schemas import BulkOperationResponse
 from BMC_API.src.application.dto.challenge_dto import (
     ChallengeHistoryModelDTO,
     ChallengeModelBaseOutputDTO,
+    ChallengeSearchResultDTO,
 )
 from BMC_API.src.application.use_cases.task_use_cases import TaskService
 from BMC_API.src.domain.entities.challenge_model import ChallengeModel
@@ -34,6 +35,7 @@ class ChallengeRepositoryProtocol(BaseRepositoryProtocol[TInput, ChallengeModel]
         self, ids: List[int], new_status: str
     ) -> BulkOperationResponse[ChallengeModelBaseOutputDTO]: ...
     async def take_snapshot(self, id: int): ...
+    async def search(self, terms: str, limit: int) -> List[ChallengeSearchResultDTO]: ...
     async def submit_challenge(
         self, id: int, background_tasks: BackgroundTasks, send_notification_emails: bool
     ) -> None: ...
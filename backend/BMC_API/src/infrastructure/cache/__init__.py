@@ -0,0 +1 @@
+"""Cache backends"""
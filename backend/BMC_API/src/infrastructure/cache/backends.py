@@ -0,0 +1,79 @@
+# backend/BMC_API/src/infrastructure/cache/backends.py
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Iterable, List, Tuple
+
+from BMC_API.src.domain.interfaces.cache_backend import CacheBackend
+from redis.asyncio import Redis
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Process-local cache backend. Every worker keeps its own copy, so entries
+    invalidated in one worker stay visible in the others until they expire.
+
+    With `max_entries` set, the least recently used entries are evicted once the limit is reached.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        self._store: OrderedDict[str, Tuple[bytes, float | None]] = OrderedDict()
+        self.max_entries = max_entries
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._store[key]
+            return None
+        self._store.move_to_end(key)
+        return value
+
+    async def get_many(self, keys: Iterable[str]) -> List[bytes | None]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, expire: timedelta | None = None) -> None:
+        expires_at = time.monotonic() + expire.total_seconds() if expire is not None else None
+        self._store[key] = (value, expires_at)
+        self._store.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._store) > self.max_entries:
+                self._store.popitem(last=False)
+                self.evictions += 1
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._store.pop(key, None)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backend on the shared redis client. Entries and invalidations are
+    visible to all workers. Evictions are left to the maxmemory policy of the server.
+    """
+
+    def __init__(self, redis: Redis, prefix: str = "cache:") -> None:
+        self.redis = redis
+        self.prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.redis.get(self.prefix + key)
+
+    async def get_many(self, keys: Iterable[str]) -> List[bytes | None]:
+        keys = [self.prefix + key for key in keys]
+        if not keys:
+            return []
+        return await self.redis.mget(keys)
+
+    async def set(self, key: str, value: bytes, expire: timedelta | None = None) -> None:
+        await self.redis.set(self.prefix + key, value, ex=expire)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.redis.unlink(*(self.prefix + key for key in keys))
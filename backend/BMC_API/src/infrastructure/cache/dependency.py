@@ -0,0 +1,28 @@
+# backend/BMC_API/src/infrastructure/cache/dependency.py
+from starlette.requests import Request
+
+from BMC_API.src.domain.interfaces.cache_backend import CacheBackend
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
+
+
+def get_cache_backend(request: Request) -> CacheBackend:
+    """
+    Returns the cache backend of the application.
+
+    It is an in-process cache by default and is switched to redis in the lifespan
+    of the application when `cache_backend` is set to "redis".
+
+    :param request: current request.
+    :returns: cache backend.
+    """
+    return request.app.state.cache_backend
+
+
+def get_repository_cache(request: Request) -> TaggedCache | None:
+    """
+    Returns the result cache of repositories, None if `repository_cache_enabled` is off.
+
+    :param request: current request.
+    :returns: repository cache.
+    """
+    return request.app.state.repository_cache
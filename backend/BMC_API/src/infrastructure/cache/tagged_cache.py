@@ -0,0 +1,97 @@
+# backend/BMC_API/src/infrastructure/cache/tagged_cache.py
+import pickle
+import uuid
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Tuple
+
+from loguru import logger
+
+from BMC_API.src.domain.interfaces.cache_backend import CacheBackend
+
+ENTRY_PREFIX = "entry:"
+TAG_PREFIX = "tag:"
+
+
+class TaggedCache:
+    """
+    Cache of pickled values that are invalidated through tags.
+
+    Every tag has a version token in the backend. An entry stores the versions its tags had
+    before the value was loaded and counts as a miss once one of them changed, so invalidating
+    a tag is a single write regardless of how many entries carry it.
+    Backend errors are logged and treated as misses.
+
+    Values are unpickled on hits, so the backend must only be writable by this application.
+    """
+
+    def __init__(self, backend: CacheBackend, expire: timedelta | None = None) -> None:
+        self.backend = backend
+        self.expire = expire
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        :param key: cache key.
+        :return: tuple of whether the key was a valid hit, and the cached value.
+        """
+        try:
+            raw = await self.backend.get(ENTRY_PREFIX + key)
+            if raw is not None:
+                versions, value = pickle.loads(raw)
+                current = await self.backend.get_many(TAG_PREFIX + tag for tag in versions)
+                if all(version is not None and version == versions[tag] for tag, version in zip(versions, current)):
+                    self.hits += 1
+                    return True, value
+        except Exception as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+        self.misses += 1
+        return False, None
+
+    async def tag_versions(self, tags: Iterable[str]) -> Dict[str, bytes] | None:
+        """
+        Current versions of the tags, to be read before the value is loaded.
+        Tags without a version get a new one.
+        """
+        tags = list(dict.fromkeys(tags))
+        try:
+            versions = dict(zip(tags, await self.backend.get_many(TAG_PREFIX + tag for tag in tags)))
+            for tag, version in versions.items():
+                if version is None:
+                    versions[tag] = uuid.uuid4().bytes
+                    await self.backend.set(TAG_PREFIX + tag, versions[tag], expire=self.expire)
+            return versions
+        except Exception as e:
+            logger.warning(f"Cache read failed for tags {tags}: {e}")
+            return None
+
+    async def set(self, key: str, value: Any, versions: Dict[str, bytes] | None) -> None:
+        if versions is None:
+            return
+        try:
+            raw = pickle.dumps((versions, value), protocol=pickle.HIGHEST_PROTOCOL)
+            await self.backend.set(ENTRY_PREFIX + key, raw, expire=self.expire)
+        except Exception as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+
+    async def invalidate(self, *tags: str) -> None:
+        """Invalidate all entries carrying one of the tags."""
+        tags = list(dict.fromkeys(tags))
+        try:
+            for tag in tags:
+                await self.backend.set(TAG_PREFIX + tag, uuid.uuid4().bytes, expire=self.expire)
+            self.invalidations += len(tags)
+        except Exception as e:
+            logger.error(f"Cache invalidation failed for tags {tags}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": getattr(self.backend, "evictions", None),
+            "invalidations": self.invalidations,
+        }
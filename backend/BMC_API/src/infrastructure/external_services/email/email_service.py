@@ -5,6 +5,7 @@ from jinja2 import TemplateNotFound
 from loguru import logger
 
 from BMC_API.src.core.config.settings import settings
+from BMC_API.src.core.metrics import metrics
 from BMC_API.src.infrastructure.external_services.email.schema import EmailSchema
 
 
@@ -74,9 +75,12 @@ async def email_sender(email: EmailSchema, template_name: str) -> None:
     try:
         await fm.send_message(message=message, template_name=template_name)
         logger.info("E-mail has been sent to: " + str(message.recipients))
+        metrics.emails.labels(template_name, "sent").inc()
     except TemplateNotFound as e:
         logger.error(f'Template "{e}" not found')
+        metrics.emails.labels(template_name, "template_not_found").inc()
         raise
     except Exception as e:
         logger.error(str(e))
+        metrics.emails.labels(template_name, "failed").inc()
         raise
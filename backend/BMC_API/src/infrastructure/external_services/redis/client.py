@@ -0,0 +1,19 @@
+# backend/BMC_API/src/infrastructure/external_services/redis/client.py
+import time
+
+from BMC_API.src.core.metrics import metrics
+from redis.asyncio import Redis
+
+
+class InstrumentedRedis(Redis):
+    """
+    Redis client that records the duration of every command, including the wait for a pool connection,
+    see `metrics.redis_command_duration`. Pipelines are sent as a whole and not recorded.
+    """
+
+    async def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            metrics.redis_command_duration.labels(str(args[0]).upper()).observe(time.perf_counter() - start)
@@ -7,7 +7,7 @@ from starlette.requests import Request
 from BMC_API.src.infrastructure.external_services.redis.token_cache_impl import (
     RedisTokenCache,
 )
-from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio import Redis
 
 
 async def get_redis_pool(
@@ -16,26 +16,40 @@ async def get_redis_pool(
     """
     Returns connection pool.
 
+    Prefer `get_redis_client` for running commands. The pool is exposed
+    for inspecting its state, e.g. utilization metrics.
+
+    :param request: current request.
+    :returns:  redis connection pool.
+    """
+    return request.app.state.redis_pool
+
+
+async def get_redis_client(
+    request: Request,
+) -> Redis:  # pragma: no cover
+    """
+    Returns the shared redis client of the worker.
+
     You can use it like this:
 
-    >>> from redis.asyncio import ConnectionPool, Redis
+    >>> from redis.asyncio import Redis
     >>>
-    >>> async def handler(redis_pool: ConnectionPool = Depends(get_redis_pool)):
-    >>>     async with Redis(connection_pool=redis_pool) as redis:
-    >>>         await redis.get('key')
+    >>> async def handler(redis: Redis = Depends(get_redis_client)):
+    >>>     await redis.get('key')
 
-    I use pools, so you don't acquire connection till the end of the handler.
+    The client is created in the lifespan of the application. Do not close it in handlers.
 
     :param request: current request.
-    :returns:  redis connection pool.
+    :returns: redis client.
     """
-    return request.app.state.redis_pool
+    return request.app.state.redis
 
 
 def get_token_cache(
-    redis_pool: ConnectionPool = Depends(get_redis_pool),
+    redis: Redis = Depends(get_redis_client),
 ) -> RedisTokenCache:
     """
     Returns an instance of RedisTokenCache which implements the TokenCache interface.
     """
-    return RedisTokenCache(redis_pool)
+    return RedisTokenCache(redis)
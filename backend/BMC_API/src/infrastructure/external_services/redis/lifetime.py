@@ -1,24 +1,43 @@
 from fastapi import FastAPI
 
 from BMC_API.src.core.config.settings import settings
-from redis.asyncio import ConnectionPool
+from BMC_API.src.infrastructure.external_services.redis.client import InstrumentedRedis
+from BMC_API.src.infrastructure.external_services.redis.pool import (
+    InstrumentedBlockingConnectionPool,
+)
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
 
 
 def init_redis(app: FastAPI) -> None:  # pragma: no cover
     """
-    Creates connection pool for redis.
+    Creates connection pool and the shared client for redis.
+
+    The client is created once per worker and shared by all requests.
 
     :param app: current fastapi application.
     """
-    app.state.redis_pool = ConnectionPool.from_url(
+    app.state.redis_pool = InstrumentedBlockingConnectionPool.from_url(
         str(settings.redis_url),
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_connect_timeout=settings.redis_socket_connect_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+        retry_on_timeout=True,
+        retry=Retry(
+            ExponentialBackoff(cap=settings.redis_retry_backoff_cap, base=settings.redis_retry_backoff_base),
+            settings.redis_retry_attempts,
+        ),
     )
+    app.state.redis = InstrumentedRedis(connection_pool=app.state.redis_pool)
 
 
 async def shutdown_redis(app: FastAPI) -> None:  # pragma: no cover
     """
-    Closes redis connection pool.
+    Closes the shared redis client and its connection pool.
 
     :param app: current FastAPI app.
     """
+    await app.state.redis.close()
     await app.state.redis_pool.disconnect()
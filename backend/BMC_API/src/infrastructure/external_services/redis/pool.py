@@ -0,0 +1,54 @@
+# backend/BMC_API/src/infrastructure/external_services/redis/pool.py
+import time
+
+from redis.asyncio import BlockingConnectionPool
+
+
+class InstrumentedBlockingConnectionPool(BlockingConnectionPool):
+    """
+    BlockingConnectionPool that records how long callers wait for a connection.
+
+    When all `max_connections` are busy, callers wait up to `timeout` seconds
+    for a free connection instead of failing immediately. The recorded wait times
+    and the current utilization are returned by `stats()`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.acquired_count = 0
+        self.timeout_count = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    async def get_connection(self, command_name, *keys, **options):
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(command_name, *keys, **options)
+        except Exception:
+            self.timeout_count += 1
+            raise
+        waited = time.perf_counter() - started
+        self.acquired_count += 1
+        self.total_wait_time += waited
+        self.max_wait_time = max(self.max_wait_time, waited)
+        return connection
+
+    def stats(self) -> dict:
+        """
+        Return utilization and wait-time metrics of the pool.
+        """
+        created = len(self._connections)
+        # Idle connections wait in the queue, unused slots are stored as None.
+        idle = sum(1 for connection in self.pool._queue if connection is not None)
+        in_use = created - idle
+        return {
+            "max_connections": self.max_connections,
+            "created_connections": created,
+            "in_use_connections": in_use,
+            "idle_connections": idle,
+            "utilization": in_use / self.max_connections if self.max_connections else 0.0,
+            "acquired_count": self.acquired_count,
+            "timeout_count": self.timeout_count,
+            "avg_wait_ms": (self.total_wait_time / self.acquired_count * 1000) if self.acquired_count else 0.0,
+            "max_wait_ms": self.max_wait_time * 1000,
+        }
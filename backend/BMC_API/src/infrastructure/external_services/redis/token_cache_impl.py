@@ -1,19 +1,102 @@
 # backend/BMC_API/src/infrastructure/external_services/redis/token_cache_impl.py
+import time
 from datetime import timedelta
+from typing import Dict, Iterable, List, Mapping, Tuple
 
 from BMC_API.src.domain.interfaces.token_cache import TokenCache
-from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio import Redis
+
+
+def _decode(value: bytes | str | None) -> str | None:
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="ignore")
+    return value
 
 
 class RedisTokenCache(TokenCache):
-    def __init__(self, redis_pool: ConnectionPool):
-        self.redis = Redis(connection_pool=redis_pool)
+    def __init__(self, redis: Redis):
+        self.redis = redis
 
     async def set_token(self, key: str, value: str, expire: timedelta) -> None:
         await self.redis.set(name=key, value=value, ex=expire)
 
     async def get_token(self, key: str) -> str | None:
-        return await self.redis.get(name=key)
+        return _decode(await self.redis.get(name=key))
+
+    async def delete_token(self, key: str) -> None:
+        await self.redis.delete(key)
+
+    async def set_many(self, tokens: Mapping[str, Tuple[str, timedelta]]) -> None:
+        """
+        Store several tokens with their own expiry in a single round trip.
+        """
+        if not tokens:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, (value, expire) in tokens.items():
+                pipe.set(name=key, value=value, ex=expire)
+            await pipe.execute()
+
+    async def get_many(self, keys: Iterable[str]) -> List[str | None]:
+        """
+        Fetch several tokens in a single round trip. Missing keys are returned as None.
+        """
+        keys = list(keys)
+        if not keys:
+            return []
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(name=key)
+            values = await pipe.execute()
+        return [_decode(value) for value in values]
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Delete several tokens in a single round trip.
+        """
+        keys = list(keys)
+        if not keys:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.delete(key)
+            await pipe.execute()
+
+
+class InMemoryTokenCache(TokenCache):
+    """
+    Process-local TokenCache with the same semantics as RedisTokenCache.
+    Intended for tests and for running without a Redis server.
+    """
+
+    def __init__(self) -> None:
+        self._store: Dict[str, Tuple[str, float]] = {}
+
+    def _is_expired(self, key: str) -> bool:
+        _, expires_at = self._store[key]
+        if expires_at <= time.monotonic():
+            del self._store[key]
+            return True
+        return False
+
+    async def set_token(self, key: str, value: str, expire: timedelta) -> None:
+        self._store[key] = (str(value), time.monotonic() + expire.total_seconds())
+
+    async def get_token(self, key: str) -> str | None:
+        if key not in self._store or self._is_expired(key):
+            return None
+        return self._store[key][0]
 
     async def delete_token(self, key: str) -> None:
-        await self.redis.delete(name=key)
+        self._store.pop(key, None)
+
+    async def set_many(self, tokens: Mapping[str, Tuple[str, timedelta]]) -> None:
+        for key, (value, expire) in tokens.items():
+            await self.set_token(key, value, expire)
+
+    async def get_many(self, keys: Iterable[str]) -> List[str | None]:
+        return [await self.get_token(key) for key in keys]
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            await self.delete_token(key)
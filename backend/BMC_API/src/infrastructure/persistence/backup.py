@@ -0,0 +1,220 @@
+# backend/BMC_API/src/infrastructure/persistence/backup.py
+import gzip
+import hashlib
+import os
+import shutil
+import sqlite3
+import subprocess
+import time
+import uuid
+from typing import BinaryIO, List
+
+from loguru import logger
+
+BACKUP_EXTENSION = ".sqlite3"
+PG_DUMP_EXTENSION = ".dump"  # pg_dump custom format, compressed by pg_dump itself
+COMPRESSION_EXTENSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+# Longest first, so "x.sqlite3.gz" is not taken for a plain ".sqlite3" file
+BACKUP_EXTENSIONS = tuple(
+    sorted((BACKUP_EXTENSION + ext for ext in COMPRESSION_EXTENSIONS.values()), key=len, reverse=True)
+) + (PG_DUMP_EXTENSION,)
+CHECKSUM_EXTENSION = ".sha256"
+_CHUNK_SIZE = 1024 * 1024
+
+
+def backup_extension(path: str) -> str:
+    """Extension of a backup file, including the compression suffix."""
+    return next((ext for ext in BACKUP_EXTENSIONS if path.endswith(ext)), "")
+
+
+def list_backup_files(backup_folder: str) -> List[str]:
+    """Backup files in the folder, oldest first."""
+    files = [
+        os.path.join(backup_folder, name)
+        for name in os.listdir(backup_folder)
+        if backup_extension(name) and not name.startswith(".")
+    ]
+    return sorted(files, key=os.path.getctime)
+
+
+def remove_backup_file(path: str) -> None:
+    """Remove a backup file together with its checksum file."""
+    os.remove(path)
+    if os.path.exists(path + CHECKSUM_EXTENSION):
+        os.remove(path + CHECKSUM_EXTENSION)
+
+
+def _open_compressed(path: str, compression: str) -> BinaryIO:
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        import zstandard  # Optional dependency of the zstd extra, only needed for zstd compressed backups
+
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, "wb"), closefd=True)
+    return open(path, "wb")
+
+
+def resolve_compression(compression: str) -> str:
+    """Fall back to gzip if zstd is configured but zstandard is not installed."""
+    if compression == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            logger.warning("zstandard is not installed, database backups are compressed with gzip instead.")
+            return "gzip"
+    return compression
+
+
+def copy_database(db_file: str, target: str, pages_per_step: int, step_sleep: float) -> None:
+    """
+    Online backup with the SQLite backup API. Between steps the source is unlocked,
+    so writers can proceed. Pages changed during the backup are copied again by SQLite.
+    """
+
+    def progress(status: int, remaining: int, total: int) -> None:
+        if remaining:
+            time.sleep(step_sleep)
+
+    src = sqlite3.connect(db_file)
+    try:
+        dst = sqlite3.connect(target)
+        try:
+            src.backup(dst, pages=pages_per_step, progress=progress)
+            result = dst.execute("PRAGMA quick_check").fetchone()[0]
+            if result != "ok":
+                raise RuntimeError(f"Database backup failed integrity check: {result}")
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fsync_file(path: str) -> None:
+    with open(path, "r+b") as file:
+        os.fsync(file.fileno())
+
+
+def _compress(source: str, target: str, compression: str) -> None:
+    with open(source, "rb") as src_file, _open_compressed(target, compression) as dst_file:
+        shutil.copyfileobj(src_file, dst_file, _CHUNK_SIZE)
+
+
+def online_backup(
+    db_file: str,
+    backup_file_location: str,
+    pages_per_step: int = 256,
+    step_sleep: float = 0.01,
+    compression: str = "none",
+) -> str:
+    """
+    Create a consistent backup of a live SQLite database. Blocking, run it in a thread.
+
+    The copy is made and checked in a hidden temporary file of the backup folder, optionally compressed,
+    and renamed into place atomically, so a backup file is either complete or absent.
+    The sha256 of the final file is written next to it with the `.sha256` extension.
+
+    :param db_file: database to back up.
+    :param backup_file_location: path of the backup without compression extension.
+    :param pages_per_step: pages copied per step, -1 copies all at once.
+    :param step_sleep: seconds to sleep between steps.
+    :param compression: "none", "gzip" or "zstd".
+    :return: path of the backup file.
+    """
+    compression = resolve_compression(compression)
+    final_location = backup_file_location + COMPRESSION_EXTENSIONS[compression]
+    folder, name = os.path.split(final_location)
+    temp_copy = os.path.join(folder, f".{name}.{uuid.uuid4().hex}.tmp")
+    temp_final = temp_copy + ".out"
+
+    try:
+        copy_database(db_file, temp_copy, pages_per_step, step_sleep)
+        if compression == "none":
+            os.replace(temp_copy, temp_final)
+        else:
+            _compress(temp_copy, temp_final, compression)
+        fsync_file(temp_final)
+        checksum = _sha256(temp_final)
+        os.replace(temp_final, final_location)
+    finally:
+        for temp_file in (temp_copy, temp_final):
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+    with open(final_location + CHECKSUM_EXTENSION, "w") as checksum_file:
+        checksum_file.write(f"{checksum}  {name}\n")
+    return final_location
+
+
+def pg_dump_backup(
+    backup_file_location: str,
+    host: str,
+    port: int,
+    user: str,
+    password: str,
+    database: str,
+    pg_dump_path: str = "pg_dump",
+) -> str:
+    """
+    Create a consistent backup of a PostgreSQL database with pg_dump. Blocking, run it in a thread.
+
+    Like `online_backup`, the dump is written to a hidden temporary file and renamed into place atomically,
+    with its sha256 next to it. Restore it with `pg_restore`.
+
+    :param backup_file_location: path of the backup without extension.
+    :param host: database server.
+    :param port: database server port.
+    :param user: database user.
+    :param password: password of the user, passed in the environment of pg_dump.
+    :param database: database name.
+    :param pg_dump_path: pg_dump executable.
+    :return: path of the backup file.
+    """
+    final_location = backup_file_location + PG_DUMP_EXTENSION
+    folder, name = os.path.split(final_location)
+    temp_final = os.path.join(folder, f".{name}.{uuid.uuid4().hex}.tmp")
+    command = [
+        pg_dump_path,
+        "--format=custom",
+        "--no-owner",
+        f"--host={host}",
+        f"--port={port}",
+        f"--username={user}",
+        f"--file={temp_final}",
+        database,
+    ]
+
+    try:
+        subprocess.run(
+            command,
+            env={**os.environ, "PGPASSWORD": password},
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        fsync_file(temp_final)
+        checksum = _sha256(temp_final)
+        os.replace(temp_final, final_location)
+    except subprocess.CalledProcessError as error:
+        raise RuntimeError(f"pg_dump failed: {error.stderr.strip()}") from error
+    finally:
+        if os.path.exists(temp_final):
+            os.remove(temp_final)
+
+    with open(final_location + CHECKSUM_EXTENSION, "w") as checksum_file:
+        checksum_file.write(f"{checksum}  {name}\n")
+    return final_location
+
+
+def verify_backup(path: str) -> bool:
+    """Compare a backup file with its checksum file."""
+    with open(path + CHECKSUM_EXTENSION) as checksum_file:
+        expected = checksum_file.read().split()[0]
+    return _sha256(path) == expected
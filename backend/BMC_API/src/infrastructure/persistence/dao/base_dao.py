@@ -1,53 +1,184 @@
 # BMC_API/src/infrastructure/persistence/base_dao.py
 import math
-from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar
 
 from loguru import logger
-from sqlalchemy import func, select
+from sqlalchemy import String, bindparam, cast, func, select
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import lazyload, load_only, selectinload
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.functions import FunctionElement
 
 from BMC_API.src.infrastructure.persistence.base import Base
+from BMC_API.src.infrastructure.persistence.search import (
+    FULL_TEXT_OPERATORS,
+    ensure_full_text_search,
+    search_index_for,
+    to_fts_query,
+)
 
 DataObject = TypeVar("DataObject", bound=Base)
 
+# Operators of "field__operator" search filters: SQL operator the bound value is compared with,
+# condition builder and transformation of the value before it is bound.
+_OPERATORS: Dict[str, Tuple[Callable, Callable, Callable]] = {
+    "lt": (operators.lt, lambda col, param: col < param, lambda val: val),
+    "lte": (operators.le, lambda col, param: col <= param, lambda val: val),
+    "le": (operators.le, lambda col, param: col <= param, lambda val: val),
+    "gt": (operators.gt, lambda col, param: col > param, lambda val: val),
+    "gte": (operators.ge, lambda col, param: col >= param, lambda val: val),
+    "ge": (operators.ge, lambda col, param: col >= param, lambda val: val),
+    "ne": (operators.ne, lambda col, param: col != param, lambda val: val),
+    "like": (operators.like_op, lambda col, param: col.like(param), lambda val: f"%{val}%"),
+    "ilike": (operators.ilike_op, lambda col, param: col.ilike(param), lambda val: f"%{val}%"),
+    "startswith": (operators.like_op, lambda col, param: col.like(param), lambda val: f"{val}%"),
+    "endswith": (operators.like_op, lambda col, param: col.like(param), lambda val: f"%{val}"),
+    "contains": (operators.contains_op, lambda col, param: col.contains(param), lambda val: val),
+    "eq": (operators.eq, lambda col, param: col == param, lambda val: val),
+}
+
+STATEMENT_CACHE_SIZE = 512
+
+
+class _compared_value(FunctionElement):
+    """
+    Bound value of another type than the column it is compared with, e.g. a string compared to a DateTime
+    column. SQLite compares it like a literal, PostgreSQL has no such operators and needs it cast.
+    """
+
+    inherit_cache = True
+
+    def __init__(self, param, column_type):
+        super().__init__(param)
+        self.type = column_type
+
+
+@compiles(_compared_value)
+def _compile_compared_value(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(_compared_value, "postgresql")
+def _compile_compared_value_postgresql(element, compiler, **kw):
+    (param,) = element.clauses
+    return compiler.process(cast(param, element.type), **kw)
+
+
+def _compared_param(column, name: str, sql_operator: Callable, value: Any):
+    """Parameter of a filter value, typed the way SQLAlchemy types the literal value."""
+    type_ = column.type.coerce_compared_value(sql_operator, value)
+    param = bindparam(name, type_=type_)
+    if type_._type_affinity is not column.type._type_affinity:
+        return _compared_value(param, column.type)
+    return param
+
+
+class ModelMetadata:
+    """Column and relationship names of a model, inspected once per model."""
+
+    _registry: Dict[type, "ModelMetadata"] = {}
+
+    def __init__(self, model: type):
+        mapper = inspect(model)
+        self.column_keys: List[str] = [column.key for column in mapper.column_attrs]
+        self.column_names: frozenset[str] = frozenset(self.column_keys)
+        # Relationship name to the column names of the related model, in mapper order
+        self.relationships: Dict[str, List[str]] = {
+            relationship.key: [column.key for column in relationship.mapper.column_attrs]
+            for relationship in mapper.relationships
+        }
+
+    @classmethod
+    def of(cls, model: type) -> "ModelMetadata":
+        # Built on first use, mappers are only configured once all entity modules are imported
+        metadata = cls._registry.get(model)
+        if metadata is None:
+            metadata = cls._registry[model] = cls(model)
+        return metadata
+
 
 class QueryHelper(Generic[DataObject]):
     """Helper class for query building operations."""
 
+    # Statements of `list` by model and query shape. Filter values are bound parameters,
+    # so one statement serves all values and SQLAlchemy's compiled cache is hit as well.
+    _statement_cache: OrderedDict = OrderedDict()
+
     def __init__(self, model_class: Type[DataObject]):
         self.model = model_class
+        self.metadata = ModelMetadata.of(model_class)
 
-    def _column_names(self, model: Type[DataObject] | None = None) -> set[str]:
-        return {column.key for column in inspect(model or self.model).column_attrs}
+    def _column_names(self, model: Type[DataObject] | None = None) -> frozenset[str]:
+        return ModelMetadata.of(model).column_names if model else self.metadata.column_names
 
     def _relationship_names(self) -> set[str]:
-        return {relationship.key for relationship in inspect(self.model).relationships}
-
-    def _requested_relationships(self, output_filters: List[str] | None = None) -> dict[str, list[str]]:
-        if not output_filters:
-            return {}
+        return set(self.metadata.relationships)
 
+    def _requested_relationships(
+        self, output_filters: List[str] | None = None, nested_output_filters: Dict[str, List[str]] | None = None
+    ) -> dict[str, list[str]]:
         requested_relationships = {}
-        for relationship in inspect(self.model).relationships:
-            relationship_name = relationship.key
-            if relationship_name not in output_filters:
-                continue
+        for relationship_name, related_column_names in self.metadata.relationships.items():
+            if output_filters and relationship_name in output_filters:
+                requested_relationships[relationship_name] = [
+                    field for field in output_filters if field in related_column_names
+                ]
 
-            related_column_names = self._column_names(relationship.mapper.class_)
+        for relationship_name, fields in (nested_output_filters or {}).items():
+            related_column_names = self.metadata.relationships.get(relationship_name)
+            if related_column_names is None:
+                logger.warning(f"Relationship {relationship_name} not found in model {self.model.__name__}")
+                continue
+            invalid_fields = [field for field in fields or [] if field not in related_column_names]
+            if invalid_fields:
+                logger.warning(f"Fields {invalid_fields} not found in relationship {relationship_name}")
             requested_relationships[relationship_name] = [
-                field for field in output_filters if field in related_column_names
+                field for field in fields or [] if field in related_column_names
             ]
 
         return requested_relationships
 
-    def build_query_with_output_filters(self, output_filters: List[str] | None = None):
+    def _projected_columns(
+        self, output_filters: List[str] | None = None, nested_output_filters: Dict[str, List[str]] | None = None
+    ) -> List[str]:
+        """Columns of the model in a projection with relationships, all of them if only relationships are narrowed."""
+        if not output_filters and nested_output_filters:
+            return list(self.metadata.column_keys)
+        return [field for field in output_filters or [] if field in self._column_names()]
+
+    def _projection_options(self, columns: List[str], requested_relationships: dict[str, list[str]]) -> list:
+        """
+        Loader options of a projection with relationships: only the requested columns of the model and of the
+        requested relationships are selected, other relationships and those of related rows are not loaded.
+        """
+        options = [load_only(*(getattr(self.model, field) for field in columns))] if columns else []
+        for relationship_name in self.metadata.relationships:
+            relationship = getattr(self.model, relationship_name)
+            if relationship_name not in requested_relationships:
+                options.append(lazyload(relationship))
+                continue
+            loader = selectinload(relationship)
+            related_fields = requested_relationships[relationship_name]
+            if related_fields:
+                related_model = relationship.property.mapper.class_
+                loader = loader.load_only(*(getattr(related_model, field) for field in related_fields))
+            options.append(loader.lazyload("*"))
+        return options
+
+    def build_query_with_output_filters(
+        self, output_filters: List[str] | None = None, nested_output_filters: Dict[str, List[str]] | None = None
+    ):
         """Build the initial query with output filters if specified."""
-        if output_filters:
-            if self._requested_relationships(output_filters):
-                return select(self.model)
+        requested_relationships = self._requested_relationships(output_filters, nested_output_filters)
+        if requested_relationships:
+            columns = self._projected_columns(output_filters, nested_output_filters)
+            return select(self.model).options(*self._projection_options(columns, requested_relationships))
 
+        if output_filters:
             column_names = self._column_names()
             selected_columns = [getattr(self.model, field) for field in output_filters if field in column_names]
             if not selected_columns:  # Fallback if no valid columns provided
@@ -57,95 +188,163 @@ class QueryHelper(Generic[DataObject]):
         else:
             return select(self.model)
 
-    def apply_search_filters(self, query, search_filters: Dict[str, Any] | None = None):
-        """Apply search filters to query and return both the filtered query and a base query for counting."""
-        base_query = select(self.model)
+    def _filter_plan(self, search_filters: Dict[str, Any] | None) -> Tuple[Tuple, Dict[str, Any]]:
+        """
+        Split search filters into a hashable shape of (field, operator, parameter name, value types)
+        entries and the values bound to the parameters. Invalid filters are skipped, like before.
+        """
+        filters: list = []
+        params: Dict[str, Any] = {}
 
-        if not search_filters:
-            return query, base_query
+        for field, value in (search_filters or {}).items():
+            name = f"filter_{len(filters)}"
 
-        for field, value in search_filters.items():
             # Handle NULL values
             if value is None:
-                condition = self._build_null_condition(field)
-                if condition is not None:
-                    query = query.filter(condition)
-                    base_query = base_query.filter(condition)
+                field_name, op = field, "isnull"
+                if field.endswith("__notnull") or field.endswith("__isnull"):
+                    field_name, op = field.rsplit("__", 1)
+                if not hasattr(self.model, field_name):
+                    logger.warning(f"Field {field} not found in model {self.model.__name__}")
+                    continue
+                filters.append((field_name, op, name, ()))
                 continue
 
             # Handle operators
             if "__" in field:
-                condition = self._build_operator_condition(field, value)
-                if condition is not None:
-                    query = query.filter(condition)
-                    base_query = base_query.filter(condition)
+                field_name, op = field.rsplit("__", 1)
+                if op in FULL_TEXT_OPERATORS:
+                    query = self._full_text_query(field_name, op, value)
+                    if query is not None:
+                        params[name] = query
+                        filters.append((field_name, "match", name, ()))
+                    continue
+                if not hasattr(self.model, field_name):
+                    logger.warning(f"Field {field_name} not found in model {self.model.__name__}")
+                    continue
+
+                if op == "between" and isinstance(value, (list, tuple)) and len(value) == 2:
+                    params[f"{name}_0"], params[f"{name}_1"] = value
+                    filters.append((field_name, op, name, (type(value[0]), type(value[1]))))
+                elif op == "in" and isinstance(value, (list, tuple)):
+                    params[name] = list(value)
+                    filters.append((field_name, op, name, (type(value[0]),) if value else ()))
+                elif op in _OPERATORS and op != "eq":
+                    params[name] = _OPERATORS[op][2](value)
+                    filters.append((field_name, op, name, (type(value),)))
+                else:
+                    logger.warning(f"Unsupported operator: {op}")
             else:
                 # Simple equality
-                if hasattr(self.model, field):
-                    column = getattr(self.model, field)
-                    query = query.filter(column == value)
-                    base_query = base_query.filter(column == value)
-                else:
+                if not hasattr(self.model, field):
                     logger.exception(f"Field {field} not found in model {self.model.__name__}")
                     raise NoResultFound(f"Field {field} not found in model {self.model.__name__}")
+                params[name] = value
+                filters.append((field, "eq", name, (type(value),)))
 
-        return query, base_query
+        return tuple(filters), params
 
-    def _build_null_condition(self, field: str):
-        """Build condition for NULL value checks."""
-        if field.endswith("__notnull"):
-            field_name = field.rsplit("__", 1)[0]
-            if hasattr(self.model, field_name):
-                return getattr(self.model, field_name).isnot(None)
-        elif field.endswith("__isnull"):
-            field_name = field.rsplit("__", 1)[0]
-            if hasattr(self.model, field_name):
-                return getattr(self.model, field_name).is_(None)
-        else:
-            # Direct NULL comparison
-            if hasattr(self.model, field):
-                return getattr(self.model, field).is_(None)
-
-        logger.warning(f"Field {field} not found in model {self.model.__name__}")
-        return None
+    def _full_text_query(self, field_name: str, op: str, value: Any) -> Optional[str]:
+        """
+        FTS5 query of a "__match" filter, which takes FTS5 query syntax, or a "__search" filter, which takes
+        plain terms. The field is an indexed column or the search index itself, e.g. "challenge_search".
+        """
+        index = search_index_for(self.model)
+        if index is None or (field_name != index.name and field_name not in index.columns):
+            logger.warning(f"Field {field_name} of model {self.model.__name__} has no full-text search index")
+            return None
+        query = str(value) if op == "match" else to_fts_query(str(value))
+        if not query:
+            logger.warning(f"Empty full-text search on {field_name}")
+            return None
+        return index.column_query(field_name, query)
 
-    def _build_operator_condition(self, field: str, value: Any):
-        """Build condition based on field operator suffix."""
-        field_name, op = field.rsplit("__", 1)
+    def _build_conditions(self, filters: Tuple, params: Dict[str, Any]) -> list:
+        """
+        Build filter conditions with bound parameters. Parameters are typed the way SQLAlchemy types literal
+        values, e.g. a string compared to a DateTime column stays a string.
+        """
+        conditions = []
+        for field_name, op, name, _ in filters:
+            if op == "match":
+                index = search_index_for(self.model)
+                conditions.append(index.match_condition(self.model.id, bindparam(name, type_=String())))
+                continue
 
-        if not hasattr(self.model, field_name):
-            logger.warning(f"Field {field_name} not found in model {self.model.__name__}")
-            return None
+            column = getattr(self.model, field_name)
+            if op == "notnull":
+                conditions.append(column.isnot(None))
+            elif op == "isnull":
+                conditions.append(column.is_(None))
+            elif op == "between":
+                low, high = params[f"{name}_0"], params[f"{name}_1"]
+                conditions.append(
+                    column.between(
+                        _compared_param(column, f"{name}_0", operators.between_op, low),
+                        _compared_param(column, f"{name}_1", operators.between_op, high),
+                    )
+                )
+            elif op == "in":
+                values = params[name]
+                type_ = column.type.coerce_compared_value(operators.in_op, values[0]) if values else None
+                conditions.append(column.in_(bindparam(name, expanding=True, type_=type_)))
+            else:
+                sql_operator, build_condition, _ = _OPERATORS[op]
+                conditions.append(build_condition(column, _compared_param(column, name, sql_operator, params[name])))
+        return conditions
 
-        column = getattr(self.model, field_name)
-
-        # Map of operators to their implementations
-        operator_map = {
-            "lt": lambda col, val: col < val,
-            "lte": lambda col, val: col <= val,
-            "le": lambda col, val: col <= val,
-            "gt": lambda col, val: col > val,
-            "gte": lambda col, val: col >= val,
-            "ge": lambda col, val: col >= val,
-            "ne": lambda col, val: col != val,
-            "like": lambda col, val: col.like(f"%{val}%"),
-            "ilike": lambda col, val: col.ilike(f"%{val}%"),
-            "startswith": lambda col, val: col.like(f"{val}%"),
-            "endswith": lambda col, val: col.like(f"%{val}"),
-            # "contains": lambda col, val: col.like(f"%{val}%"),
-            "contains": lambda col, val: col.contains(val),
-        }
+    def build_list_statements(
+        self,
+        search_filters: Dict[str, Any] | None = None,
+        output_filters: List[str] | None = None,
+        sort_by: str | None = None,
+        sort_desc: bool | None = False,
+        paginate: bool = False,
+        nested_output_filters: Dict[str, List[str]] | None = None,
+    ) -> Tuple[Any, Any, Dict[str, Any]]:
+        """
+        Build the query and count statements of a list request, or reuse them from the statement cache.
+        Paginated statements take "offset" and "limit" parameters.
 
-        # Handle special cases
-        if op == "between" and isinstance(value, (list, tuple)) and len(value) == 2:
-            return column.between(value[0], value[1])
-        elif op == "in" and isinstance(value, (list, tuple)):
-            return column.in_(value)
-        elif op in operator_map:
-            return operator_map[op](column, value)
-        else:
-            logger.warning(f"Unsupported operator: {op}")
-            return None
+        :return: query, count query and the parameters of the filter values.
+        """
+        filters, params = self._filter_plan(search_filters)
+        key = (
+            self.model,
+            tuple(output_filters) if output_filters else None,
+            tuple((name, tuple(fields or ())) for name, fields in sorted(nested_output_filters.items()))
+            if nested_output_filters
+            else None,
+            filters,
+            sort_by,
+            bool(sort_desc),
+            paginate,
+        )
+
+        statements = self._statement_cache.get(key)
+        if statements is not None:
+            self._statement_cache.move_to_end(key)
+            return (*statements, params)
+
+        conditions = self._build_conditions(filters, params)
+        query = self.build_query_with_output_filters(output_filters, nested_output_filters).where(*conditions)
+        query = self.apply_sorting(query, sort_by, sort_desc)
+        if paginate:
+            query = query.offset(bindparam("offset")).limit(bindparam("limit"))
+        count_query = select(func.count()).select_from(select(self.model).where(*conditions).subquery())
+
+        self._statement_cache[key] = (query, count_query)
+        if len(self._statement_cache) > STATEMENT_CACHE_SIZE:
+            self._statement_cache.popitem(last=False)
+        return query, count_query, params
+
+    def get_by_id_statement(self):
+        """Statement selecting the model by its "id" parameter."""
+        key = (self.model, "get")
+        statement = self._statement_cache.get(key)
+        if statement is None:
+            statement = self._statement_cache[key] = select(self.model).where(self.model.id == bindparam("id"))
+        return statement
 
     def apply_sorting(self, query, sort_by: str | None = None, sort_desc: bool = False):
         """Apply sorting to the query."""
@@ -181,12 +380,16 @@ class QueryHelper(Generic[DataObject]):
 
         return query
 
-    def process_query_results(self, result, output_filters: List[str] | None = None):
+    def process_query_results(
+        self,
+        result,
+        output_filters: List[str] | None = None,
+        nested_output_filters: Dict[str, List[str]] | None = None,
+    ):
         """Process query results based on output filters."""
-        requested_relationships = self._requested_relationships(output_filters)
-        if output_filters and requested_relationships:
-            model_column_names = self._column_names()
-            scalar_filters = [field for field in output_filters if field in model_column_names]
+        requested_relationships = self._requested_relationships(output_filters, nested_output_filters)
+        if requested_relationships:
+            scalar_filters = self._projected_columns(output_filters, nested_output_filters)
             return [
                 self._serialize_projected_model(entity, scalar_filters, requested_relationships)
                 for entity in result.scalars().all()
@@ -230,7 +433,7 @@ class QueryHelper(Generic[DataObject]):
     @staticmethod
     def _serialize_related_model(entity: Any, fields: List[str]) -> dict:
         if not fields:
-            fields = [column.key for column in inspect(entity.__class__).column_attrs]
+            fields = ModelMetadata.of(entity.__class__).column_keys
         return {field: getattr(entity, field) for field in fields}
 
 
@@ -251,10 +454,17 @@ class BaseDAO(Generic[DataObject]):
         """Hook for subclasses to modify entity before updating."""
         pass
 
+    async def post_commit_hook(self, entity: DataObject) -> None:
+        """Hook for subclasses to react on a committed create, update or delete of entity."""
+        pass
+
     async def get(self, id: int) -> Optional[DataObject]:
+        return await self._get_from_session(id)
+
+    async def _get_from_session(self, id: int) -> Optional[DataObject]:
+        """Load the entity into the session. Writes always use this, bypassing overrides of `get`."""
         logger.debug("Fetching {} with id: {}", self.model.__name__, id)
-        query = select(self.model).where(self.model.id == id)
-        result = await self.session.execute(query)
+        result = await self.session.execute(self.query_helper.get_by_id_statement(), {"id": id})
         obj = result.scalars().first()
         if obj:
             logger.debug("Found {}: {}", self.model.__name__, obj)
@@ -270,6 +480,7 @@ class BaseDAO(Generic[DataObject]):
         output_filters: List[str] | None = None,
         sort_by: str | None = "id",
         sort_desc: bool | None = False,
+        nested_output_filters: Dict[str, List[str]] | None = None,
     ) -> Tuple[List[Optional[DataObject]], int, int]:
         """
         Get all/filtered models with limit/offset pagination.
@@ -280,32 +491,31 @@ class BaseDAO(Generic[DataObject]):
         :param output_filters: List of column names to include in the output.
         :param sort_by: Column name to sort the results by.
         :param sort_desc: Whether to sort in descending order or not.
+        :param nested_output_filters: Relationship names to the column names of related rows to include,
+            e.g. {"challenge_tasks": ["id", "task_name"]}. Only those columns are selected.
+        :raises SearchUnavailableException: for "__match" and "__search" filters on databases other than SQLite.
         :return: A tuple containing the challenge list, total pages, and total record count.
         """
         logger.debug("Fetching all entities of {}", self.model.__name__)
+        if search_filters and any(field.rsplit("__", 1)[-1] in FULL_TEXT_OPERATORS for field in search_filters):
+            ensure_full_text_search(self.session)
 
-        # Step 1: Create base query with output filters
-        query = self.query_helper.build_query_with_output_filters(output_filters)
-
-        # Step 2: Apply search filters
-        query, base_query_for_count = self.query_helper.apply_search_filters(query, search_filters)
-
-        # Step 3: Apply sorting
-        query = self.query_helper.apply_sorting(query, sort_by, sort_desc)
-
-        # Step 4: Apply pagination only if limit is provided
-        if limit is not None and limit > 0:
-            query = query.offset(offset or 0).limit(limit)
+        # Step 1: Build query and count statements with output filters, search filters and sorting,
+        # pagination only if limit is provided
+        paginate = limit is not None and limit > 0
+        query, count_query, params = self.query_helper.build_list_statements(
+            search_filters, output_filters, sort_by, sort_desc, paginate, nested_output_filters
+        )
 
-        # Step 5: Execute query and process results
-        result = await self.session.execute(query)
-        rows = self.query_helper.process_query_results(result, output_filters)
+        # Step 2: Execute query and process results
+        query_params = {**params, "offset": max(offset or 0, 0), "limit": limit} if paginate else params
+        result = await self.session.execute(query, query_params)
+        rows = self.query_helper.process_query_results(result, output_filters, nested_output_filters)
 
-        # Step 6: Get total count for pagination
-        count_query = select(func.count()).select_from(base_query_for_count.subquery())
-        total_records = (await self.session.execute(count_query)).scalar() or 0
+        # Step 3: Get total count for pagination
+        total_records = (await self.session.execute(count_query, params)).scalar() or 0
 
-        # Step 7: Calculate total pages (1 page if no limit is set)
+        # Step 4: Calculate total pages (1 page if no limit is set)
         if limit is None:
             total_pages = 1
         else:
@@ -315,7 +525,7 @@ class BaseDAO(Generic[DataObject]):
 
     async def delete(self, id: int) -> None:
         logger.debug("Deleting {} with id: {}", self.model.__name__, id)
-        obj = await self.get(id)
+        obj = await self._get_from_session(id)
         if not obj:
             logger.error("{} with id {} not found for deletion.", self.model.__name__, id)
             raise NoResultFound(f"{str(self.model.__name__).replace('Model', '')} with id {id} not found for deletion.")
@@ -331,6 +541,7 @@ class BaseDAO(Generic[DataObject]):
         except Exception as e:
             logger.error("Error deleting {} with id {}: {}", self.model.__name__, id, e)
             raise Exception(f"Error deleting {self.model.__name__}") from e
+        await self.post_commit_hook(obj)
 
     async def create_obj(self, obj: Dict) -> DataObject:
         await self.pre_create_hook(obj)
@@ -348,6 +559,7 @@ class BaseDAO(Generic[DataObject]):
             logger.error("Error creating {}: {}", self.model.__name__, e)
             raise Exception(f"Error creating {self.model.__name__}") from e
         await self.session.refresh(obj)
+        await self.post_commit_hook(obj)
         return obj
 
     async def update_obj(self, obj: DataObject) -> DataObject:
@@ -366,10 +578,11 @@ class BaseDAO(Generic[DataObject]):
             logger.error("Error updating {}: {}", self.model.__name__, e)
             raise Exception(f"Error updating {self.model.__name__}") from e
         await self.session.refresh(obj)
+        await self.post_commit_hook(obj)
         return obj
 
     async def update(self, id: int, obj: Dict) -> DataObject:
-        entity: Optional[DataObject] = await self.get(id)
+        entity: Optional[DataObject] = await self._get_from_session(id)
         if not entity:
             logger.error("{} with id {} not found for update: {}", self.model.__name__, id)
             raise NoResultFound("{} with id {} not found for update: {}", self.model.__name__, id)
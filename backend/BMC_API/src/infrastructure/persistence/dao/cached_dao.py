@@ -0,0 +1,239 @@
+# backend/BMC_API/src/infrastructure/persistence/dao/cached_dao.py
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.inspection import inspect
+
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
+from BMC_API.src.infrastructure.persistence.base import Base
+
+# Parent relationships of all cached models, filled in by CachedDAOMixin subclasses.
+_cache_parents: Dict[Type[Base], Tuple[str, ...]] = {}
+# Models embedded in cached entities whose repositories only invalidate, filled in by
+# CacheInvalidatingDAOMixin subclasses, e.g. the users owning challenges and tasks.
+_embedded_models: set[Type[Base]] = set()
+
+
+def _model_tag(model: Type[Base]) -> str:
+    return model.__name__
+
+
+def _entity_tag(model: Type[Base], id: Any) -> str:
+    return f"{model.__name__}:{id}"
+
+
+def _parent_relationships(model: Type[Base]):
+    mapper_relationships = inspect(model).relationships
+    return [mapper_relationships[name] for name in _cache_parents.get(model, ())]
+
+
+def _ancestor_model_tags(model: Type[Base], seen: set | None = None) -> List[str]:
+    seen = seen if seen is not None else {model}
+    tags = []
+    for relationship in _parent_relationships(model):
+        parent_model = relationship.mapper.class_
+        if parent_model in seen:
+            continue
+        seen.add(parent_model)
+        tags += [_model_tag(parent_model), *_ancestor_model_tags(parent_model, seen)]
+    return tags
+
+
+def _embedded_model_tags() -> List[str]:
+    return sorted(_model_tag(model) for model in _embedded_models)
+
+
+def _ancestor_entity_tags(entity: Base, seen: set | None = None) -> List[str]:
+    """Tags of the parents of entity, following loaded parent objects up to the root."""
+    model = type(entity)
+    seen = seen if seen is not None else {(model, entity.id)}
+    tags = []
+    for relationship in _parent_relationships(model):
+        parent_model = relationship.mapper.class_
+        parent_id = getattr(entity, next(iter(relationship.local_columns)).key, None)
+        if parent_id is None or (parent_model, parent_id) in seen:
+            continue
+        seen.add((parent_model, parent_id))
+        tags.append(_entity_tag(parent_model, parent_id))
+        parent = entity.__dict__.get(relationship.key)
+        if parent is not None:
+            tags += _ancestor_entity_tags(parent, seen)
+    return tags
+
+
+def _embedded_entity_tags(values: Iterable[Any]) -> List[str]:
+    """
+    Tags of the loaded entities of `_embedded_models` anywhere in the object graphs of values,
+    e.g. the owner of a challenge and the owners of its tasks.
+    """
+    if not _embedded_models:
+        return []
+    tags = set()
+    seen = set()
+    pending = [value for value in values if isinstance(value, Base)]
+    while pending:
+        entity = pending.pop()
+        if id(entity) in seen:
+            continue
+        seen.add(id(entity))
+        model = type(entity)
+        if model in _embedded_models:
+            tags.add(_entity_tag(model, entity.id))
+        for relationship in inspect(model).relationships:
+            # Only relationships loaded with the entity, unloaded ones are not cached either
+            related = entity.__dict__.get(relationship.key)
+            if isinstance(related, Base):
+                pending.append(related)
+            elif related is not None:
+                pending.extend(related)
+    return sorted(tags)
+
+
+class CachedDAOMixin:
+    """
+    Opt-in result cache for `BaseDAO.get` and `BaseDAO.list`.
+
+    Put it before BaseDAO in the bases of a repository. Entities are pickled into the cache and merged
+    into the session of the repository on hits, without querying. Writes of the DAO always load from the
+    session and invalidate:
+    - the entity and all lists of its model,
+    - every parent named in `cache_parents` and all lists of the parent models, so a task write
+      also drops its challenge. Parents are followed transitively through other cached models.
+
+    Entries carry the tags of their parents as well, so a parent write drops cached children that
+    embed it, and the tags of embedded entities of models with a `CacheInvalidatingDAOMixin` repository,
+    e.g. owners. Without a cache the DAO behaves like a plain BaseDAO.
+    """
+
+    # Relationship names of parents that embed this model, e.g. ("task_challenge",)
+    cache_parents: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, "model", None) is not None:
+            _cache_parents[cls.model] = tuple(cls.cache_parents)
+
+    def __init__(self, session: AsyncSession, cache: Optional[TaggedCache] = None) -> None:
+        super().__init__(session)
+        self.cache = cache
+
+    def _cache_key(self, operation: str, **params: Any) -> str:
+        normalized = json.dumps(params, sort_keys=True, default=str)
+        return f"{self.model.__name__}:{operation}:{hashlib.sha256(normalized.encode()).hexdigest()}"
+
+    async def _merge(self, value: Any) -> Any:
+        """Attach a cached entity to the session without loading it, so it behaves like a queried one."""
+        if isinstance(value, Base):
+            return await self.session.merge(value, load=False)
+        return value
+
+    async def get(self, id: int):
+        if self.cache is None:
+            return await super().get(id)
+
+        key = self._cache_key("get", id=id)
+        hit, entity = await self.cache.get(key)
+        if hit:
+            logger.debug("Cache hit for {} with id: {}", self.model.__name__, id)
+            return await self._merge(entity)
+
+        # Versions are taken before loading, so writes committed in between invalidate the entry. The tags of
+        # parents and embedded entities are only known after loading, the tags of their models guard them.
+        versions = await self.cache.tag_versions([_entity_tag(self.model, id)])
+        guard = await self.cache.tag_versions([*_ancestor_model_tags(self.model), *_embedded_model_tags()])
+        entity = await super().get(id)
+        if entity is not None:
+            tags = _ancestor_entity_tags(entity) + _embedded_entity_tags([entity])
+            versions = await self._add_tag_versions(versions, tags, guard)
+            await self.cache.set(key, entity, versions)
+        return entity
+
+    async def list(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        search_filters: Dict[str, Any] | None = None,
+        output_filters: List[str] | None = None,
+        sort_by: str | None = "id",
+        sort_desc: bool | None = False,
+        nested_output_filters: Dict[str, List[str]] | None = None,
+    ):
+        params = dict(
+            limit=limit,
+            offset=offset,
+            search_filters=search_filters,
+            output_filters=output_filters,
+            sort_by=sort_by,
+            sort_desc=sort_desc,
+            nested_output_filters=nested_output_filters,
+        )
+        if self.cache is None:
+            return await super().list(**params)
+
+        key = self._cache_key("list", **params)
+        hit, result = await self.cache.get(key)
+        if hit:
+            logger.debug("Cache hit for list of {}", self.model.__name__)
+            rows, total_pages, total_records = result
+            return [await self._merge(row) for row in rows], total_pages, total_records
+
+        versions = await self.cache.tag_versions([_model_tag(self.model), *_ancestor_model_tags(self.model)])
+        guard = await self.cache.tag_versions(_embedded_model_tags())
+        result = await super().list(**params)
+        versions = await self._add_tag_versions(versions, _embedded_entity_tags(result[0]), guard)
+        await self.cache.set(key, result, versions)
+        return result
+
+    async def _add_tag_versions(
+        self, versions: Dict[str, bytes] | None, tags: List[str], guard: Dict[str, bytes] | None
+    ) -> Dict[str, bytes] | None:
+        """
+        Add the versions of tags known after loading, None if nothing may be cached: versions are unavailable,
+        or a write of the models in `guard` committed since loading began. Its invalidation may have changed
+        the versions of `tags` before they were read, so the loaded entity would be stored under new versions.
+        """
+        if versions is None or guard is None:
+            return None
+        tag_versions = await self.cache.tag_versions(tags) if tags else {}
+        if tag_versions is None or (guard and await self.cache.tag_versions(guard) != guard):
+            return None
+        return {**versions, **tag_versions}
+
+    async def post_commit_hook(self, entity) -> None:
+        await super().post_commit_hook(entity)
+        if self.cache is None:
+            return
+        await self.cache.invalidate(
+            _model_tag(self.model),
+            _entity_tag(self.model, entity.id),
+            *_ancestor_model_tags(self.model),
+            *_ancestor_entity_tags(entity),
+        )
+
+
+class CacheInvalidatingDAOMixin:
+    """
+    Cache invalidation for repositories of models that cached entities embed, without caching their own
+    results, e.g. users, which are loaded as owners with every challenge and task. Writes drop the cached
+    entries embedding the written entity, and bump the tag of the model, so entities loaded meanwhile are
+    not cached. Custom write methods call `post_commit_hook` after committing.
+
+    Put it before BaseDAO in the bases of a repository.
+    """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, "model", None) is not None:
+            _embedded_models.add(cls.model)
+
+    def __init__(self, session: AsyncSession, cache: Optional[TaggedCache] = None) -> None:
+        super().__init__(session)
+        self.cache = cache
+
+    async def post_commit_hook(self, entity) -> None:
+        await super().post_commit_hook(entity)
+        if self.cache is not None:
+            await self.cache.invalidate(_entity_tag(self.model, entity.id), _model_tag(self.model))
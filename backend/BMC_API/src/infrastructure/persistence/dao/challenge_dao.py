@@ -1,21 +1,32 @@
 # backend/BMC_API/src/infrastructure/persistence/dao/challenge_dao.py
 
+from typing import List, Optional
+
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from BMC_API.src.domain.entities.challenge_model import ChallengeModel
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
 from BMC_API.src.infrastructure.persistence.dao.base_dao import BaseDAO
+from BMC_API.src.infrastructure.persistence.dao.cached_dao import CachedDAOMixin
+from BMC_API.src.infrastructure.persistence.search import search_challenges
 
 
-class SQLAlchemyChallengeRepository(BaseDAO[ChallengeModel]):
+class SQLAlchemyChallengeRepository(CachedDAOMixin, BaseDAO[ChallengeModel]):
     """Class for accessing challenge table."""
 
     # Set the model attribute so BaseDAO functions know which model to use.
     model = ChallengeModel
+    # Writes also invalidate the cached parent
+    cache_parents = ("challenge_conference",)
 
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session)
+    def __init__(self, session: AsyncSession, cache: Optional[TaggedCache] = None) -> None:
+        super().__init__(session, cache)
         logger.debug(
             "SQLAlchemyChallengeRepository initialized for model: {}",
             self.model.__name__,
         )
+
+    async def search(self, terms: str, limit: int) -> List[dict]:
+        """Challenges ranked by full-text search over challenge and task text, see `search_challenges`."""
+        return await search_challenges(self.session, terms, limit)
@@ -1,20 +1,26 @@
 # backend/BMC_API/src/infrastructure/persistence/dao/challenge_history_dao.py
 
+from typing import Optional
+
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from BMC_API.src.domain.entities.challenge_history_model import ChallengeHistoryModel
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
 from BMC_API.src.infrastructure.persistence.dao.base_dao import BaseDAO
+from BMC_API.src.infrastructure.persistence.dao.cached_dao import CachedDAOMixin
 
 
-class SQLAlchemyChallengeHistoryRepository(BaseDAO[ChallengeHistoryModel]):
+class SQLAlchemyChallengeHistoryRepository(CachedDAOMixin, BaseDAO[ChallengeHistoryModel]):
     """Class for accessing challenge table."""
 
     # Set the model attribute so BaseDAO functions know which model to use.
     model = ChallengeHistoryModel
+    # Writes also invalidate the cached parent
+    cache_parents = ("challenge",)
 
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session)
+    def __init__(self, session: AsyncSession, cache: Optional[TaggedCache] = None) -> None:
+        super().__init__(session, cache)
         logger.debug(
             "SQLAlchemyChallengeHistoryRepository initialized for model: {}",
             self.model.__name__,
@@ -1,20 +1,22 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from BMC_API.src.domain.entities.conference_model import ConferenceModel
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
 from BMC_API.src.infrastructure.persistence.dao.base_dao import BaseDAO
+from BMC_API.src.infrastructure.persistence.dao.cached_dao import CachedDAOMixin
 
 
-class SQLAlchemyConferenceRepository(BaseDAO[ConferenceModel]):
+class SQLAlchemyConferenceRepository(CachedDAOMixin, BaseDAO[ConferenceModel]):
     """Class for accessing conference table."""
 
     # Set the model attribute so BaseDAO functions know which model to use.
     model = ConferenceModel
 
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session)
+    def __init__(self, session: AsyncSession, cache: Optional[TaggedCache] = None) -> None:
+        super().__init__(session, cache)
         logger.debug(
             "SQLAlchemyconferenceRepository initialized for model: {}",
             self.model.__name__,
@@ -1,20 +1,26 @@
 # backend/BMC_API/src/infrastructure/persistence/dao/task_history_dao.py
 
+from typing import Optional
+
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from BMC_API.src.domain.entities.task_history_model import TaskHistoryModel
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
 from BMC_API.src.infrastructure.persistence.dao.base_dao import BaseDAO
+from BMC_API.src.infrastructure.persistence.dao.cached_dao import CachedDAOMixin
 
 
-class SQLAlchemyTaskHistoryRepository(BaseDAO[TaskHistoryModel]):
+class SQLAlchemyTaskHistoryRepository(CachedDAOMixin, BaseDAO[TaskHistoryModel]):
     """Class for accessing challenge table."""
 
     # Set the model attribute so BaseDAO functions know which model to use.
     model = TaskHistoryModel
+    # Writes also invalidate the cached parent
+    cache_parents = ("task",)
 
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session)
+    def __init__(self, session: AsyncSession, cache: Optional[TaggedCache] = None) -> None:
+        super().__init__(session, cache)
         logger.debug(
             "SQLAlchemyTaskHistoryRepository initialized for model: {}",
             self.model.__name__,
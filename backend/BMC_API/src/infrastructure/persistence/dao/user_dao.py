@@ -11,15 +11,17 @@ from BMC_API.src.core.exceptions import (
     RepositoryException,
 )
 from BMC_API.src.domain.entities.user_model import UserModel
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
 from BMC_API.src.infrastructure.persistence.dao.base_dao import BaseDAO
+from BMC_API.src.infrastructure.persistence.dao.cached_dao import CacheInvalidatingDAOMixin
 
 
-class SQLAlchemyUserRepository(BaseDAO[UserModel]):
+class SQLAlchemyUserRepository(CacheInvalidatingDAOMixin, BaseDAO[UserModel]):
     # Set the model attribute so BaseDAO functions know which model to use.
     model = UserModel
 
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(session)
+    def __init__(self, session: AsyncSession, cache: Optional[TaggedCache] = None) -> None:
+        super().__init__(session, cache)
         logger.debug("SQLAlchemyUserRepository initialized for model: {}", self.model.__name__)
 
     async def get_by_email(self, email: str) -> Optional[UserModel]:
@@ -50,6 +52,7 @@ class SQLAlchemyUserRepository(BaseDAO[UserModel]):
 
         try:
             await self.session.commit()
+            await self.post_commit_hook(user)
             logger.debug("User  confirmed: {}", user.email)
         except IntegrityError as e:
             await self.session.rollback()
@@ -69,6 +72,7 @@ class SQLAlchemyUserRepository(BaseDAO[UserModel]):
         user.modified_time = datetime.now()
         try:
             await self.session.commit()
+            await self.post_commit_hook(user)
             logger.debug("Password reset successfully for user: {}", user.email)
         except IntegrityError as e:
             await self.session.rollback()
@@ -88,6 +92,7 @@ class SQLAlchemyUserRepository(BaseDAO[UserModel]):
             user.last_login_time = datetime.now()
             await self.session.commit()
             await self.session.refresh(user)
+            await self.post_commit_hook(user)
             logger.debug("Login successful for user: {}", user.email)
         except IntegrityError as e:
             logger.error("Error during logging user with ID: {}. Error: {e}", user.id, e)
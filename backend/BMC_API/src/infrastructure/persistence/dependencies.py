@@ -1,17 +1,30 @@
 # backend/BMC_API/src/infrastructure/persistence/dependencies.py
-import glob
+import asyncio
 import os
-import sqlite3
 import time
 from datetime import datetime
 from typing import AsyncGenerator
 
 from fastapi import HTTPException, status
 from loguru import logger
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from starlette.requests import Request
 
 from BMC_API.src.core.config.settings import settings
+from BMC_API.src.infrastructure.persistence.backup import (
+    BACKUP_EXTENSION,
+    list_backup_files,
+    online_backup,
+    pg_dump_backup,
+    remove_backup_file,
+)
+from BMC_API.src.infrastructure.persistence.engine import create_db_engine
+from BMC_API.src.infrastructure.persistence.incremental_backup import (
+    create_snapshot,
+    delete_snapshots,
+    list_snapshots,
+)
+from BMC_API.src.infrastructure.persistence.query_log import QueryLog
 
 
 def create_db_session() -> AsyncSession:  # pragma: no cover
@@ -24,7 +37,7 @@ def create_db_session() -> AsyncSession:  # pragma: no cover
 
     :param app: fastAPI application.
     """
-    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
+    engine = create_db_engine()
     session_factory = async_sessionmaker(
         engine,
         expire_on_commit=False,
@@ -50,28 +63,62 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
         await session.close()
 
 
-async def backup_database(file_name: str | None = None):
-    db_file = str(settings.db_file_abs)
-    if os.path.exists(db_file):
-        # Connect current database
-        src = sqlite3.connect(db_file)
+async def get_read_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create and get a database session of read-only endpoints, from the read engine if there is one.
+    Nothing is committed, writes fail on the read-only SQLite connection.
+
+    :param request: current request.
+    :yield: database session.
+    """
+    session: AsyncSession = request.app.state.db_read_session_factory()
+
+    try:  # noqa: WPS501
+        yield session
+    finally:
+        await session.close()
+
 
-        # Arrange backup folder
-        backup_folder = str(settings.backup_folder)
-        if not os.path.exists(backup_folder):
-            os.mkdir(backup_folder)
+def get_query_log(request: Request) -> QueryLog | None:
+    """
+    Returns the statement log of the database engine, None if `db_query_log_enabled` is off.
+
+    :param request: current request.
+    :returns: query log.
+    """
+    return request.app.state.query_log
+
+
+def _backup_file_location(file_name: str | None, extension: str) -> str:
+    # Arrange backup folder
+    backup_folder = str(settings.backup_folder)
+    if not os.path.exists(backup_folder):
+        os.mkdir(backup_folder)
 
-        # Create backup filename and location
-        if file_name:
-            backup_file_name = file_name + ".sqlite3"
+    # Create backup filename and location
+    if not file_name:
+        file_name = "database_" + datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    return os.path.join(backup_folder, file_name + extension)
 
-        else:
-            backup_file_name = "database_" + datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + ".sqlite3"
-        backup_file_location = os.path.join(backup_folder, backup_file_name)
+
+async def backup_database(file_name: str | None = None):
+    if settings.db_backend == "postgresql":
+        return await _pg_dump_database(file_name)
+
+    db_file = str(settings.db_file_abs)
+    if os.path.exists(db_file):
+        backup_file_location = _backup_file_location(file_name, BACKUP_EXTENSION)
 
         try:
-            dst = sqlite3.connect(backup_file_location)  # Connect backup database
-            src.backup(dst)  # Make backup
+            # The copy runs in a thread, so the event loop keeps serving requests
+            backup_file_location = await asyncio.to_thread(
+                online_backup,
+                db_file,
+                backup_file_location,
+                pages_per_step=settings.db_backup_pages_per_step,
+                step_sleep=settings.db_backup_step_sleep_in_sec,
+                compression=settings.db_backup_compression,
+            )
             logger.info(f"Database backup created: {backup_file_location}")
 
         except Exception as e:
@@ -81,6 +128,47 @@ async def backup_database(file_name: str | None = None):
         return backup_file_location
 
 
+async def _pg_dump_database(file_name: str | None) -> str:
+    backup_file_location = _backup_file_location(file_name, "")
+    try:
+        backup_file_location = await asyncio.to_thread(
+            pg_dump_backup,
+            backup_file_location,
+            settings.db_host,
+            settings.db_port,
+            settings.db_user,
+            settings.db_pass,
+            settings.db_base,
+            pg_dump_path=settings.db_pg_dump_path,
+        )
+        logger.info(f"Database backup created: {backup_file_location}")
+    except Exception as e:
+        logger.error(e)
+        raise
+    return backup_file_location
+
+
+async def snapshot_database() -> dict | None:
+    """Create an incremental snapshot of the database in the backup folder, SQLite only."""
+    if settings.db_backend != "sqlite":
+        return None
+    db_file = str(settings.db_file_abs)
+    if not os.path.exists(db_file):
+        return None
+    try:
+        return await asyncio.to_thread(
+            create_snapshot,
+            db_file,
+            str(settings.backup_folder),
+            chunk_size=settings.db_backup_chunk_size_in_kb * 1024,
+            pages_per_step=settings.db_backup_pages_per_step,
+            step_sleep=settings.db_backup_step_sleep_in_sec,
+        )
+    except Exception as e:
+        logger.error(e)
+        raise
+
+
 async def delete_db_backups(delete_all_backups: bool = False) -> list:
     # Get the backup folder path
     backup_folder = str(settings.backup_folder)
@@ -91,20 +179,26 @@ async def delete_db_backups(delete_all_backups: bool = False) -> list:
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Backup folder does not exist",
         )
-    # Find all *.sqlite3 files in the backup folder
-    sqlite_files = glob.glob(os.path.join(backup_folder, "*.sqlite3"))
-    sqlite_files.sort(key=os.path.getctime)
+    # Find all backup files in the backup folder
+    sqlite_files = list_backup_files(backup_folder)
     # Delete all backups except the latest one if delete_all_backups is False
-    if not delete_all_backups:
+    if not delete_all_backups and sqlite_files:
         sqlite_files.pop(-1)
     try:
         # Remove each backup file
         for file in sqlite_files:
-            os.remove(file)
+            remove_backup_file(file)
             logger.info(f"Database backup removed: {file}")
     except Exception as e:
         logger.error(str(e))
         raise
+
+    # Incremental snapshots follow the same rule
+    snapshot_ids = [manifest["id"] for manifest in list_snapshots(backup_folder)]
+    if not delete_all_backups:
+        snapshot_ids = snapshot_ids[:-1]
+    if snapshot_ids:
+        sqlite_files += await asyncio.to_thread(delete_snapshots, backup_folder, snapshot_ids)
     return sqlite_files
 
 
@@ -118,22 +212,34 @@ async def clean_database_backups(age_limit: int) -> list:
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Backup folder does not exist",
         )
-    # Find all *.sqlite3 files in the backup folder
-    sqlite_files = glob.glob(os.path.join(backup_folder, "*.sqlite3"))
-    sqlite_files.sort(key=os.path.getctime)
+    # Find all backup files in the backup folder
+    sqlite_files = list_backup_files(backup_folder)
 
     # Delete all backups older than age_limit in days
 
     # target_time = time.time() - age_limit*60*60*24
     target_time = time.time() - age_limit * 60 * 60 * 1
     older_backups = [file for file in sqlite_files if os.path.getctime(file) < target_time]
+    removed = []
     if len(older_backups) >= 2:
         try:
             # Remove each backup file
             for file in older_backups:
-                os.remove(file)
+                remove_backup_file(file)
                 logger.info(f"Database backup removed: {file}")
         except Exception as e:
             logger.error(str(e))
             raise
-        return older_backups
+        removed += older_backups
+
+    # Incremental snapshots: drop old manifests, always keeping the latest one, then unreferenced chunks
+    snapshots = list_snapshots(backup_folder)
+    older_snapshots = [
+        manifest["id"]
+        for manifest in snapshots[:-1]
+        if datetime.fromisoformat(manifest["created"]).timestamp() < target_time
+    ]
+    if older_snapshots:
+        removed += await asyncio.to_thread(delete_snapshots, backup_folder, older_snapshots)
+
+    return removed or None
@@ -0,0 +1,51 @@
+# backend/BMC_API/src/infrastructure/persistence/engine.py
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.infrastructure.persistence.sqlite import configure_sqlite_engine
+
+
+def engine_options() -> Dict[str, Any]:
+    """
+    Keyword arguments of `create_async_engine` for the configured database backend.
+    SQLite keeps the SQLAlchemy defaults, PostgreSQL gets a sized connection pool.
+    """
+    if settings.db_backend != "postgresql":
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_in_sec,
+        "pool_recycle": settings.db_pool_recycle_in_sec,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def create_db_engine(url: Optional[str] = None, **kwargs: Any) -> AsyncEngine:
+    """
+    Create the engine of the configured database, with the SQLite connection profile if it is SQLite.
+
+    :param url: database URL, `settings.db_url` by default.
+    :param kwargs: extra arguments of `create_async_engine`, they override the pool options.
+    :return: async engine.
+    """
+    options = {**engine_options(), **kwargs}
+    engine = create_async_engine(url or str(settings.db_url), echo=settings.db_echo, **options)
+    configure_sqlite_engine(engine)
+    return engine
+
+
+def create_read_engine(**kwargs: Any) -> Optional[AsyncEngine]:
+    """
+    Create the engine of read-only sessions, see `settings.db_read_url`.
+    SQLite in WAL mode lets its readers proceed while a writer holds the lock.
+
+    :param kwargs: extra arguments of `create_async_engine`.
+    :return: async engine, None if reads use the writer engine.
+    """
+    url = settings.db_read_url
+    if url is None:
+        return None
+    return create_db_engine(url, pool_size=settings.db_read_pool_size, **kwargs)
@@ -0,0 +1,167 @@
+# backend/BMC_API/src/infrastructure/persistence/incremental_backup.py
+import hashlib
+import json
+import os
+import time
+import uuid
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+from loguru import logger
+
+from BMC_API.src.infrastructure.persistence.backup import copy_database, fsync_file
+
+SNAPSHOTS_FOLDER = "snapshots"
+CHUNKS_FOLDER = "chunks"
+MANIFEST_EXTENSION = ".json"
+# Chunks touched within this period are never garbage collected, they may belong to a snapshot in progress
+CHUNK_GRACE_PERIOD_IN_SEC = 3600
+
+
+def _chunk_path(backup_folder: str, digest: str) -> str:
+    return os.path.join(backup_folder, CHUNKS_FOLDER, digest[:2], digest)
+
+
+def _manifest_path(backup_folder: str, snapshot_id: str) -> str:
+    return os.path.join(backup_folder, SNAPSHOTS_FOLDER, snapshot_id + MANIFEST_EXTENSION)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def create_snapshot(
+    db_file: str,
+    backup_folder: str,
+    chunk_size: int = 64 * 1024,
+    pages_per_step: int = 256,
+    step_sleep: float = 0.01,
+) -> Dict[str, Any]:
+    """
+    Incremental backup of a live SQLite database. Blocking, run it in a thread.
+
+    A consistent online copy is split into fixed-size chunks, aligned to database pages for chunk sizes
+    that are a multiple of the page size. Chunks are stored once under their sha256 (zlib compressed), so
+    a snapshot only writes the chunks that changed since earlier snapshots. The manifest lists the chunks
+    in order and is written last, so a snapshot exists only when all of its chunks do.
+
+    :return: manifest of the new snapshot.
+    """
+    snapshot_id = "database_" + datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+    temp_copy = os.path.join(backup_folder, f".{snapshot_id}.{uuid.uuid4().hex}.tmp")
+    os.makedirs(backup_folder, exist_ok=True)
+
+    chunks: List[str] = []
+    written = 0
+    file_digest = hashlib.sha256()
+    try:
+        copy_database(db_file, temp_copy, pages_per_step, step_sleep)
+        with open(temp_copy, "rb") as copy:
+            for chunk in iter(lambda: copy.read(chunk_size), b""):
+                file_digest.update(chunk)
+                digest = hashlib.sha256(chunk).hexdigest()
+                chunks.append(digest)
+                path = _chunk_path(backup_folder, digest)
+                if os.path.exists(path):
+                    os.utime(path)
+                else:
+                    _write_atomic(path, zlib.compress(chunk, 6))
+                    written += 1
+        size = os.path.getsize(temp_copy)
+    finally:
+        if os.path.exists(temp_copy):
+            os.remove(temp_copy)
+
+    manifest = {
+        "id": snapshot_id,
+        "created": datetime.now().isoformat(),
+        "size": size,
+        "sha256": file_digest.hexdigest(),
+        "chunk_size": chunk_size,
+        "chunks": chunks,
+        "new_chunks": written,
+    }
+    _write_atomic(_manifest_path(backup_folder, snapshot_id), json.dumps(manifest).encode("utf-8"))
+    logger.info(f"Database snapshot {snapshot_id} created: {written} of {len(chunks)} chunks written")
+    return manifest
+
+
+def read_manifest(backup_folder: str, snapshot_id: str) -> Dict[str, Any]:
+    path = _manifest_path(backup_folder, os.path.basename(snapshot_id))
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Snapshot {snapshot_id} not found")
+    with open(path, "rb") as file:
+        return json.load(file)
+
+
+def list_snapshots(backup_folder: str) -> List[Dict[str, Any]]:
+    """Manifests of all snapshots, oldest first."""
+    snapshots_folder = os.path.join(backup_folder, SNAPSHOTS_FOLDER)
+    if not os.path.exists(snapshots_folder):
+        return []
+    manifests = [
+        read_manifest(backup_folder, name.removesuffix(MANIFEST_EXTENSION))
+        for name in os.listdir(snapshots_folder)
+        if name.endswith(MANIFEST_EXTENSION)
+    ]
+    return sorted(manifests, key=lambda manifest: manifest["created"])
+
+
+def restore_snapshot(backup_folder: str, snapshot_id: str, target: str) -> str:
+    """
+    Reassemble a snapshot into a database file. The file is checked against the sha256
+    of the manifest and renamed into place atomically.
+
+    :return: path of the restored database.
+    """
+    manifest = read_manifest(backup_folder, snapshot_id)
+    temp_target = f"{target}.{uuid.uuid4().hex}.tmp"
+    digest = hashlib.sha256()
+    try:
+        with open(temp_target, "wb") as restored:
+            for chunk_digest in manifest["chunks"]:
+                with open(_chunk_path(backup_folder, chunk_digest), "rb") as chunk_file:
+                    chunk = zlib.decompress(chunk_file.read())
+                digest.update(chunk)
+                restored.write(chunk)
+        if digest.hexdigest() != manifest["sha256"]:
+            raise RuntimeError(f"Restored snapshot {snapshot_id} does not match its checksum")
+        fsync_file(temp_target)
+        os.replace(temp_target, target)
+    finally:
+        if os.path.exists(temp_target):
+            os.remove(temp_target)
+    return target
+
+
+def delete_snapshots(backup_folder: str, snapshot_ids: Iterable[str]) -> List[str]:
+    """Delete snapshot manifests and the chunks no remaining snapshot refers to."""
+    deleted = []
+    for snapshot_id in snapshot_ids:
+        os.remove(_manifest_path(backup_folder, snapshot_id))
+        deleted.append(snapshot_id)
+
+    referenced = {digest for manifest in list_snapshots(backup_folder) for digest in manifest["chunks"]}
+    chunks_folder = os.path.join(backup_folder, CHUNKS_FOLDER)
+    grace_limit = time.time() - CHUNK_GRACE_PERIOD_IN_SEC
+    removed_chunks = 0
+    if os.path.exists(chunks_folder):
+        for prefix in os.listdir(chunks_folder):
+            for digest in os.listdir(os.path.join(chunks_folder, prefix)):
+                path = os.path.join(chunks_folder, prefix, digest)
+                if digest not in referenced and os.path.getmtime(path) < grace_limit:
+                    os.remove(path)
+                    removed_chunks += 1
+    logger.info(f"Database snapshots removed: {deleted}, unreferenced chunks removed: {removed_chunks}")
+    return deleted
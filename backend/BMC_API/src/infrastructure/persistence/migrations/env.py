@@ -8,6 +8,7 @@ from sqlalchemy.future import Connection
 from BMC_API.src.core.config.settings import settings
 from BMC_API.src.domain.entities import load_all_models
 from BMC_API.src.infrastructure.persistence.meta import meta
+from BMC_API.src.infrastructure.persistence.search import is_search_table
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -26,6 +27,12 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = meta
 
+
+def include_name(name, type_, parent_names) -> bool:
+    """Full-text search indexes and their shadow tables are created by hand, autogenerate skips them."""
+    return not (type_ == "table" and is_search_table(name))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -48,6 +55,7 @@ async def run_migrations_offline() -> None:
     context.configure(
         url=str(settings.db_url),
         target_metadata=target_metadata,
+        include_name=include_name,
         render_as_batch=True,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
@@ -66,6 +74,7 @@ def do_run_migrations(connection: Connection) -> None:
     context.configure(
         connection=connection,
         target_metadata=target_metadata,
+        include_name=include_name,
         render_as_batch=True,
     )
 
@@ -0,0 +1,64 @@
+"""add composite indexes for history lookups and hot filters
+
+Revision ID: 5f3a9c2d7e41
+Revises: eaf0735601ce
+Create Date: 2026-10-19 09:12:05.318422
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5f3a9c2d7e41"
+down_revision = "eaf0735601ce"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("challenge_histories", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_challenge_histories_challenge_id_timestamp",
+            ["challenge_id", sa.text("timestamp DESC")],
+            unique=False,
+        )
+
+    with op.batch_alter_table("task_histories", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_task_histories_task_id_timestamp",
+            ["task_id", sa.text("timestamp DESC")],
+            unique=False,
+        )
+
+    with op.batch_alter_table("challenges", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_challenges_owner_id_created_time",
+            ["challenge_owner_id", sa.text("challenge_created_time DESC")],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_challenges_conference_id_status", ["challenge_conference_id", "challenge_status"], unique=False
+        )
+        batch_op.create_index("ix_challenges_status", ["challenge_status"], unique=False)
+
+    with op.batch_alter_table("tasks", schema=None) as batch_op:
+        batch_op.create_index("ix_tasks_task_challenge_id", ["task_challenge_id"], unique=False)
+        batch_op.create_index("ix_tasks_task_owner_id", ["task_owner_id"], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("tasks", schema=None) as batch_op:
+        batch_op.drop_index("ix_tasks_task_owner_id")
+        batch_op.drop_index("ix_tasks_task_challenge_id")
+
+    with op.batch_alter_table("challenges", schema=None) as batch_op:
+        batch_op.drop_index("ix_challenges_status")
+        batch_op.drop_index("ix_challenges_conference_id_status")
+        batch_op.drop_index("ix_challenges_owner_id_created_time")
+
+    with op.batch_alter_table("task_histories", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_histories_task_id_timestamp")
+
+    with op.batch_alter_table("challenge_histories", schema=None) as batch_op:
+        batch_op.drop_index("ix_challenge_histories_challenge_id_timestamp")
@@ -0,0 +1,94 @@
+"""add full-text search indexes over challenges and tasks
+
+Revision ID: 9b1e4d6a2c58
+Revises: 5f3a9c2d7e41
+Create Date: 2026-10-19 13:40:27.904116
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b1e4d6a2c58"
+down_revision = "5f3a9c2d7e41"
+branch_labels = None
+depends_on = None
+
+CHALLENGE_SEARCH_COLUMNS = [
+    "challenge_acronym",
+    "challenge_name",
+    "challenge_keywords",
+    "challenge_abstract",
+    "challenge_author_names",
+    "challenge_application_scenarios",
+    "challenge_novelty",
+    "challenge_duration_explanation",
+    "challenge_publication_and_future",
+    "challenge_references",
+    "challenge_further_comments",
+    "challenge_space_and_hardware_requirements",
+    "challenge_workshop",
+    "challenge_lighthouse_what_is_different",
+    "challenge_lighthouse_closest_challenge",
+    "challenge_lighthouse_major_scientific_advances",
+]
+
+TASK_SEARCH_COLUMNS = [
+    "task_name",
+    "task_keywords",
+    "task_abstract",
+    "task_author_names",
+    "task_field_of_application",
+    "task_task_category",
+    "task_target_cohort",
+    "task_algorithm_target",
+    "task_imaging_modalities",
+    "task_data_origin",
+    "task_case_definition",
+    "task_evaluation_metrics",
+    "task_justification_of_metrics",
+    "task_rank_computation_method",
+    "task_statistical_analyses",
+    "task_further_analyses",
+    "task_organizing_team",
+    "task_platform",
+]
+
+
+def _create_search_index(name: str, source: str, columns: list) -> None:
+    column_list = ", ".join(columns)
+    new = ", ".join(f"new.{column}" for column in columns)
+    old = ", ".join(f"old.{column}" for column in columns)
+    insert = f"INSERT INTO {name}(rowid, {column_list}) VALUES (new.id, {new});"
+    delete = f"INSERT INTO {name}({name}, rowid, {column_list}) VALUES ('delete', old.id, {old});"
+
+    op.execute(
+        f"CREATE VIRTUAL TABLE {name} USING fts5({column_list}, content='{source}', content_rowid='id', "
+        "tokenize='porter unicode61 remove_diacritics 2')"
+    )
+    op.execute(f"CREATE TRIGGER {name}_ai AFTER INSERT ON {source} BEGIN {insert} END")
+    op.execute(f"CREATE TRIGGER {name}_ad AFTER DELETE ON {source} BEGIN {delete} END")
+    op.execute(f"CREATE TRIGGER {name}_au AFTER UPDATE OF {column_list} ON {source} BEGIN {delete} {insert} END")
+    # Index the existing rows
+    op.execute(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+
+
+def _drop_search_index(name: str) -> None:
+    for suffix in ("ai", "ad", "au"):
+        op.execute(f"DROP TRIGGER IF EXISTS {name}_{suffix}")
+    op.execute(f"DROP TABLE IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    # FTS5 is SQLite only, other backends have no search index
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _create_search_index("challenge_search", "challenges", CHALLENGE_SEARCH_COLUMNS)
+    _create_search_index("task_search", "tasks", TASK_SEARCH_COLUMNS)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    _drop_search_index("task_search")
+    _drop_search_index("challenge_search")
@@ -0,0 +1,192 @@
+# backend/BMC_API/src/infrastructure/persistence/query_log.py
+import re
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Literal, Optional
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from BMC_API.src.core.logging.logging import current_trace_ids
+from BMC_API.src.core.metrics import request_query_stats
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Shape of a statement: literals and expanded IN parameter lists are replaced by placeholders,
+    so executions with different values are grouped together.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PARAMETER_LIST.sub("?, ...", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryLog:
+    """
+    Ring buffer of the most recent statements of one worker, with the query plan of statements
+    that took longer than the slow threshold.
+    """
+
+    def __init__(self, size: int, slow_threshold_ms: float):
+        self.slow_threshold_ms = slow_threshold_ms
+        self._entries: deque = deque(maxlen=size)
+        self._plans: Dict[str, List[str]] = {}
+        self.recorded = 0
+
+    def is_slow(self, duration_ms: float) -> bool:
+        return duration_ms >= self.slow_threshold_ms
+
+    def has_plan(self, shape: str) -> bool:
+        return shape in self._plans
+
+    def record(self, shape: str, duration_ms: float, rows: Optional[int], plan: Optional[List[str]] = None) -> None:
+        """
+        Record one execution, correlated with the OpenTelemetry span it ran in.
+
+        :param shape: normalized statement, see `normalize_sql`.
+        :param duration_ms: execution time.
+        :param rows: affected rows, None if the driver does not report them.
+        :param plan: query plan, only stored for the first slow execution of a shape.
+        """
+        trace_id, span_id = current_trace_ids()
+        self._entries.append(
+            {
+                "shape": shape,
+                "duration_ms": duration_ms,
+                "rows": rows,
+                "slow": self.is_slow(duration_ms),
+                "trace_id": trace_id,
+                "span_id": span_id,
+                "timestamp": datetime.now(timezone.utc),
+            }
+        )
+        self.recorded += 1
+        if plan is not None:
+            self._plans[shape] = plan
+            if len(self._plans) > self._entries.maxlen:
+                # Drop plans of shapes that left the buffer
+                shapes = {entry["shape"] for entry in self._entries}
+                self._plans = {key: value for key, value in self._plans.items() if key in shapes}
+
+    def top(self, limit: int = 10, order_by: Literal["max", "total", "avg"] = "max") -> List[Dict[str, Any]]:
+        """
+        Statistics per statement shape over the buffered executions, slowest first.
+
+        :param limit: number of shapes.
+        :param order_by: "max", "total" or "avg" duration.
+        :return: list of shape statistics.
+        """
+        groups: Dict[str, List[dict]] = {}
+        for entry in list(self._entries):
+            groups.setdefault(entry["shape"], []).append(entry)
+
+        report = []
+        for shape, entries in groups.items():
+            durations = [entry["duration_ms"] for entry in entries]
+            slowest = max(entries, key=lambda entry: entry["duration_ms"])
+            rows = [entry["rows"] for entry in entries if entry["rows"] is not None]
+            report.append(
+                {
+                    "sql": shape,
+                    "count": len(entries),
+                    "slow_count": sum(entry["slow"] for entry in entries),
+                    "total_ms": round(sum(durations), 3),
+                    "avg_ms": round(sum(durations) / len(durations), 3),
+                    "max_ms": round(slowest["duration_ms"], 3),
+                    "avg_rows": round(sum(rows) / len(rows), 1) if rows else None,
+                    "last_seen": entries[-1]["timestamp"],
+                    "slowest_trace_id": slowest["trace_id"],
+                    "slowest_span_id": slowest["span_id"],
+                    "plan": self._plans.get(shape),
+                }
+            )
+        report.sort(key=lambda item: item[f"{order_by}_ms"], reverse=True)
+        return report[:limit]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._plans.clear()
+
+
+def _row_count(cursor) -> Optional[int]:
+    # DBAPI drivers report -1 for statements whose row count they do not know, e.g. SELECT on SQLite
+    rowcount = cursor.rowcount
+    return rowcount if rowcount is not None and rowcount >= 0 else None
+
+
+def _explain(connection, statement: str, parameters, executemany: bool) -> Optional[List[str]]:
+    if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+        return None
+    if executemany:
+        parameters = parameters[0] if parameters else None
+    prefix = "EXPLAIN QUERY PLAN " if connection.dialect.name == "sqlite" else "EXPLAIN "
+
+    # Runs on the raw DBAPI connection, so it is neither timed nor recorded itself
+    cursor = connection.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters or ())
+        rows = cursor.fetchall()
+    except Exception as error:
+        logger.debug(f"Could not explain slow query: {error}")
+        return None
+    finally:
+        cursor.close()
+    if connection.dialect.name == "sqlite":
+        return [row[-1] for row in rows]
+    return [" ".join(str(column) for column in row) for row in rows]
+
+
+def instrument_engine(engine: AsyncEngine, query_log: QueryLog) -> None:
+    """
+    Record duration, row count and shape of every statement executed by the engine into the query log.
+    The plan of a shape is captured the first time one of its executions is slow.
+
+    :param engine: async engine.
+    :param query_log: query log of the application.
+    """
+
+    # The start time is kept on the execution context, failed statements never reach after_cursor_execute
+    def before_cursor_execute(connection, cursor, statement, parameters, context, executemany) -> None:
+        context.query_start_time = time.perf_counter()
+
+    def after_cursor_execute(connection, cursor, statement, parameters, context, executemany) -> None:
+        duration_ms = (time.perf_counter() - context.query_start_time) * 1000
+        shape = normalize_sql(statement)
+        plan = None
+        if query_log.is_slow(duration_ms) and not query_log.has_plan(shape):
+            plan = _explain(connection, statement, parameters, executemany)
+            logger.warning(f"Slow query ({duration_ms:.1f} ms): {shape}")
+        query_log.record(shape, duration_ms, _row_count(cursor), plan)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+
+def instrument_request_query_stats(engine: AsyncEngine) -> None:
+    """
+    Count the statements of the engine and their execution time into the `QueryStats` of the current request,
+    see `MetricsMiddleware`.
+
+    :param engine: async engine.
+    """
+
+    def before_cursor_execute(connection, cursor, statement, parameters, context, executemany) -> None:
+        context.request_query_start_time = time.perf_counter()
+
+    def after_cursor_execute(connection, cursor, statement, parameters, context, executemany) -> None:
+        query_stats = request_query_stats.get()
+        if query_stats is not None:
+            query_stats.count += 1
+            query_stats.duration += time.perf_counter() - context.request_query_start_time
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
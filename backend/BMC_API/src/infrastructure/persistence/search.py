@@ -0,0 +1,224 @@
+# backend/BMC_API/src/infrastructure/persistence/search.py
+import html
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import DDL, event, literal_column, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from BMC_API.src.core.exceptions import SearchUnavailableException
+from BMC_API.src.domain.entities.challenge_model import ChallengeModel
+from BMC_API.src.domain.entities.task_model import TaskModel
+
+# Operators of "field__operator" search filters that query a search index
+FULL_TEXT_OPERATORS = ("match", "search")
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+SNIPPET_TOKENS = 16
+# Control characters mark the matched terms in snippets, they are replaced by tags once the text is escaped
+_MATCH_START, _MATCH_END = "\x02", "\x03"
+
+
+def to_fts_query(terms: str) -> str:
+    """
+    FTS5 query of plain search terms: every word has to appear, as a prefix, in any indexed column.
+    FTS5 operators and quotes in the input are taken literally.
+    """
+    return " ".join(f'"{token}"*' for token in _TOKEN.findall(terms or ""))
+
+
+class SearchIndex:
+    """
+    SQLite FTS5 index over text columns of a model. It is an external content table, so the text is not
+    duplicated, and triggers on the model table keep it in sync with every write.
+    Batch migrations that recreate the model table drop the triggers, run `create_statements` afterwards.
+    """
+
+    def __init__(self, model: type, name: str, columns: Dict[str, float]):
+        """
+        :param model: indexed model, with an integer "id" primary key.
+        :param name: name of the FTS5 table.
+        :param columns: indexed columns and their bm25 weight.
+        """
+        self.model = model
+        self.name = name
+        self.columns = columns
+        self.source = model.__tablename__
+
+    def create_statements(self) -> List[str]:
+        columns = ", ".join(self.columns)
+        new = ", ".join(f"new.{column}" for column in self.columns)
+        old = ", ".join(f"old.{column}" for column in self.columns)
+        insert = f"INSERT INTO {self.name}(rowid, {columns}) VALUES (new.id, {new});"
+        delete = f"INSERT INTO {self.name}({self.name}, rowid, {columns}) VALUES ('delete', old.id, {old});"
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.name} USING fts5({columns}, content='{self.source}', "
+            f"content_rowid='id', tokenize='porter unicode61 remove_diacritics 2')",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ai AFTER INSERT ON {self.source} BEGIN {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_ad AFTER DELETE ON {self.source} BEGIN {delete} END",
+            # Only changes of indexed columns re-index, e.g. status updates do not
+            f"CREATE TRIGGER IF NOT EXISTS {self.name}_au AFTER UPDATE OF {columns} ON {self.source} "
+            f"BEGIN {delete} {insert} END",
+        ]
+
+    def drop_statements(self) -> List[str]:
+        return [f"DROP TRIGGER IF EXISTS {self.name}_{suffix}" for suffix in ("ai", "ad", "au")] + [
+            f"DROP TABLE IF EXISTS {self.name}"
+        ]
+
+    def rebuild_statement(self) -> str:
+        """Re-index all rows of the model table."""
+        return f"INSERT INTO {self.name}({self.name}) VALUES ('rebuild')"
+
+    def column_query(self, field: str, query: str) -> str:
+        """Restrict an FTS5 query to one column, `field` is either an indexed column or the index itself."""
+        return query if field == self.name else f"{{{field}}} : ({query})"
+
+    def match_condition(self, id_column, query):
+        """Condition on `id_column` of rows whose text matches the FTS5 query."""
+        matches = select(literal_column("rowid")).select_from(table(self.name))
+        return id_column.in_(matches.where(literal_column(self.name).op("MATCH")(query)))
+
+    def rank_expression(self) -> str:
+        """Relevance of a match, higher is better."""
+        return f"-bm25({self.name}, {', '.join(str(weight) for weight in self.columns.values())})"
+
+    def snippet_expression(self) -> str:
+        """Text around the matched terms, which are marked for `highlight_snippet`."""
+        return f"snippet({self.name}, -1, char(2), char(3), '…', {SNIPPET_TOKENS})"
+
+
+def highlight_snippet(snippet: str) -> str:
+    """HTML of a snippet: the indexed text is escaped and the matched terms are wrapped in <b></b>."""
+    return html.escape(snippet).replace(_MATCH_START, "<b>").replace(_MATCH_END, "</b>")
+
+
+CHALLENGE_SEARCH_INDEX = SearchIndex(
+    ChallengeModel,
+    "challenge_search",
+    {
+        "challenge_acronym": 10.0,
+        "challenge_name": 10.0,
+        "challenge_keywords": 5.0,
+        "challenge_abstract": 2.0,
+        "challenge_author_names": 2.0,
+        "challenge_application_scenarios": 1.0,
+        "challenge_novelty": 1.0,
+        "challenge_duration_explanation": 1.0,
+        "challenge_publication_and_future": 1.0,
+        "challenge_references": 1.0,
+        "challenge_further_comments": 1.0,
+        "challenge_space_and_hardware_requirements": 1.0,
+        "challenge_workshop": 1.0,
+        "challenge_lighthouse_what_is_different": 1.0,
+        "challenge_lighthouse_closest_challenge": 1.0,
+        "challenge_lighthouse_major_scientific_advances": 1.0,
+    },
+)
+
+TASK_SEARCH_INDEX = SearchIndex(
+    TaskModel,
+    "task_search",
+    {
+        "task_name": 10.0,
+        "task_keywords": 5.0,
+        "task_abstract": 2.0,
+        "task_author_names": 2.0,
+        "task_field_of_application": 1.0,
+        "task_task_category": 1.0,
+        "task_target_cohort": 1.0,
+        "task_algorithm_target": 1.0,
+        "task_imaging_modalities": 1.0,
+        "task_data_origin": 1.0,
+        "task_case_definition": 1.0,
+        "task_evaluation_metrics": 1.0,
+        "task_justification_of_metrics": 1.0,
+        "task_rank_computation_method": 1.0,
+        "task_statistical_analyses": 1.0,
+        "task_further_analyses": 1.0,
+        "task_organizing_team": 1.0,
+        "task_platform": 1.0,
+    },
+)
+
+SEARCH_INDEXES: Dict[type, SearchIndex] = {index.model: index for index in (CHALLENGE_SEARCH_INDEX, TASK_SEARCH_INDEX)}
+
+# FTS5 creates shadow tables next to the index
+_SHADOW_TABLE_SUFFIXES = ("", "_data", "_idx", "_docsize", "_config", "_content")
+
+
+def ensure_full_text_search(session: AsyncSession) -> None:
+    """
+    :param session: database session.
+    :raises SearchUnavailableException: if the database of the session has no search indexes, only SQLite has.
+    """
+    if session.bind.dialect.name != "sqlite":
+        raise SearchUnavailableException()
+
+
+def search_index_for(model: type) -> Optional[SearchIndex]:
+    return SEARCH_INDEXES.get(model)
+
+
+def is_search_table(name: str) -> bool:
+    """Whether a table belongs to a search index, e.g. to exclude it from migration autogenerate."""
+    return any(name == index.name + suffix for index in SEARCH_INDEXES.values() for suffix in _SHADOW_TABLE_SUFFIXES)
+
+
+# Tables created from the metadata, e.g. in tests, get their index as well
+for _index in SEARCH_INDEXES.values():
+    for _statement in _index.create_statements():
+        event.listen(_index.model.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+    for _statement in _index.drop_statements():
+        event.listen(_index.model.__table__, "before_drop", DDL(_statement).execute_if(dialect="sqlite"))
+
+
+async def search_challenges(session: AsyncSession, terms: str, limit: int) -> List[dict]:
+    """
+    Rank challenges by the text of the challenge and of its tasks. The score of a challenge is its best match,
+    snippets of all matches are returned.
+
+    :param session: database session.
+    :param terms: plain search terms, see `to_fts_query`.
+    :param limit: maximum number of challenges.
+    :raises SearchUnavailableException: if the database is not SQLite.
+    :return: list of dictionaries with challenge_id, score and snippets, best first.
+    """
+    ensure_full_text_search(session)
+    query = to_fts_query(terms)
+    if not query:
+        return []
+
+    challenge_index, task_index = CHALLENGE_SEARCH_INDEX, TASK_SEARCH_INDEX
+    challenge_matches = await session.execute(
+        text(
+            f"SELECT rowid, {challenge_index.rank_expression()} AS score, {challenge_index.snippet_expression()} "
+            f"FROM {challenge_index.name} WHERE {challenge_index.name} MATCH :query ORDER BY score DESC LIMIT :limit"
+        ),
+        {"query": query, "limit": limit},
+    )
+    task_matches = await session.execute(
+        text(
+            f"SELECT tasks.task_challenge_id, tasks.id, tasks.task_name, {task_index.rank_expression()} AS score, "
+            f"{task_index.snippet_expression()} FROM {task_index.name} "
+            f"JOIN tasks ON tasks.id = {task_index.name}.rowid "
+            f"WHERE {task_index.name} MATCH :query AND tasks.task_challenge_id IS NOT NULL "
+            f"ORDER BY score DESC LIMIT :limit"
+        ),
+        {"query": query, "limit": limit},
+    )
+
+    results: Dict[int, dict] = {}
+    for challenge_id, score, snippet in challenge_matches.all():
+        result = results.setdefault(challenge_id, {"challenge_id": challenge_id, "score": score, "snippets": []})
+        result["snippets"].append(
+            {"source": "challenge", "task_id": None, "task_name": None, "text": highlight_snippet(snippet)}
+        )
+    for challenge_id, task_id, task_name, score, snippet in task_matches.all():
+        result = results.setdefault(challenge_id, {"challenge_id": challenge_id, "score": score, "snippets": []})
+        result["score"] = max(result["score"], score)
+        result["snippets"].append(
+            {"source": "task", "task_id": task_id, "task_name": task_name, "text": highlight_snippet(snippet)}
+        )
+
+    return sorted(results.values(), key=lambda result: result["score"], reverse=True)[:limit]
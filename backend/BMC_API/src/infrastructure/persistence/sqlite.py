@@ -0,0 +1,85 @@
+# backend/BMC_API/src/infrastructure/persistence/sqlite.py
+from typing import Any, Dict
+
+from loguru import logger
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from BMC_API.src.core.config.settings import settings
+
+# PRAGMA read back values of the named modes
+_SYNCHRONOUS_MODES = {"OFF": 0, "NORMAL": 1, "FULL": 2, "EXTRA": 3}
+_TEMP_STORE_MODES = {"DEFAULT": 0, "FILE": 1, "MEMORY": 2}
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """
+    Connection profile from the settings, as PRAGMA name and value pairs in the order they are applied.
+    journal_mode comes first, since WAL changes how the other settings behave.
+    """
+    return {
+        "journal_mode": settings.db_sqlite_journal_mode,
+        "synchronous": settings.db_sqlite_synchronous,
+        "busy_timeout": settings.db_sqlite_busy_timeout_in_ms,
+        "cache_size": settings.db_sqlite_cache_size,
+        "mmap_size": settings.db_sqlite_mmap_size,
+        "temp_store": settings.db_sqlite_temp_store,
+        "foreign_keys": "ON" if settings.db_sqlite_foreign_keys else "OFF",
+    }
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def configure_sqlite_engine(engine: AsyncEngine) -> None:
+    """
+    Apply the SQLite connection profile on every new connection of the engine.
+    Other dialects are left untouched.
+
+    :param engine: async engine.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+
+def _expected_pragma_value(name: str, value: Any) -> Any:
+    if name == "journal_mode":
+        return str(value).lower()
+    if name == "synchronous":
+        return _SYNCHRONOUS_MODES[value]
+    if name == "temp_store":
+        return _TEMP_STORE_MODES[value]
+    if name == "foreign_keys":
+        return 1 if value == "ON" else 0
+    return value
+
+
+async def verify_sqlite_pragmas(engine: AsyncEngine) -> Dict[str, Any]:
+    """
+    Read the connection profile back from a pooled connection and log settings SQLite did not accept,
+    e.g. WAL on an in-memory database or mmap_size above the compile-time limit.
+
+    :param engine: async engine.
+    :return: effective PRAGMA values.
+    """
+    if engine.dialect.name != "sqlite":
+        return {}
+
+    effective = {}
+    async with engine.connect() as connection:
+        for name, value in sqlite_pragmas().items():
+            actual = (await connection.execute(text(f"PRAGMA {name}"))).scalar()
+            effective[name] = actual
+            expected = _expected_pragma_value(name, value)
+            if (actual.lower() if isinstance(actual, str) else actual) != expected:
+                logger.warning(f"SQLite PRAGMA {name} is {actual}, configured {value}")
+
+    logger.info(f"SQLite connection profile: {effective}")
+    return effective
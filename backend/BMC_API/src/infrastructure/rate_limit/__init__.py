@@ -0,0 +1 @@
+"""Rate limit backends"""
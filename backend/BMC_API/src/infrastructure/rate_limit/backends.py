@@ -0,0 +1,103 @@
+# backend/BMC_API/src/infrastructure/rate_limit/backends.py
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+from loguru import logger
+
+from BMC_API.src.core.rate_limit import RateLimit, RateLimitResult, take_tokens
+from BMC_API.src.domain.interfaces.rate_limit_backend import RateLimitBackend
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+# Token bucket of `take_tokens`, refilled by the clock of the redis server so all workers agree on the time.
+# KEYS[1]: bucket, ARGV: amount, refill rate in tokens per second, cost.
+# Buckets expire once they would be full again, the tokens are returned as a string to keep the fraction.
+TOKEN_BUCKET_SCRIPT = """
+local amount = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or amount
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(amount, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "updated", tostring(now))
+redis.call("PEXPIRE", KEYS[1], math.ceil((amount - tokens) / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Process-local token buckets. Every worker enforces the limit on its own,
+    so the effective limit is multiplied by the number of workers.
+
+    The least recently used buckets are dropped once `max_entries` is reached.
+    """
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        self._buckets: OrderedDict[str, Tuple[float, float]] = OrderedDict()
+        self.max_entries = max_entries
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def acquire(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitResult:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (limit.amount, now))
+        allowed, tokens = take_tokens(tokens, now - updated, limit, cost)
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_entries:
+            self._buckets.popitem(last=False)
+        return RateLimitResult(allowed, limit, tokens, cost)
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Token buckets shared by all workers, updated atomically by a Lua script on the shared redis client.
+
+    When redis fails or does not answer within `timeout` seconds, the limits are enforced by the
+    `fallback` backend of the worker, and redis is not tried again for `retry_after` seconds,
+    so an outage does not delay every request by the connection timeout.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        fallback: RateLimitBackend,
+        prefix: str = "ratelimit:",
+        timeout: float = 0.1,
+        retry_after: float = 5.0,
+    ) -> None:
+        self.script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        self.fallback = fallback
+        self.prefix = prefix
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.fallback_count = 0
+        self._unavailable_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._unavailable_until
+
+    async def acquire(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitResult:
+        if self.available:
+            try:
+                async with asyncio.timeout(self.timeout):
+                    allowed, tokens = await self.script(keys=[self.prefix + key], args=[limit.amount, limit.rate, cost])
+                return RateLimitResult(bool(allowed), limit, float(tokens), cost)
+            except (RedisError, TimeoutError, OSError) as error:
+                self._unavailable_until = time.monotonic() + self.retry_after
+                logger.warning(f"Redis is unavailable for rate limits, using the in-memory limiter: {error!r}")
+        self.fallback_count += 1
+        return await self.fallback.acquire(key, limit, cost)
@@ -10,6 +10,7 @@ from httpx import AsyncClient
 from BMC_API.src.application.dependencies import get_challenge_service_admin
 from BMC_API.src.application.use_cases.challenge_use_cases import ChallengeService
 from BMC_API.src.application.use_cases.conference_use_cases import ConferenceService
+from BMC_API.src.core.exceptions import SearchUnavailableException
 from BMC_API.src.domain.entities.challenge_model import ChallengeModel
 from BMC_API.src.domain.entities.task_model import TaskModel
 
@@ -212,6 +213,91 @@ class TestAdminChallengeRoutes:
             }
         ]
 
+    async def test_admin_can_get_challenges_with_task_output_filters(
+        self, client: AsyncClient, fastapi_app: FastAPI, admin_token, dbsession
+    ):
+        challenge = ChallengeModel(
+            challenge_name="Challenge with sparse tasks",
+            challenge_acronym="CWST",
+            challenge_created_time=datetime.now(),
+        )
+        dbsession.add(challenge)
+        await dbsession.flush()
+        dbsession.add_all(
+            TaskModel(
+                task_name=f"Task {i}",
+                task_abstract="Long abstract of the task",
+                task_created_time=datetime.now(),
+                task_challenge_id=challenge.id,
+            )
+            for i in range(2)
+        )
+        await dbsession.commit()
+
+        get_url = fastapi_app.url_path_for("list_challenges_route_admin")
+        response = await client.post(
+            get_url,
+            json={"output_filters": ["id", "challenge_acronym"], "output_filters_task": ["task_name"]},
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["content"] == [
+            {
+                "id": challenge.id,
+                "challenge_acronym": "CWST",
+                "challenge_tasks": [{"task_name": "Task 0"}, {"task_name": "Task 1"}],
+            }
+        ]
+
+    async def test_admin_can_search_challenges(self, client: AsyncClient, fastapi_app: FastAPI, admin_token, dbsession):
+        challenge = ChallengeModel(
+            challenge_name="Abdominal organ challenge",
+            challenge_acronym="AOC",
+            challenge_status="Accept",
+            challenge_created_time=datetime.now(),
+        )
+        other_challenge = ChallengeModel(
+            challenge_name="Retina challenge",
+            challenge_abstract="Vessel segmentation in fundus images",
+            challenge_created_time=datetime.now(),
+        )
+        dbsession.add_all([challenge, other_challenge])
+        await dbsession.flush()
+        dbsession.add(
+            TaskModel(
+                task_name="Liver tumour segmentation",
+                task_created_time=datetime.now(),
+                task_challenge_id=challenge.id,
+            )
+        )
+        await dbsession.commit()
+
+        search_url = fastapi_app.url_path_for("search_challenges_route_admin")
+        response = await client.get(
+            search_url, params={"q": "tumour segment"}, headers={"Authorization": f"Bearer {admin_token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        (result,) = response.json()
+        assert (result["id"], result["challenge_acronym"], result["challenge_status"]) == (
+            challenge.id,
+            "AOC",
+            "Accept",
+        )
+        assert result["snippets"][0]["source"] == "task"
+        assert "<b>tumour</b>" in result["snippets"][0]["text"]
+
+    async def test_admin_search_requires_sqlite(self, client: AsyncClient, fastapi_app: FastAPI, admin_token):
+        search_url = fastapi_app.url_path_for("search_challenges_route_admin")
+        with patch.object(ChallengeService, "search", new=AsyncMock(side_effect=SearchUnavailableException())):
+            response = await client.get(
+                search_url, params={"q": "tumour"}, headers={"Authorization": f"Bearer {admin_token}"}
+            )
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.json()["detail"] == "Full-text search is only available for SQLite databases."
+
     async def test_admin_can_update_other_users_challenge(
         self,
         client: AsyncClient,
@@ -1,6 +1,8 @@
 # backend/BMC_API/tests/test_admin_route.py
 
 import json
+import os
+import sqlite3
 
 import pytest
 from fastapi import HTTPException, status
@@ -12,6 +14,10 @@ from starlette.status import (
 )
 
 from BMC_API.src.api.routes.admin import admin_database
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.infrastructure.cache.backends import InMemoryCacheBackend
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
+from BMC_API.src.infrastructure.persistence.query_log import QueryLog
 
 
 @pytest.mark.anyio
@@ -63,6 +69,20 @@ async def test_database_backup_and_download_custom_name_with_ext(tmp_path, monke
     assert response.filename == "custom.sqlite3"
 
 
+@pytest.mark.anyio
+async def test_database_backup_and_download_keeps_compression_extension(tmp_path, monkeypatch):
+    backup_file = tmp_path / "dump.sqlite3.gz"
+    backup_file.write_text("dummy")
+
+    async def stub_backup_database(file_name):
+        return str(backup_file)
+
+    monkeypatch.setattr(admin_database, "backup_database", stub_backup_database)
+
+    response = await admin_database.database_backup_and_download("custom.sqlite3")
+    assert response.filename == "custom.sqlite3.gz"
+
+
 @pytest.mark.anyio
 async def test_database_backup_and_download_runtime_error(monkeypatch):
     async def stub_backup_database(file_name):
@@ -192,3 +212,80 @@ async def test_delete_backups_endpoint_via_client(monkeypatch, client, fastapi_a
         "message": "All database backups except the latest one successfully deleted.",
         "deleted_files": ["old1", "old2"],
     }
+
+
+@pytest.mark.anyio
+async def test_repository_cache_stats_disabled():
+    response = await admin_database.repository_cache_stats(cache=None)
+    assert response.enabled is False
+
+
+@pytest.mark.anyio
+async def test_repository_cache_stats():
+    cache = TaggedCache(InMemoryCacheBackend(max_entries=10))
+    await cache.get("missing")
+
+    response = await admin_database.repository_cache_stats(cache=cache)
+    assert response.enabled is True
+    assert response.backend == "InMemoryCacheBackend"
+    assert (response.hits, response.misses, response.evictions) == (0, 1, 0)
+
+
+@pytest.mark.anyio
+async def test_list_and_download_database_snapshots(tmp_path, monkeypatch):
+    db_file = tmp_path / "database.sqlite3"
+    connection = sqlite3.connect(db_file)
+    connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    connection.commit()
+    connection.close()
+    monkeypatch.setattr(settings, "db_file", str(db_file))
+    monkeypatch.setattr(settings, "backup_folder", str(tmp_path / "backups"))
+
+    created = await admin_database.create_database_snapshot()
+    snapshots = await admin_database.list_database_snapshots()
+    assert [snapshot.id for snapshot in snapshots] == [created.id]
+
+    response = await admin_database.restore_and_download_database_snapshot(created.id)
+    assert isinstance(response, FileResponse)
+    assert response.filename == f"{created.id}.sqlite3"
+    assert os.path.getsize(response.path) == created.size
+
+    with pytest.raises(HTTPException) as exc_info:
+        await admin_database.restore_and_download_database_snapshot("missing")
+    assert exc_info.value.status_code == HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_database_snapshot_requires_sqlite(monkeypatch):
+    monkeypatch.setattr(settings, "db_backend", "postgresql")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await admin_database.create_database_snapshot()
+    assert exc_info.value.status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.anyio
+async def test_slow_queries_report_disabled():
+    response = await admin_database.slow_queries_report(query_log=None)
+    assert response.enabled is False
+    assert response.queries == []
+
+
+@pytest.mark.anyio
+async def test_slow_queries_report():
+    query_log = QueryLog(size=10, slow_threshold_ms=50)
+    query_log.record("SELECT ?", 10.0, 1)
+    query_log.record("SELECT ?", 12.0, None)
+    query_log.record("SELECT * FROM tasks", 80.0, 5, plan=["SCAN tasks"])
+    query_log.record("SELECT * FROM tasks", 20.0, 5)
+
+    response = await admin_database.slow_queries_report(query_log=query_log, limit=10, order_by="max")
+    assert response.enabled is True
+    assert response.recorded == 4
+    assert [query.sql for query in response.queries] == ["SELECT * FROM tasks", "SELECT ?"]
+    assert response.queries[1].avg_rows == 1  # Executions without a row count are left out
+    assert response.queries[0].slow_count == 1
+    assert response.queries[0].plan == ["SCAN tasks"]
+
+    response = await admin_database.slow_queries_report(query_log=query_log, limit=1, order_by="avg")
+    assert len(response.queries) == 1
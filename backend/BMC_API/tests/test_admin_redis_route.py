@@ -1,5 +1,7 @@
 # backend/BMC_API/tests/test_redis_route.py
 
+import json
+
 import pytest
 from fastapi import HTTPException, status
 
@@ -9,41 +11,21 @@ import BMC_API.src.api.routes.admin.admin_redis as admin_redis_module
 @pytest.mark.anyio
 async def test_redis_health_success(monkeypatch):
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def ping(self):
             return True
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
-    result = await admin_redis_module.redis_health(redis_pool=None)
+    result = await admin_redis_module.redis_health(redis=DummyRedis())
     assert result == {"message": "Redis server works"}
 
 
 @pytest.mark.anyio
 async def test_redis_health_failure(monkeypatch):
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def ping(self):
             raise Exception("down")
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
     with pytest.raises(HTTPException) as exc_info:
-        await admin_redis_module.redis_health(redis_pool=None)
+        await admin_redis_module.redis_health(redis=DummyRedis())
     assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
 
 
@@ -53,21 +35,11 @@ async def test_get_redis_value_success(monkeypatch):
     value = "bar"
 
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def get(self, k):
             assert k == key
             return value
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
-    dto = await admin_redis_module.get_redis_value(key=key, redis_pool=None)
+    dto = await admin_redis_module.get_redis_value(key=key, redis=DummyRedis())
     assert dto.key == key
     assert dto.value == value
 
@@ -75,21 +47,11 @@ async def test_get_redis_value_success(monkeypatch):
 @pytest.mark.anyio
 async def test_get_redis_value_not_found(monkeypatch):
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def get(self, k):
             return None
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
     with pytest.raises(HTTPException) as exc_info:
-        await admin_redis_module.get_redis_value(key="foo", redis_pool=None)
+        await admin_redis_module.get_redis_value(key="foo", redis=DummyRedis())
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
     assert "Key not found" in exc_info.value.detail
 
@@ -97,21 +59,11 @@ async def test_get_redis_value_not_found(monkeypatch):
 @pytest.mark.anyio
 async def test_get_redis_value_service_unavailable(monkeypatch):
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def get(self, k):
             raise Exception("lost connection")
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
     with pytest.raises(HTTPException) as exc_info:
-        await admin_redis_module.get_redis_value(key="foo", redis_pool=None)
+        await admin_redis_module.get_redis_value(key="foo", redis=DummyRedis())
     assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
 
 
@@ -121,48 +73,90 @@ async def test_get_all_redis_values_success(monkeypatch):
     values = [b"1", None]
 
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
+        async def scan(self, cursor, match, count):
+            assert match == "*"
+            return 0, keys
+
+        async def mget(self, ks):
+            assert ks == keys
+            return values
+
+        async def dbsize(self):
+            return 2
 
-        async def __aenter__(self):
-            return self
+    result = await admin_redis_module.get_all_redis_values(redis=DummyRedis())
+    assert result.complete is True
+    assert result.next_cursor == 0
+    assert result.total_keys == 2
+    assert result.content[0].key == "a" and result.content[0].value == "1"
+    assert result.content[1].key == "b" and result.content[1].value is None
 
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
 
-        async def keys(self, pattern):
-            assert pattern == "*"
-            return keys
+@pytest.mark.anyio
+async def test_get_all_redis_values_follows_cursor_until_page_is_filled(monkeypatch):
+    pages = {0: (7, []), 7: (9, [b"a"]), 9: (12, [b"b"])}
+    calls = []
+
+    class DummyRedis:
+        async def scan(self, cursor, match, count):
+            calls.append((cursor, match, count))
+            return pages[cursor]
 
         async def mget(self, ks):
-            assert ks == keys
-            return values
+            return [b"v" for _ in ks]
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
-    result = await admin_redis_module.get_all_redis_values(redis_pool=None)
-    assert isinstance(result, list)
-    assert result[0].key == "a" and result[0].value == "1"
-    assert result[1].key == "b" and result[1].value is None
+        async def dbsize(self):
+            return 10
+
+    result = await admin_redis_module.get_all_redis_values(redis=DummyRedis(), match="user:*", count=2, cursor=0)
+    assert calls == [(0, "user:*", 2), (7, "user:*", 2), (9, "user:*", 2)]
+    assert [item.key for item in result.content] == ["a", "b"]
+    assert result.cursor == 0
+    assert result.next_cursor == 12
+    assert result.complete is False
 
 
 @pytest.mark.anyio
-async def test_get_all_redis_values_not_found(monkeypatch):
+async def test_get_all_redis_values_bounds_scan_calls(monkeypatch):
+    calls = []
+
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
+        async def scan(self, cursor, match, count):
+            calls.append(cursor)
+            return cursor + 1, []  # No key matches the pattern in this part of the keyspace
+
+        async def dbsize(self):
+            return 100_000
+
+    result = await admin_redis_module.get_all_redis_values(redis=DummyRedis(), match="rare:*", cursor=3)
+    assert len(calls) == admin_redis_module.MAX_SCAN_ROUND_TRIPS
+    assert result.content == []
+    assert result.next_cursor == 3 + admin_redis_module.MAX_SCAN_ROUND_TRIPS
+    assert result.complete is False
 
-        async def __aenter__(self):
-            return self
 
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
+@pytest.mark.anyio
+async def test_get_all_redis_values_empty_continuation_page(monkeypatch):
+    class DummyRedis:
+        async def scan(self, cursor, match, count):
+            return 0, []
+
+        async def dbsize(self):
+            return 0
 
-        async def keys(self, pattern):
-            return []
+    result = await admin_redis_module.get_all_redis_values(redis=DummyRedis(), cursor=5)
+    assert result.content == []
+    assert result.complete is True
+
+
+@pytest.mark.anyio
+async def test_get_all_redis_values_not_found(monkeypatch):
+    class DummyRedis:
+        async def scan(self, cursor, match, count):
+            return 0, []
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
     with pytest.raises(HTTPException) as exc_info:
-        await admin_redis_module.get_all_redis_values(redis_pool=None)
+        await admin_redis_module.get_all_redis_values(redis=DummyRedis())
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
 
@@ -174,20 +168,10 @@ async def test_set_redis_value_success(monkeypatch):
     calls = []
 
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def set(self, name, value):
             calls.append((name, value))
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
-    result = await admin_redis_module.set_redis_value(redis_value=dto, redis_pool=None)
+    result = await admin_redis_module.set_redis_value(redis_value=dto, redis=DummyRedis())
     assert calls == [("x", "y")]
     assert result == {"message": "key-value pair successfully stored in Redis database."}
 
@@ -197,7 +181,7 @@ async def test_set_redis_value_no_value():
     from BMC_API.src.api.schemas.redis_schema import RedisValueDTO
 
     dto = RedisValueDTO(key="x", value=None)
-    result = await admin_redis_module.set_redis_value(redis_value=dto, redis_pool=None)
+    result = await admin_redis_module.set_redis_value(redis_value=dto, redis=None)
     assert result is None
 
 
@@ -207,23 +191,13 @@ async def test_delete_redis_key_success(monkeypatch):
     calls = []
 
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def get(self, k):
             return b"v"
 
         async def delete(self, k):
             calls.append(k)
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
-    result = await admin_redis_module.delete_redis_key(key=key, redis_pool=None)
+    result = await admin_redis_module.delete_redis_key(key=key, redis=DummyRedis())
     assert calls == [key]
     assert result == {"message": "key-value pair successfully deleted from Redis database."}
 
@@ -231,45 +205,25 @@ async def test_delete_redis_key_success(monkeypatch):
 @pytest.mark.anyio
 async def test_delete_redis_key_not_found(monkeypatch):
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def get(self, k):
             return None
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
     with pytest.raises(HTTPException) as exc_info:
-        await admin_redis_module.delete_redis_key(key="k", redis_pool=None)
+        await admin_redis_module.delete_redis_key(key="k", redis=DummyRedis())
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.anyio
 async def test_delete_redis_key_delete_error(monkeypatch):
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def get(self, k):
             return b"v"
 
         async def delete(self, k):
             raise Exception("fail")
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
     with pytest.raises(HTTPException) as exc_info:
-        await admin_redis_module.delete_redis_key(key="k", redis_pool=None)
+        await admin_redis_module.delete_redis_key(key="k", redis=DummyRedis())
     assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
 
 
@@ -278,66 +232,44 @@ async def test_delete_all_redis_keys_success(monkeypatch):
     calls = []
 
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
+        async def scan_iter(self, match, count):
+            for key in [b"a", b"b", b"c"]:
+                yield key
 
-        async def __aenter__(self):
-            return self
+        async def unlink(self, *keys):
+            calls.append(keys)
+            return len(keys)
 
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
-        async def keys(self, pattern):
-            return [b"a", b"b"]
-
-        async def delete(self, *keys):
-            calls.extend(keys)
-
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
-    result = await admin_redis_module.delete_all_redis_keys(current_active_user=None, redis_pool=None)
-    assert calls == [b"a", b"b"]
-    assert result == {"message": "All key-value pairs successfully deleted from Redis database."}
+    result = await admin_redis_module.delete_all_redis_keys(current_active_user=None, redis=DummyRedis(), chunk_size=2)
+    assert calls == [(b"a", b"b"), (b"c",)]
+    assert result == {
+        "message": "All key-value pairs successfully deleted from Redis database.",
+        "scanned": 3,
+        "deleted": 3,
+    }
 
 
 @pytest.mark.anyio
 async def test_delete_all_redis_keys_not_found(monkeypatch):
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
-        async def keys(self, pattern):
+        async def scan_iter(self, match, count):
             raise Exception("No active exception to reraise")
+            yield
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
     with pytest.raises(HTTPException) as exc_info:
-        await admin_redis_module.delete_all_redis_keys(current_active_user=None, redis_pool=None)
+        await admin_redis_module.delete_all_redis_keys(current_active_user=None, redis=DummyRedis())
     assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.anyio
 async def test_delete_all_redis_keys_service_unavailable(monkeypatch):
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
-        async def keys(self, pattern):
+        async def scan_iter(self, match, count):
             raise Exception("redis down")
+            yield
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
     with pytest.raises(HTTPException) as exc_info:
-        await admin_redis_module.delete_all_redis_keys(current_active_user=None, redis_pool=None)
+        await admin_redis_module.delete_all_redis_keys(current_active_user=None, redis=DummyRedis())
     assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
 
 
@@ -345,22 +277,12 @@ async def test_delete_all_redis_keys_service_unavailable(monkeypatch):
 async def test_health_endpoint(monkeypatch, client, fastapi_app):
     # Bypass auth
     monkeypatch.setattr(admin_redis_module.RoleChecker, "__call__", lambda self: None)
-    fastapi_app.dependency_overrides[admin_redis_module.get_redis_pool] = lambda: None
+    fastapi_app.dependency_overrides[admin_redis_module.get_redis_client] = lambda: DummyRedis()
 
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
-
         async def ping(self):
             return True
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
     url = fastapi_app.url_path_for("redis_health")
     response = await client.get(url)
     assert response.status_code == status.HTTP_200_OK
@@ -372,29 +294,100 @@ async def test_delete_all_keys_endpoint(monkeypatch, client, fastapi_app):
     # Bypass auth and password check
     monkeypatch.setattr(admin_redis_module.RoleChecker, "__call__", lambda self: None)
     fastapi_app.dependency_overrides[admin_redis_module.validate_active_user_password_dependency] = lambda: None
-    fastapi_app.dependency_overrides[admin_redis_module.get_redis_pool] = lambda: None
+    fastapi_app.dependency_overrides[admin_redis_module.get_redis_client] = lambda: DummyRedis()
 
     calls = []
 
     class DummyRedis:
-        def __init__(self, connection_pool):
-            pass
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
+        async def scan_iter(self, match, count):
+            yield b"x"
 
-        async def keys(self, pattern):
-            return [b"x"]
-
-        async def delete(self, *keys):
+        async def unlink(self, *keys):
             calls.extend(keys)
+            return len(keys)
 
-    monkeypatch.setattr(admin_redis_module, "Redis", DummyRedis)
     url = fastapi_app.url_path_for("delete_all_redis_keys")
     response = await client.delete(url)
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == {"message": "All key-value pairs successfully deleted from Redis database."}
+    assert response.json()["message"] == "All key-value pairs successfully deleted from Redis database."
+    assert response.json()["deleted"] == 1
     assert calls == [b"x"]
+
+
+@pytest.mark.anyio
+async def test_redis_scan_endpoints_with_fake_redis(monkeypatch, client, fastapi_app, fake_redis):
+    # Bypass auth and password check, use the fake redis server from conftest
+    monkeypatch.setattr(admin_redis_module.RoleChecker, "__call__", lambda self: None)
+    fastapi_app.dependency_overrides[admin_redis_module.validate_active_user_password_dependency] = lambda: None
+
+    for index in range(25):
+        await fake_redis.set(f"token:{index}", str(index))
+    await fake_redis.set("other", "value")
+
+    # Iterate the listing endpoint page by page
+    url = fastapi_app.url_path_for("get_all_redis_values")
+    seen = set()
+    cursor = 0
+    while True:
+        response = await client.get(url, params={"match": "token:*", "count": 10, "cursor": cursor})
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        seen.update(item["key"] for item in page["content"])
+        cursor = page["next_cursor"]
+        if page["complete"]:
+            break
+    assert seen == {f"token:{index}" for index in range(25)}
+
+    # Stream the chunked delete progress
+    url = fastapi_app.url_path_for("delete_all_redis_keys")
+    response = await client.delete(url, params={"match": "token:*", "chunk_size": 10, "stream": True})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["deleted"] for line in lines] == [10, 20, 25]
+    assert lines[-1]["complete"] is True
+
+    assert await fake_redis.keys("*") == [b"other"]
+
+
+@pytest.mark.anyio
+async def test_redis_pool_stats(monkeypatch, client, fastapi_app):
+    from fakeredis import FakeServer
+    from fakeredis.aioredis import FakeConnection
+    from redis.asyncio import Redis
+
+    from BMC_API.src.infrastructure.external_services.redis.pool import (
+        InstrumentedBlockingConnectionPool,
+    )
+
+    monkeypatch.setattr(admin_redis_module.RoleChecker, "__call__", lambda self: None)
+    pool = InstrumentedBlockingConnectionPool(
+        max_connections=4, timeout=1, connection_class=FakeConnection, server=FakeServer()
+    )
+    fastapi_app.dependency_overrides[admin_redis_module.get_redis_pool] = lambda: pool
+
+    redis = Redis(connection_pool=pool)
+    await redis.set("a", "1")
+    await redis.get("a")
+
+    url = fastapi_app.url_path_for("redis_pool_stats")
+    response = await client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    stats = response.json()
+    assert stats["max_connections"] == 4
+    assert stats["created_connections"] == 1
+    assert stats["in_use_connections"] == 0
+    assert stats["idle_connections"] == 1
+    assert stats["acquired_count"] == 2
+    assert stats["timeout_count"] == 0
+
+    await redis.close()
+    await pool.disconnect()
+
+
+@pytest.mark.anyio
+async def test_redis_pool_stats_not_available(monkeypatch, client, fastapi_app):
+    monkeypatch.setattr(admin_redis_module.RoleChecker, "__call__", lambda self: None)
+    url = fastapi_app.url_path_for("redis_pool_stats")
+    response = await client.get(url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -111,6 +111,69 @@ class TestAdminUserRoutes:
         assert response.json()["email"] == test_user_confirmed.email
         assert "password" not in response.json()
 
+    @pytest.mark.anyio
+    async def test_get_user_admin_etag_follows_login(
+        self, client: AsyncClient, fastapi_app: FastAPI, test_user_confirmed: UserCreateAdminDTO, admin_token
+    ):
+        """Test that a login, which does not change the modification time, changes the ETag of the user"""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        create_url = fastapi_app.url_path_for("create_user_route_admin")
+        create_response = await client.post(create_url, json=test_user_confirmed.model_dump(), headers=headers)
+        url = fastapi_app.url_path_for("get_user_route_admin", id=create_response.json()["id"])
+
+        response = await client.get(url, headers=headers)
+        etag = response.headers["ETag"]
+        not_modified = await client.get(url, headers={**headers, "If-None-Match": etag})
+        login_response = await client.post(
+            fastapi_app.url_path_for("login_route"),
+            data={"username": test_user_confirmed.email, "password": test_user_confirmed.password},
+        )
+        after_login = await client.get(url, headers={**headers, "If-None-Match": etag})
+
+        assert response.json()["last_login_time"] is None
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert login_response.status_code == status.HTTP_200_OK
+        assert after_login.status_code == status.HTTP_200_OK
+        assert after_login.json()["last_login_time"] is not None
+        assert after_login.json()["modified_time"] == response.json()["modified_time"]
+        assert after_login.headers["ETag"] != etag
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("bulk", [False, True])
+    async def test_disabling_user_revokes_refresh_tokens(
+        self,
+        client: AsyncClient,
+        fastapi_app: FastAPI,
+        test_user_confirmed: UserCreateAdminDTO,
+        admin_token,
+        bulk: bool,
+    ):
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        create_url = fastapi_app.url_path_for("create_user_route_admin")
+        user_id = (await client.post(create_url, json=test_user_confirmed.model_dump(), headers=headers)).json()["id"]
+        login_response = await client.post(
+            fastapi_app.url_path_for("login_route"),
+            data={"username": test_user_confirmed.email, "password": test_user_confirmed.password},
+        )
+        refresh_url = fastapi_app.url_path_for("refresh_token_route")
+
+        async def set_disabled(disabled: bool) -> None:
+            if bulk:
+                url = fastapi_app.url_path_for("bulk_update_users_route_admin")
+                response = await client.put(url, json=[{"id": user_id, "disabled": disabled}], headers=headers)
+            else:
+                url = fastapi_app.url_path_for("update_user_route_admin", id=user_id)
+                response = await client.put(url, json={"disabled": disabled}, headers=headers)
+            assert response.status_code == status.HTTP_200_OK
+
+        await set_disabled(True)
+        disabled_refresh = await client.post(refresh_url, json=login_response.json())
+        await set_disabled(False)
+        enabled_refresh = await client.post(refresh_url, json=login_response.json())
+
+        assert disabled_refresh.status_code == status.HTTP_401_UNAUTHORIZED
+        assert enabled_refresh.status_code == status.HTTP_200_OK
+
     @pytest.mark.anyio
     async def test_get_user_admin_not_found(self, client: AsyncClient, fastapi_app: FastAPI, admin_token):
         """Test getting a non-existent user as admin"""
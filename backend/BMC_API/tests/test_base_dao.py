@@ -8,7 +8,7 @@ from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from BMC_API.src.infrastructure.persistence.base import Base
-from BMC_API.src.infrastructure.persistence.dao.base_dao import BaseDAO, QueryHelper
+from BMC_API.src.infrastructure.persistence.dao.base_dao import BaseDAO, ModelMetadata, QueryHelper
 
 pytest_plugins = ["BMC_API.tests.fixtures.base_dao_fixtures"]
 
@@ -118,15 +118,14 @@ class TestQueryHelper:
         query = query_helper.build_query_with_output_filters(None)
         assert "FROM test_model" in str(query)
 
-    async def test_apply_search_filters(self, query_helper):
-        query = select(SampleModel)
-
+    async def test_search_filters(self, query_helper):
         # Test equality filter
-        filtered_query, base_query = query_helper.apply_search_filters(query, {"name": "Test"})
+        filtered_query, count_query, _ = query_helper.build_list_statements({"name": "Test"})
         assert "name = " in str(filtered_query)
+        assert "name = " in str(count_query)
 
         # Test NULL filter
-        filtered_query, base_query = query_helper.apply_search_filters(query, {"description": None})
+        filtered_query, count_query, _ = query_helper.build_list_statements({"description": None})
         assert "description IS NULL" in str(filtered_query)
 
         # Test operators
@@ -144,7 +143,7 @@ class TestQueryHelper:
         }
 
         for op, val in operators.items():
-            filtered_query, base_query = query_helper.apply_search_filters(query, {op: val})
+            filtered_query, count_query, _ = query_helper.build_list_statements({op: val})
             assert "WHERE" in str(filtered_query), f"Failed for operator {op}"
 
     async def test_apply_sorting(self, query_helper):
@@ -400,6 +399,40 @@ class TestBaseDAO:
         assert all(item.name == "Same Name" for item in items)
         assert items[0].age < items[1].age < items[2].age
 
+    async def test_list_reuses_statements_for_other_filter_values(self, test_dao, sample_data):
+        """Test that list statements are cached by query shape and bound to new values."""
+        params = dict(output_filters=None, sort_by="age", sort_desc=True, paginate=True)
+        query, count_query, values = test_dao.query_helper.build_list_statements({"category__in": ["A"]}, **params)
+        same_query, same_count_query, other_values = test_dao.query_helper.build_list_statements(
+            {"category__in": ["B", "C"]}, **params
+        )
+        assert (same_query, same_count_query) == (query, count_query)
+        assert (values, other_values) == ({"filter_0": ["A"]}, {"filter_0": ["B", "C"]})
+
+        other_shape, *_ = test_dao.query_helper.build_list_statements({"category__in": ["A"], "age": 30}, **params)
+        assert other_shape is not query
+
+        items, total_pages, total_records = await test_dao.list(
+            limit=2, search_filters={"category__in": ["B", "C"]}, sort_by="age", sort_desc=True
+        )
+        assert total_records == 10
+        assert total_pages == 5
+        assert [item.category for item in items] in (["B", "C"], ["C", "B"])
+
+    async def test_filter_parameters_are_typed_like_literals(self, test_dao, sample_data):
+        """Test that a string compared with a datetime column is bound as a string, as a literal would be."""
+        items, _, total_records = await test_dao.list(search_filters={"created_time__lt": "2999-01-01T00:00:00"})
+        assert total_records == 20
+
+        items, _, total_records = await test_dao.list(search_filters={"created_time__lt": datetime(1999, 1, 1)})
+        assert total_records == 0
+
+    async def test_model_metadata_is_inspected_once(self, test_dao):
+        """Test that column and relationship names are computed once per model."""
+        assert ModelMetadata.of(SampleModel) is test_dao.query_helper.metadata
+        assert "name" in test_dao.query_helper.metadata.column_names
+        assert test_dao.query_helper.metadata.relationships == {}
+
 
 # Helper for async sleep in tests
 async def asyncio_sleep(seconds):
@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 
 import pytest
 from pydantic import BaseModel
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, text
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, event, text
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship
@@ -303,3 +303,36 @@ class TestBaseDAOEdgeCases:
         # Should ignore the invalid operator and return all items
         initial_count, _, _ = await child_dao.list()
         assert len(items) == len(initial_count)
+
+    async def test_nested_output_filters(self, dbsession, parent_dao, relationship_data):
+        """Only the requested columns of related rows are selected and returned."""
+        statements = []
+
+        def record(connection, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(dbsession.bind.sync_engine, "before_cursor_execute", record)
+        try:
+            items, _, total_records = await parent_dao.list(
+                output_filters=["name"], nested_output_filters={"children": ["name", "invalid_field"]}
+            )
+        finally:
+            event.remove(dbsession.bind.sync_engine, "before_cursor_execute", record)
+
+        assert total_records == 3
+        assert items[0] == {
+            "name": "Parent 0",
+            "children": [{"name": "Child 0"}, {"name": "Child 3"}, {"name": "Child 6"}],
+        }
+        children_query = next(statement for statement in statements if "FROM child_model" in statement)
+        assert "child_model.name" in children_query
+        assert "child_model.score" not in children_query
+        parents_query = next(statement for statement in statements if "FROM parent_model" in statement)
+        assert "parent_model.created_time" not in parents_query
+
+    async def test_nested_output_filters_without_output_filters(self, parent_dao, relationship_data):
+        """Narrowing a relationship keeps all columns of the model."""
+        items, _, _ = await parent_dao.list(nested_output_filters={"children": ["score"]})
+
+        assert set(items[0]) == {"id", "name", "created_time", "modified_time", "children"}
+        assert items[0]["children"] == [{"score": 0}, {"score": 30}, {"score": 60}]
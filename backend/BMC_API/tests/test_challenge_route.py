@@ -1,4 +1,5 @@
 # backend/BMC_API/tests/test_challenge_route.py
+import os
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -183,6 +184,48 @@ class TestChallengeRoutes:
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["id"] == challenge_id
 
+    async def test_get_challenge_is_validated_with_etag(self, client: AsyncClient, fastapi_app: FastAPI, user_token):
+        headers = {"Authorization": f"Bearer {user_token}"}
+        create_url = fastapi_app.url_path_for("create_challenge_route")
+        mock_conference = MagicMock(is_open_for_submissions=True)
+        mock_challenge = MagicMock(challenge_conference=mock_conference, challenge_status="Draft")
+
+        # Mock challenge only for creation and update processes
+        with (
+            patch.object(ConferenceService, "get_raw", new=AsyncMock(return_value=mock_conference)),
+            patch.object(ChallengeService, "get_raw", new=AsyncMock(return_value=mock_challenge)),
+        ):
+            create_resp = await client.post(
+                f"{create_url}?conference_id={CONFERENCE_ID}",
+                json={"challenge_name": "Cached", "challenge_abstract": "Validated."},
+                headers=headers,
+            )
+        challenge_id = create_resp.json()["id"]
+        get_url = fastapi_app.url_path_for("get_challenge_route", id=challenge_id)
+
+        response = await client.get(get_url, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+        response = await client.get(get_url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+        # Updating the challenge changes its modification time and therefore the ETag
+        with (
+            patch.object(ConferenceService, "get_raw", new=AsyncMock(return_value=mock_conference)),
+            patch.object(ChallengeService, "get_raw", new=AsyncMock(return_value=mock_challenge)),
+        ):
+            update_url = fastapi_app.url_path_for("update_challenge_route", id=challenge_id)
+            await client.put(update_url, json={"challenge_name": "Renamed"}, headers=headers)
+        response = await client.get(get_url, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["challenge_name"] == "Renamed"
+        assert response.headers["ETag"] != etag
+
     async def test_get_all_my_challenges(self, client: AsyncClient, fastapi_app: FastAPI, user_token):
         challenge_data = {
             "challenge_name": "Get Challenge",
@@ -478,6 +521,46 @@ class TestChallengeRoutes:
         assert response.headers["content-type"] == "application/pdf"
         assert response.content.startswith(b"%PDF-1.4")
 
+    async def test_download_challenge_document_is_validated_with_etag(
+        self,
+        client: AsyncClient,
+        fastapi_app: FastAPI,
+        user_token,
+        patch_challenge_and_conference_open,
+        tmp_path,
+    ):
+        headers = {"Authorization": f"Bearer {user_token}"}
+        create_url = fastapi_app.url_path_for("create_challenge_route")
+        create_resp = await client.post(
+            f"{create_url}?conference_id={CONFERENCE_ID}",
+            json={"challenge_name": "DL Cache", "challenge_abstract": "Download me once."},
+            headers=headers,
+        )
+        cid = create_resp.json()["id"]
+        pdf_path = tmp_path / "foo.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 fake content")
+
+        dl_url = fastapi_app.url_path_for("download_challenge_document_route", id=cid)
+        with patch.object(
+            ChallengeService,
+            "download_challenge",
+            new=AsyncMock(
+                side_effect=lambda id: FileResponse(
+                    str(pdf_path), media_type="application/pdf", stat_result=os.stat(pdf_path)
+                )
+            ),
+        ):
+            response = await client.get(dl_url, headers=headers)
+            etag = response.headers["ETag"]
+            not_modified = await client.get(dl_url, headers={**headers, "If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not etag.startswith("W/")
+        assert response.headers["Cache-Control"] == "private, no-cache"
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.content == b""
+        assert not_modified.headers["ETag"] == etag
+
     async def test_download_challenge_document_unauthorized_user(
         self,
         client: AsyncClient,
@@ -0,0 +1,149 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from BMC_API.src.core.exceptions import SearchUnavailableException
+from BMC_API.src.domain.entities.challenge_model import ChallengeModel
+from BMC_API.src.domain.entities.task_model import TaskModel
+from BMC_API.src.infrastructure.persistence.dao.challenge_dao import (
+    SQLAlchemyChallengeRepository,
+)
+from BMC_API.src.infrastructure.persistence.search import (
+    CHALLENGE_SEARCH_INDEX,
+    is_search_table,
+    search_challenges,
+    to_fts_query,
+)
+
+
+@pytest.fixture
+async def challenges(dbsession: AsyncSession):
+    liver = ChallengeModel(
+        challenge_name="Liver lesion challenge",
+        challenge_acronym="LLC",
+        challenge_abstract="Detection of hepatic lesions in CT scans",
+        challenge_keywords=["liver", "CT"],
+        challenge_created_time=datetime.now(),
+    )
+    brain = ChallengeModel(
+        challenge_name="Brain challenge",
+        challenge_abstract="Registration of MRI scans, the liver is not involved",
+        challenge_created_time=datetime.now(),
+    )
+    retina = ChallengeModel(challenge_name="Retina challenge", challenge_created_time=datetime.now())
+    dbsession.add_all([liver, brain, retina])
+    await dbsession.flush()
+    dbsession.add(
+        TaskModel(
+            task_name="Vessel segmentation",
+            task_abstract="Segmentation of retinal vessels in fundus photographs",
+            task_created_time=datetime.now(),
+            task_challenge_id=retina.id,
+        )
+    )
+    await dbsession.commit()
+    return liver, brain, retina
+
+
+def test_plain_terms_become_prefix_queries():
+    assert to_fts_query('liver "CT" OR NEAR(') == '"liver"* "CT"* "OR"* "NEAR"*'
+    assert to_fts_query("  ") == ""
+    assert is_search_table("challenge_search_data")
+    assert not is_search_table("challenges")
+
+
+@pytest.mark.anyio
+async def test_search_ranks_by_weighted_columns(dbsession: AsyncSession, challenges):
+    liver, brain, _ = challenges
+
+    results = await search_challenges(dbsession, "liver", limit=10)
+
+    # The name and keywords of the first challenge weigh more than the abstract of the second one
+    assert [result["challenge_id"] for result in results] == [liver.id, brain.id]
+    assert results[0]["score"] > results[1]["score"]
+    assert results[0]["snippets"][0]["source"] == "challenge"
+    assert "<b>Liver</b>" in results[0]["snippets"][0]["text"]
+
+
+@pytest.mark.anyio
+async def test_search_finds_challenges_by_task_text(dbsession: AsyncSession, challenges):
+    *_, retina = challenges
+
+    (result,) = await search_challenges(dbsession, "fundus photo", limit=10)
+
+    assert result["challenge_id"] == retina.id
+    assert result["snippets"][0]["task_name"] == "Vessel segmentation"
+    assert await search_challenges(dbsession, "", limit=10) == []
+
+
+@pytest.mark.anyio
+async def test_snippets_escape_the_indexed_text(dbsession: AsyncSession):
+    dbsession.add(
+        ChallengeModel(
+            challenge_name="Challenge",
+            challenge_abstract='Kidney <img src=x onerror="alert(1)"> & <b>tumour</b> segmentation',
+            challenge_created_time=datetime.now(),
+        )
+    )
+    await dbsession.commit()
+
+    (result,) = await search_challenges(dbsession, "kidney", limit=10)
+
+    assert result["snippets"][0]["text"] == (
+        "<b>Kidney</b> &lt;img src=x onerror=&quot;alert(1)&quot;&gt; &amp; &lt;b&gt;tumour&lt;/b&gt; segmentation"
+    )
+
+
+@pytest.mark.anyio
+async def test_index_follows_updates_and_deletes(dbsession: AsyncSession, challenges):
+    liver, brain, _ = challenges
+    repository = SQLAlchemyChallengeRepository(dbsession)
+
+    await repository.update(brain.id, {"challenge_abstract": "Registration of MRI scans"})
+    assert [result["challenge_id"] for result in await search_challenges(dbsession, "liver", 10)] == [liver.id]
+
+    await repository.delete(liver.id)
+    assert await search_challenges(dbsession, "liver", 10) == []
+
+    # The external content index stays consistent with the table
+    await dbsession.execute(
+        text(f"INSERT INTO {CHALLENGE_SEARCH_INDEX.name}({CHALLENGE_SEARCH_INDEX.name}) VALUES ('integrity-check')")
+    )
+
+
+@pytest.mark.anyio
+async def test_search_and_match_filters(dbsession: AsyncSession, challenges):
+    liver, brain, retina = challenges
+    repository = SQLAlchemyChallengeRepository(dbsession)
+
+    rows, _, total = await repository.list(search_filters={"challenge_search__search": "hepat"})
+    assert [row.id for row in rows] == [liver.id]
+
+    rows, _, total = await repository.list(search_filters={"challenge_abstract__search": "liver"})
+    assert [row.id for row in rows] == [brain.id]
+
+    rows, _, total = await repository.list(search_filters={"challenge_search__match": "brain OR retina"}, sort_by="id")
+    assert [row.id for row in rows] == [brain.id, retina.id]
+    assert total == 2
+
+    # Fields without an index and empty terms are ignored, like other invalid filters
+    rows, _, total = await repository.list(
+        search_filters={"challenge_year__search": "liver", "challenge_search__search": "!"}
+    )
+    assert total == 3
+
+
+@pytest.mark.anyio
+async def test_search_filters_require_sqlite(dbsession: AsyncSession, monkeypatch):
+    # Other databases have no search index, the filters are rejected instead of failing in the database
+    monkeypatch.setattr(dbsession.bind.dialect, "name", "postgresql")
+    repository = SQLAlchemyChallengeRepository(dbsession)
+
+    with pytest.raises(SearchUnavailableException):
+        await repository.list(search_filters={"challenge_search__search": "liver"})
+    with pytest.raises(SearchUnavailableException):
+        await repository.list(search_filters={"challenge_search__match": "liver"})
+    with pytest.raises(SearchUnavailableException):
+        await search_challenges(dbsession, "liver", 10)
@@ -15,6 +15,7 @@ from BMC_API.src.application.dto.challenge_dto import (
 from BMC_API.src.application.dto.task_dto import TaskModelBaseOutputDTO
 from BMC_API.src.application.use_cases.task_use_cases import TaskService
 from BMC_API.src.core.exceptions import NotFoundException, RepositoryException
+from BMC_API.src.core.metrics import metrics
 
 
 @pytest.fixture
@@ -526,6 +527,7 @@ async def test_submit_challenge_success(
         challenge_file="file.pdf",
     )
     repository.update.return_value = updated_entity
+    rendered_pdfs = metrics.registry.get_sample_value("bmc_pdf_render_duration_seconds_count")
 
     # Call submit_challenge
     result = await service.submit_challenge(
@@ -537,3 +539,4 @@ async def test_submit_challenge_success(
     assert isinstance(result, ChallengeModelBaseOutputDTO)
     assert result.challenge_file == "file.pdf"
     repository.update.assert_awaited_once()
+    assert metrics.registry.get_sample_value("bmc_pdf_render_duration_seconds_count") == rendered_pdfs + 1
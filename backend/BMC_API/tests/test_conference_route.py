@@ -49,3 +49,38 @@ class TestConferenceRoutes:
         response = await client.get(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_open_conferences_are_validated_with_etag(
+        self, client: AsyncClient, fastapi_app: FastAPI, admin_token
+    ):
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = await client.post(
+            fastapi_app.url_path_for("create_conference_route_admin"), json=conference_data, headers=headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        conference_id = response.json()["id"]
+
+        url = fastapi_app.url_path_for("get_all_conferences_limited_route")
+        response = await client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "no-cache"
+
+        # Matching ETag is answered without a body
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+        # Updating a conference invalidates the cached listing
+        response = await client.put(
+            fastapi_app.url_path_for("update_conference_route_admin", id=conference_id),
+            json={"name": "Renamed Conference"},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+        assert response.json()["content"][0]["name"] == "Renamed Conference"
@@ -0,0 +1,193 @@
+# backend/BMC_API/tests/test_database_backup.py
+import gzip
+import os
+import sqlite3
+import subprocess
+
+import pytest
+
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.infrastructure.persistence.backup import (
+    CHECKSUM_EXTENSION,
+    list_backup_files,
+    online_backup,
+    pg_dump_backup,
+    verify_backup,
+)
+from BMC_API.src.infrastructure.persistence import backup, incremental_backup
+from BMC_API.src.infrastructure.persistence.dependencies import (
+    backup_database,
+    clean_database_backups,
+    delete_db_backups,
+    snapshot_database,
+)
+from BMC_API.src.infrastructure.persistence.incremental_backup import (
+    create_snapshot,
+    delete_snapshots,
+    list_snapshots,
+    restore_snapshot,
+)
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    path = tmp_path / "database.sqlite3"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    connection.executemany("INSERT INTO items (name) VALUES (?)", [(f"item {i}" * 50,) for i in range(2000)])
+    connection.commit()
+    connection.close()
+    return str(path)
+
+
+def _count_items(path: str) -> int:
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT count(*) FROM items").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_online_backup_in_steps(db_file, tmp_path):
+    backup_folder = tmp_path / "backups"
+    backup_folder.mkdir()
+
+    location = online_backup(db_file, str(backup_folder / "copy.sqlite3"), pages_per_step=5, step_sleep=0)
+
+    assert location == str(backup_folder / "copy.sqlite3")
+    assert _count_items(location) == 2000
+    assert verify_backup(location)
+    # Only the backup and its checksum remain, no temporary files
+    assert sorted(os.listdir(backup_folder)) == ["copy.sqlite3", "copy.sqlite3" + CHECKSUM_EXTENSION]
+
+
+def test_online_backup_gzip(db_file, tmp_path):
+    location = online_backup(db_file, str(tmp_path / "copy.sqlite3"), compression="gzip")
+
+    assert location.endswith(".sqlite3.gz")
+    assert verify_backup(location)
+    restored = tmp_path / "restored.sqlite3"
+    with gzip.open(location, "rb") as compressed:
+        restored.write_bytes(compressed.read())
+    assert _count_items(str(restored)) == 2000
+
+
+def test_online_backup_zstd(db_file, tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+
+    location = online_backup(db_file, str(tmp_path / "copy.sqlite3"), compression="zstd")
+
+    assert location.endswith(".sqlite3.zst")
+    assert verify_backup(location)
+    restored = tmp_path / "restored.sqlite3"
+    with open(location, "rb") as compressed:
+        restored.write_bytes(zstandard.ZstdDecompressor().stream_reader(compressed).read())
+    assert _count_items(str(restored)) == 2000
+
+
+@pytest.mark.anyio
+async def test_backup_database_and_delete_backups(db_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "db_file", db_file)
+    monkeypatch.setattr(settings, "backup_folder", str(tmp_path / "backups"))
+    monkeypatch.setattr(settings, "db_backup_compression", "gzip")
+
+    first = await backup_database("first")
+    second = await backup_database("second")
+    assert list_backup_files(settings.backup_folder) == [first, second]
+
+    assert await delete_db_backups() == [first]
+    assert not os.path.exists(first + CHECKSUM_EXTENSION)
+    assert list_backup_files(settings.backup_folder) == [second]
+
+
+def _fake_pg_dump(calls):
+    def run(command, env, **kwargs):
+        calls.append((command, env["PGPASSWORD"]))
+        target = next(arg.removeprefix("--file=") for arg in command if arg.startswith("--file="))
+        with open(target, "wb") as file:
+            file.write(b"PGDMP")
+        return subprocess.CompletedProcess(command, 0)
+
+    return run
+
+
+def test_pg_dump_backup(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(backup.subprocess, "run", _fake_pg_dump(calls))
+
+    location = pg_dump_backup(str(tmp_path / "database"), "db", 5433, "user", "secret", "bmc")
+    assert location == str(tmp_path / "database.dump")
+    assert verify_backup(location)
+    assert list_backup_files(str(tmp_path)) == [location]
+
+    command, password = calls[0]
+    assert password == "secret"
+    assert command[:2] == ["pg_dump", "--format=custom"]
+    assert {"--host=db", "--port=5433", "--username=user"} <= set(command)
+    assert command[-1] == "bmc"
+    assert "secret" not in " ".join(command)
+
+
+def test_pg_dump_backup_failure_leaves_no_file(tmp_path, monkeypatch):
+    def run(command, **kwargs):
+        raise subprocess.CalledProcessError(1, command, stderr="connection refused\n")
+
+    monkeypatch.setattr(backup.subprocess, "run", run)
+    with pytest.raises(RuntimeError, match="connection refused"):
+        pg_dump_backup(str(tmp_path / "database"), "db", 5432, "user", "secret", "bmc")
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.anyio
+async def test_backup_database_dumps_postgresql(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(backup.subprocess, "run", _fake_pg_dump(calls))
+    monkeypatch.setattr(settings, "db_backend", "postgresql")
+    monkeypatch.setattr(settings, "backup_folder", str(tmp_path / "backups"))
+
+    location = await backup_database("first")
+    assert location == str(tmp_path / "backups" / "first.dump")
+    assert len(calls) == 1
+    assert await snapshot_database() is None
+
+
+def test_incremental_snapshots_deduplicate_and_restore(db_file, tmp_path, monkeypatch):
+    backup_folder = str(tmp_path / "backups")
+    first = create_snapshot(db_file, backup_folder, chunk_size=4096)
+
+    connection = sqlite3.connect(db_file)
+    connection.execute("UPDATE items SET name = 'changed' WHERE id = 1")
+    connection.commit()
+    connection.close()
+    second = create_snapshot(db_file, backup_folder, chunk_size=4096)
+
+    assert first["new_chunks"] == len(first["chunks"])
+    assert 0 < second["new_chunks"] < len(second["chunks"]) // 10
+    assert [manifest["id"] for manifest in list_snapshots(backup_folder)] == [first["id"], second["id"]]
+
+    restored = restore_snapshot(backup_folder, first["id"], str(tmp_path / "restored.sqlite3"))
+    connection = sqlite3.connect(restored)
+    assert connection.execute("SELECT name FROM items WHERE id = 1").fetchone()[0] != "changed"
+    connection.close()
+
+    # Deleting the first snapshot only removes the chunks the second one does not share
+    monkeypatch.setattr(incremental_backup, "CHUNK_GRACE_PERIOD_IN_SEC", -1)
+    delete_snapshots(backup_folder, [first["id"]])
+    restored = restore_snapshot(backup_folder, second["id"], str(tmp_path / "restored.sqlite3"))
+    connection = sqlite3.connect(restored)
+    assert connection.execute("SELECT name FROM items WHERE id = 1").fetchone()[0] == "changed"
+    connection.close()
+    chunk_files = [name for _, _, names in os.walk(os.path.join(backup_folder, "chunks")) for name in names]
+    assert len(chunk_files) == len(set(second["chunks"]))
+
+
+@pytest.mark.anyio
+async def test_clean_database_backups_keeps_latest_snapshot(db_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "db_file", db_file)
+    monkeypatch.setattr(settings, "backup_folder", str(tmp_path / "backups"))
+    first = await snapshot_database()
+    second = await snapshot_database()
+
+    # Every snapshot is older than the limit, the latest one is kept anyway
+    assert await clean_database_backups(age_limit=-1) == [first["id"]]
+    assert [manifest["id"] for manifest in list_snapshots(settings.backup_folder)] == [second["id"]]
@@ -0,0 +1,128 @@
+# backend/BMC_API/tests/test_jobs.py
+import asyncio
+import os
+import threading
+
+import pytest
+
+from BMC_API.src.api.routes.admin import admin_database
+from BMC_API.src.core import jobs
+from BMC_API.src.core.jobs import JobHistory, LeaderLock, leader_job
+
+
+@pytest.fixture
+def job_state(tmp_path, monkeypatch):
+    leader = LeaderLock(str(tmp_path / "jobs.lock"))
+    history = JobHistory(str(tmp_path / "history.json"), size=3)
+    monkeypatch.setattr(jobs, "job_leader", leader)
+    monkeypatch.setattr(jobs, "job_history", history)
+    monkeypatch.setattr(admin_database, "job_leader", leader)
+    monkeypatch.setattr(admin_database, "job_history", history)
+    yield leader, history
+    leader.release()
+
+
+def test_only_one_worker_is_leader(tmp_path):
+    first = LeaderLock(str(tmp_path / "jobs.lock"))
+    second = LeaderLock(str(tmp_path / "jobs.lock"))
+
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert first.leader_pid() == os.getpid()
+
+    # The follower takes over once the leader is gone
+    first.release()
+    assert second.try_acquire()
+    second.release()
+
+
+@pytest.mark.anyio
+async def test_leader_job_records_runs(job_state):
+    leader, history = job_state
+    calls = []
+
+    @leader_job("succeeding")
+    async def succeeding():
+        calls.append(1)
+
+    @leader_job("failing")
+    async def failing():
+        raise RuntimeError("boom")
+
+    @leader_job("failing_silently")
+    async def failing_silently():
+        raise RuntimeError()
+
+    await succeeding()
+    with pytest.raises(RuntimeError):
+        await failing()
+    with pytest.raises(RuntimeError):
+        await failing_silently()
+
+    runs = history.read()
+    assert calls == [1]
+    assert [(run["job"], run["status"], run["error"]) for run in runs] == [
+        ("succeeding", "succeeded", None),
+        ("failing", "failed", "boom"),
+        ("failing_silently", "failed", ""),
+    ]
+
+    # History is bounded
+    for _ in range(3):
+        await succeeding()
+    assert len(history.read()) == 3
+
+
+@pytest.mark.anyio
+async def test_follower_skips_jobs(job_state, tmp_path):
+    leader, history = job_state
+    other_worker = LeaderLock(leader.path)
+    assert other_worker.try_acquire()
+
+    @leader_job("skipped")
+    async def skipped():
+        raise AssertionError("must not run")
+
+    await skipped()
+    assert history.read() == []
+    other_worker.release()
+
+
+@pytest.mark.anyio
+async def test_periodic_jobs_report(job_state):
+    @leader_job("backup_database")
+    async def backup():
+        pass
+
+    await backup()
+    await backup()
+
+    report = await admin_database.periodic_jobs_report(limit=1)
+    assert report.worker_is_leader is True
+    assert report.leader_pid == os.getpid()
+    assert report.summary[0].job == "backup_database"
+    assert report.summary[0].runs == 2
+    assert len(report.runs) == 1
+
+
+@pytest.mark.anyio
+async def test_leader_job_writes_history_off_the_event_loop(job_state, monkeypatch):
+    _, history = job_state
+    append = history.append
+    writer_threads = []
+
+    def recording_append(run):
+        writer_threads.append(threading.get_ident())
+        append(run)
+
+    monkeypatch.setattr(history, "append", recording_append)
+    jobs_to_run = [leader_job(f"job {i}")(_noop) for i in range(3)]
+
+    await asyncio.gather(*(job() for job in jobs_to_run))
+
+    assert threading.get_ident() not in writer_threads
+    assert sorted(run["job"] for run in history.read()) == ["job 0", "job 1", "job 2"]
+
+
+async def _noop() -> None:
+    pass
@@ -0,0 +1,77 @@
+import json
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from BMC_API.src.api import responses
+from BMC_API.src.api.application import get_app
+from BMC_API.src.api.dependencies.schemas import pagination_json_response
+from BMC_API.src.api.responses import ORJSONPayloadResponse, PayloadJSONResponse, json_response_class
+from BMC_API.src.core.config.settings import settings
+
+
+class Item(BaseModel):
+    name: str
+    created: datetime
+    note: str | None = None
+
+
+def test_payload_response_sends_bytes_as_they_are():
+    body = b'{"content":[1,2,3]}'
+    response = PayloadJSONResponse(body, headers={"ETag": '"abc"'})
+
+    assert response.body is body
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"] == '"abc"'
+
+
+def test_payload_response_encodes_models_with_their_serializer():
+    item = Item(name="Zürich", created=datetime(2026, 1, 2, 3, 4, 5))
+
+    response = PayloadJSONResponse(item)
+
+    assert response.body == item.model_dump_json().encode("utf-8")
+
+
+def test_payload_response_encodes_other_content_like_ujson():
+    response = PayloadJSONResponse({"name": "Zürich", "ids": [1, 2]})
+
+    assert response.body == '{"name":"Zürich","ids":[1,2]}'.encode("utf-8")
+
+
+def test_orjson_payload_response():
+    response = ORJSONPayloadResponse({"name": "Zürich", 1: None, "created": datetime(2026, 1, 2, 3, 4, 5)})
+
+    assert json.loads(response.body) == {"name": "Zürich", "1": None, "created": "2026-01-02T03:04:05"}
+    # orjson is a dependency, so the application encodes with it by default
+    assert json_response_class() is ORJSONPayloadResponse
+    assert get_app().router.default_response_class is ORJSONPayloadResponse
+
+
+def test_response_class_selection(monkeypatch):
+    monkeypatch.setattr(settings, "json_response_backend", "ujson")
+    assert json_response_class() is PayloadJSONResponse
+
+    monkeypatch.setattr(settings, "json_response_backend", "orjson")
+    monkeypatch.setattr(responses, "orjson", None)
+    assert json_response_class() is PayloadJSONResponse
+    assert get_app().router.default_response_class is PayloadJSONResponse
+
+    monkeypatch.setattr(responses, "orjson", object())
+    assert json_response_class() is ORJSONPayloadResponse
+
+
+def test_pagination_response_is_encoded_once():
+    items = [Item(name="a", created=datetime(2026, 1, 1)), Item(name="b", created=datetime(2026, 1, 2), note="x")]
+
+    response = pagination_json_response(items, 1, 2, exclude_none=True)
+
+    assert isinstance(response, PayloadJSONResponse)
+    assert json.loads(response.body) == {
+        "total_pages": 1,
+        "total_records": 2,
+        "content": [
+            {"name": "a", "created": "2026-01-01T00:00:00"},
+            {"name": "b", "created": "2026-01-02T00:00:00", "note": "x"},
+        ],
+    }
@@ -0,0 +1,151 @@
+import json
+import time
+from datetime import datetime
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import UJSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from loguru import logger
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from BMC_API.src.api.dependencies.schemas import PaginationResponse, pagination_json_response
+from BMC_API.src.application.dto.challenge_dto import ChallengeResponseAdminDTO
+from BMC_API.src.application.use_cases.base_use_cases import BaseService, list_adapter, projection_dto
+from BMC_API.src.domain.entities.challenge_model import ChallengeModel
+from BMC_API.src.domain.entities.task_model import TaskModel
+from BMC_API.src.domain.entities.user_model import UserModel
+from BMC_API.src.infrastructure.persistence.dao.challenge_dao import (
+    SQLAlchemyChallengeRepository,
+)
+
+TASKS_PER_CHALLENGE = 3
+
+
+async def _create_challenges(session: AsyncSession, count: int) -> None:
+    now = datetime.now()
+    owner = UserModel(email="owner@email.com", password="1234", created_time=now, email_confirmed=True)
+    session.add(owner)
+    await session.flush()
+    challenges = [
+        ChallengeModel(
+            challenge_name=f"Challenge {i}",
+            challenge_acronym=f"C{i}",
+            challenge_abstract="Segmentation of organs at risk in CT scans " * 5,
+            challenge_keywords=["CT", "segmentation"],
+            challenge_created_time=now,
+            challenge_status="Draft",
+            challenge_owner_id=owner.id,
+        )
+        for i in range(count)
+    ]
+    session.add_all(challenges)
+    await session.flush()
+    session.add_all(
+        TaskModel(
+            task_name=f"Task {j} of challenge {challenge.id}",
+            task_abstract="Delineation of the liver and the kidneys " * 5,
+            task_created_time=now,
+            task_challenge_id=challenge.id,
+        )
+        for challenge in challenges
+        for j in range(TASKS_PER_CHALLENGE)
+    )
+    await session.commit()
+
+
+def _list_route(app: FastAPI) -> APIRoute:
+    return next(
+        route for route in app.routes if isinstance(route, APIRoute) and route.name == "list_challenges_route_admin"
+    )
+
+
+async def _fastapi_response(route: APIRoute, entities, total_pages: int, total_records: int) -> bytes:
+    """Former path: a new adapter per call, then FastAPI dumps the page and validates it again."""
+    content = TypeAdapter(List[ChallengeResponseAdminDTO]).validate_python(entities)
+    page = PaginationResponse(total_pages=total_pages, total_records=total_records, content=content)
+    serialized = await serialize_response(field=route.response_field, response_content=page, exclude_none=True)
+    return UJSONResponse(serialized).body
+
+
+def _single_pass_response(service: BaseService, entities, total_pages: int, total_records: int) -> bytes:
+    content = service.to_dto_list(entities)
+    return pagination_json_response(content, total_pages, total_records, exclude_none=True).body
+
+
+def test_list_adapter_is_cached_per_dto():
+    assert list_adapter(ChallengeResponseAdminDTO) is list_adapter(ChallengeResponseAdminDTO)
+    assert list_adapter(ChallengeResponseAdminDTO) is not list_adapter(PaginationResponse)
+
+
+@pytest.mark.anyio
+async def test_single_pass_response_matches_fastapi_serialization(fastapi_app: FastAPI, dbsession: AsyncSession):
+    await _create_challenges(dbsession, 3)
+    service = BaseService(SQLAlchemyChallengeRepository(dbsession), dto_class=ChallengeResponseAdminDTO)
+
+    entities, total_pages, total_records = await service.list()
+    assert all(isinstance(entity, ChallengeResponseAdminDTO) for entity in entities)
+    assert len(entities[0].challenge_tasks) == TASKS_PER_CHALLENGE
+    assert entities[0].challenge_owner.email == "owner@email.com"
+
+    expected = await _fastapi_response(_list_route(fastapi_app), entities, total_pages, total_records)
+    assert json.loads(pagination_json_response(entities, total_pages, total_records, exclude_none=True).body) == (
+        json.loads(expected)
+    )
+
+
+@pytest.mark.anyio
+async def test_nested_projection_is_validated(dbsession: AsyncSession):
+    await _create_challenges(dbsession, 2)
+    service = BaseService(SQLAlchemyChallengeRepository(dbsession), dto_class=ChallengeResponseAdminDTO)
+
+    entities, _, total_records = await service.list(
+        output_filters=["id", "challenge_acronym"], nested_output_filters={"challenge_tasks": ["task_name"]}
+    )
+
+    dto_class = projection_dto(
+        ChallengeResponseAdminDTO,
+        ("id", "challenge_acronym", "challenge_tasks"),
+        (("challenge_tasks", ("task_name",)),),
+    )
+    assert total_records == 2
+    assert all(type(entity) is dto_class for entity in entities)
+    assert entities[0].model_dump() == {
+        "id": entities[0].id,
+        "challenge_acronym": "C0",
+        "challenge_tasks": [
+            {"task_name": f"Task {i} of challenge {entities[0].id}"} for i in range(TASKS_PER_CHALLENGE)
+        ],
+    }
+
+    # Validators of the selected fields are kept
+    with pytest.raises(ValidationError):
+        projection_dto(ChallengeResponseAdminDTO, ("challenge_year",)).model_validate({"challenge_year": "24"})
+
+
+@pytest.mark.benchmark
+@pytest.mark.anyio
+async def test_benchmark_list_1000_challenges_with_tasks(fastapi_app: FastAPI, dbsession: AsyncSession):
+    await _create_challenges(dbsession, 1000)
+    service = BaseService(SQLAlchemyChallengeRepository(dbsession), dto_class=ChallengeResponseAdminDTO)
+    entities, total_pages, total_records = await service.repository.list(limit=1000)
+    assert len(entities) == 1000
+    route = _list_route(fastapi_app)
+
+    before, after = [], []
+    for _ in range(3):
+        start = time.perf_counter()
+        before_body = await _fastapi_response(route, entities, total_pages, total_records)
+        before.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        after_body = _single_pass_response(service, entities, total_pages, total_records)
+        after.append(time.perf_counter() - start)
+
+    assert json.loads(after_body) == json.loads(before_body)
+    logger.info(
+        f"Listing 1000 challenges with {TASKS_PER_CHALLENGE} tasks each: "
+        f"{min(before) * 1000:.1f} ms before, {min(after) * 1000:.1f} ms after"
+    )
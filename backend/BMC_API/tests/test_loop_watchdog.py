@@ -0,0 +1,102 @@
+# backend/BMC_API/tests/test_loop_watchdog.py
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from opentelemetry.sdk.trace import TracerProvider
+
+from BMC_API.src.api.routes.admin import admin_monitoring
+from BMC_API.src.core.logging.logging import current_trace_ids
+from BMC_API.src.core.loop_watchdog import LoopWatchdog
+
+pytest_plugins = ["BMC_API.tests.fixtures.admin_user_fixtures", "BMC_API.tests.fixtures.user_fixtures"]
+
+tracer = TracerProvider().get_tracer(__name__)
+
+
+def _hash_password() -> None:
+    """Stands in for a blocking call, e.g. bcrypt."""
+    time.sleep(0.15)
+
+
+async def _blocking_request() -> tuple:
+    with tracer.start_as_current_span("request"):
+        await asyncio.sleep(0)
+        _hash_password()
+        return current_trace_ids()
+
+
+async def _watch(watchdog: LoopWatchdog, *coroutines) -> list:
+    heartbeat = asyncio.create_task(watchdog.run())
+    await asyncio.sleep(0.05)
+    results = [await asyncio.create_task(coroutine) for coroutine in coroutines]
+    await asyncio.sleep(0.05)
+    heartbeat.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await heartbeat
+    return results
+
+
+@pytest.mark.anyio
+async def test_watchdog_captures_blocking_stack(caplog: pytest.LogCaptureFixture):
+    watchdog = LoopWatchdog(threshold=0.05, interval=0.01)
+
+    [(trace_id, span_id)] = await _watch(watchdog, _blocking_request())
+
+    [block] = watchdog.top()
+    assert block["location"].endswith("in _hash_password")
+    assert block["location"].startswith("BMC_API/tests/test_loop_watchdog.py:")
+    assert block["stack"][-2].endswith("in _blocking_request")
+    assert block["count"] == watchdog.blocks_detected == 1
+    assert 100 <= block["max_ms"] <= 1000
+    assert (block["trace_id"], block["span_id"]) == (trace_id, span_id)
+    assert block["task"] is not None
+    assert f"trace_id={trace_id}" in caplog.text
+    assert "in _hash_password" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_watchdog_ignores_short_callbacks():
+    watchdog = LoopWatchdog(threshold=0.2, interval=0.01)
+
+    async def short_block():
+        time.sleep(0.05)
+
+    await _watch(watchdog, short_block(), short_block())
+
+    assert watchdog.top() == []
+    assert watchdog.blocks_detected == 0
+    assert 0.04 <= watchdog.max_lag < 0.2
+
+
+@pytest.mark.anyio
+async def test_event_loop_blocks_report():
+    disabled = await admin_monitoring.event_loop_blocks_report(watchdog=None)
+    assert disabled.enabled is False
+    assert disabled.blocks == []
+
+    watchdog = LoopWatchdog(threshold=0.05, interval=0.01)
+    await _watch(watchdog, _blocking_request(), _blocking_request())
+    report = await admin_monitoring.event_loop_blocks_report(watchdog=watchdog, limit=10, order_by="total")
+
+    assert report.enabled is True
+    assert report.threshold_ms == 50
+    assert report.blocks_detected == 2
+    assert report.max_lag_ms >= 100
+    assert [block.count for block in report.blocks] == [2]
+
+
+@pytest.mark.anyio
+async def test_event_loop_blocks_endpoint(fastapi_app: FastAPI, client: AsyncClient, admin_token, user_token):
+    fastapi_app.state.loop_watchdog = LoopWatchdog(threshold=0.05)
+    url = fastapi_app.url_path_for("event_loop_blocks_report")
+
+    forbidden = await client.get(url, headers={"Authorization": f"Bearer {user_token}"})
+    response = await client.get(url, headers={"Authorization": f"Bearer {admin_token}"})
+
+    assert forbidden.status_code == status.HTTP_403_FORBIDDEN
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["enabled"] is True
+    assert response.json()["blocks"] == []
@@ -0,0 +1,192 @@
+# backend/BMC_API/tests/test_metrics.py
+import asyncio
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi_mail import FastMail
+from httpx import AsyncClient
+from jinja2 import TemplateNotFound
+from redis.asyncio import ConnectionPool
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from BMC_API.src.api.gunicorn_runner import child_exit, setup_multiprocess_metrics
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.core.metrics import metrics, monitor_event_loop_lag, scrape_registry
+from BMC_API.src.domain.entities.challenge_model import ChallengeModel
+from BMC_API.src.infrastructure.external_services.email import email_service
+from BMC_API.src.infrastructure.external_services.email.schema import EmailSchema
+from BMC_API.src.infrastructure.external_services.redis.client import InstrumentedRedis
+from BMC_API.src.infrastructure.persistence.query_log import instrument_request_query_stats
+
+pytest_plugins = ["BMC_API.tests.fixtures.admin_user_fixtures"]
+
+
+SCRAPE_TOKEN = "scrape-token"
+
+
+@pytest.fixture
+def scrape_token(monkeypatch: pytest.MonkeyPatch) -> str:
+    monkeypatch.setattr(settings, "metrics_scrape_token", SCRAPE_TOKEN)
+    return SCRAPE_TOKEN
+
+
+def _sample(name: str, **labels) -> float:
+    """Current value of a sample, 0 if it was not recorded yet."""
+    return metrics.registry.get_sample_value(name, {key: str(value) for key, value in labels.items()}) or 0.0
+
+
+@pytest.mark.anyio
+async def test_metrics_require_the_scrape_token(
+    fastapi_app: FastAPI, client: AsyncClient, admin_token, monkeypatch: pytest.MonkeyPatch
+):
+    url = fastapi_app.url_path_for("prometheus_metrics")
+
+    not_configured = await client.get(url, headers={"Authorization": f"Bearer {SCRAPE_TOKEN}"})
+    monkeypatch.setattr(settings, "metrics_scrape_token", SCRAPE_TOKEN)
+    anonymous = await client.get(url)
+    admin = await client.get(url, headers={"Authorization": f"Bearer {admin_token}"})
+    scraper = await client.get(url, headers={"Authorization": f"Bearer {SCRAPE_TOKEN}"})
+    open_metrics = await client.get(
+        url, headers={"Authorization": f"Bearer {SCRAPE_TOKEN}", "Accept": "application/openmetrics-text"}
+    )
+
+    assert not_configured.status_code == status.HTTP_404_NOT_FOUND
+    assert anonymous.status_code == status.HTTP_401_UNAUTHORIZED
+    assert anonymous.headers["WWW-Authenticate"] == "Bearer"
+    assert admin.status_code == status.HTTP_401_UNAUTHORIZED
+    assert scraper.status_code == status.HTTP_200_OK
+    assert scraper.headers["Content-Type"].startswith("text/plain; version=")
+    assert "# TYPE bmc_http_request_duration_seconds histogram" in scraper.text
+    assert open_metrics.headers["Content-Type"].startswith("application/openmetrics-text")
+    assert open_metrics.text.endswith("# EOF\n")
+    # Scrapes are rate limited like every other request
+    assert "prometheus_metrics" not in settings.rate_limit_route_costs
+
+
+@pytest.mark.anyio
+async def test_request_metrics(
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+    admin_token,
+    scrape_token: str,
+    dbsession: AsyncSession,
+    _engine: AsyncEngine,
+):
+    instrument_request_query_stats(_engine)
+    dbsession.add_all(
+        ChallengeModel(challenge_name=f"Challenge {i}", challenge_created_time=datetime.now()) for i in range(3)
+    )
+    await dbsession.commit()
+    listing_url = fastapi_app.url_path_for("list_challenges_route_admin")
+    health_requests = _sample(
+        "bmc_http_request_duration_seconds_count", method="GET", route="/api/v2/health", status=200
+    )
+    unmatched_requests = _sample("bmc_http_request_duration_seconds_count", method="GET", route="unmatched", status=404)
+    health_queries = _sample("bmc_db_queries_per_request_sum", route="/api/v2/health")
+
+    await client.get(fastapi_app.url_path_for("health_check"))
+    await client.get(fastapi_app.url_path_for("health_check"))
+    await client.get("/api/v2/not/a/route")
+    listing = await client.post(listing_url, headers={"Authorization": f"Bearer {admin_token}"})
+    response = await client.get(
+        fastapi_app.url_path_for("prometheus_metrics"), headers={"Authorization": f"Bearer {scrape_token}"}
+    )
+
+    assert listing.status_code == status.HTTP_200_OK
+    assert response.status_code == status.HTTP_200_OK
+    assert _sample("bmc_http_request_duration_seconds_count", method="GET", route="/api/v2/health", status=200) == (
+        health_requests + 2
+    )
+    assert _sample("bmc_http_request_duration_seconds_count", method="GET", route="unmatched", status=404) == (
+        unmatched_requests + 1
+    )
+    # The listing authenticates the admin and counts and loads the challenges
+    assert _sample("bmc_db_queries_per_request_sum", route=listing_url) >= 3
+    assert _sample("bmc_db_query_duration_per_request_seconds_sum", route=listing_url) > 0
+    assert _sample("bmc_db_queries_per_request_sum", route="/api/v2/health") == health_queries
+    # The metrics request itself was in flight
+    assert "\nbmc_http_requests_in_flight 1.0\n" in response.text
+    assert _sample("bmc_http_requests_in_flight") == 0
+
+
+@pytest.mark.anyio
+async def test_email_outcomes(monkeypatch: pytest.MonkeyPatch, fast_mail_mock: FastMail):
+    monkeypatch.setattr(email_service, "get_fast_mail", lambda config: fast_mail_mock)
+    email = EmailSchema(subject="Subject", recipients=["user@email.com"], template_body={"name": "User"})
+    sent = _sample("bmc_emails_total", template="email_confirmation.html", outcome="sent")
+    not_found = _sample("bmc_emails_total", template="missing.html", outcome="template_not_found")
+
+    await email_service.email_sender(email, "email_confirmation.html")
+    with pytest.raises(TemplateNotFound):
+        await email_service.email_sender(email, "missing.html")
+
+    assert _sample("bmc_emails_total", template="email_confirmation.html", outcome="sent") == sent + 1
+    assert _sample("bmc_emails_total", template="missing.html", outcome="template_not_found") == not_found + 1
+
+
+@pytest.mark.anyio
+async def test_redis_command_duration(fake_redis_pool: ConnectionPool):
+    redis = InstrumentedRedis(connection_pool=fake_redis_pool)
+    sets = _sample("bmc_redis_command_duration_seconds_count", command="SET")
+    gets = _sample("bmc_redis_command_duration_seconds_count", command="GET")
+
+    await redis.set("key", "value")
+    await redis.get("key")
+    await redis.get("key")
+
+    assert _sample("bmc_redis_command_duration_seconds_count", command="SET") == sets + 1
+    assert _sample("bmc_redis_command_duration_seconds_count", command="GET") == gets + 2
+    await redis.close()
+
+
+@pytest.mark.anyio
+async def test_event_loop_lag():
+    samples = _sample("bmc_event_loop_lag_seconds_count")
+    lag = _sample("bmc_event_loop_lag_seconds_sum")
+    monitor = asyncio.create_task(monitor_event_loop_lag(0.01))
+    await asyncio.sleep(0.02)
+    time.sleep(0.1)  # Blocks the event loop
+    await asyncio.sleep(0.02)
+    monitor.cancel()
+
+    assert _sample("bmc_event_loop_lag_seconds_count") >= samples + 2
+    assert _sample("bmc_event_loop_lag_seconds_sum") >= lag + 0.08
+
+
+WORKER_SCRIPT = """
+import os
+from BMC_API.src.core.metrics import metrics
+metrics.http_requests_in_flight.inc()
+metrics.http_request_duration.labels("GET", "/challenges", 200).observe(0.5)
+print(os.getpid())
+"""
+
+
+def test_metrics_of_all_workers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    (tmp_path / "counter_1.db").write_bytes(b"")  # Left over by a previous run
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    setup_multiprocess_metrics(str(tmp_path / "unused"))
+    assert not (tmp_path / "counter_1.db").exists()
+
+    pids = [
+        int(subprocess.run([sys.executable, "-c", WORKER_SCRIPT], check=True, capture_output=True, text=True).stdout)
+        for _ in range(2)
+    ]
+    registry = scrape_registry()
+    labels = {"method": "GET", "route": "/challenges", "status": "200"}
+
+    assert registry is not metrics.registry
+    assert registry.get_sample_value("bmc_http_request_duration_seconds_count", labels) == 2
+    assert registry.get_sample_value("bmc_http_requests_in_flight") == 2
+
+    # The requests in flight of exited workers are dropped, their request durations are kept
+    child_exit(None, SimpleNamespace(pid=pids[0]))
+    registry = scrape_registry()
+    assert registry.get_sample_value("bmc_http_request_duration_seconds_count", labels) == 2
+    assert registry.get_sample_value("bmc_http_requests_in_flight") == 1
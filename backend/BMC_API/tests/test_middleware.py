@@ -0,0 +1,142 @@
+# backend/BMC_API/tests/test_middleware.py
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from loguru import logger
+from slowapi import Limiter
+from slowapi.middleware import SlowAPIMiddleware
+from slowapi.util import get_remote_address
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import State
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from BMC_API.src.api.middleware.cache_control_middleware import NO_STORE_HEADERS, CacheControlMiddleware
+from BMC_API.src.api.middleware.rate_limit_middleware import RateLimitMiddleware
+from BMC_API.src.core.rate_limit import RateLimit, RateLimiter
+from BMC_API.src.domain.entities.challenge_model import ChallengeModel
+from BMC_API.src.infrastructure.rate_limit.backends import InMemoryRateLimitBackend
+
+pytest_plugins = ["BMC_API.tests.fixtures.admin_user_fixtures"]
+
+CHUNKS = [f"chunk {i}\n".encode() for i in range(10)]
+
+
+class _BaseHTTPCacheControlMiddleware(BaseHTTPMiddleware):
+    """The former cache control middleware, based on BaseHTTPMiddleware."""
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        if "Cache-Control" not in response.headers:
+            response.headers.update(NO_STORE_HEADERS)
+        return response
+
+
+def _stream_route(app: FastAPI) -> str:
+    async def stream():
+        async def chunks():
+            for chunk in CHUNKS:
+                yield chunk
+
+        return StreamingResponse(chunks(), media_type="application/zip")
+
+    app.add_api_route("/test_stream", stream)
+    return "/test_stream"
+
+
+@pytest.mark.anyio
+async def test_rate_limit(fastapi_app: FastAPI, client: AsyncClient):
+    fastapi_app.state.limiter = RateLimiter(RateLimit.parse("2/minute"), InMemoryRateLimitBackend())
+    url = fastapi_app.url_path_for("health_check")
+
+    responses = [await client.get(url) for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, status.HTTP_429_TOO_MANY_REQUESTS]
+    assert responses[0].headers["X-RateLimit-Limit"] == "2"
+    assert responses[1].headers["X-RateLimit-Remaining"] == "0"
+    assert responses[2].json() == {"error": "Rate limit exceeded."}
+    assert responses[2].headers["Retry-After"] == "30"
+
+
+@pytest.mark.anyio
+async def test_streamed_response_passes_middleware(fastapi_app: FastAPI, client: AsyncClient):
+    fastapi_app.state.limiter = RateLimiter(RateLimit.parse("10/minute"), InMemoryRateLimitBackend())
+    url = _stream_route(fastapi_app)
+
+    response = await client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == b"".join(CHUNKS)
+    assert response.headers["X-RateLimit-Limit"] == "10"
+    assert "Content-Encoding" not in response.headers
+
+
+@pytest.mark.anyio
+async def test_cache_control_middleware_marks_auth_paths_only():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    middleware = CacheControlMiddleware(app, no_store_paths=("/api/v2/user/token",))
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        token = await client.post("/api/v2/user/token")
+        other = await client.get("/api/v2/challenge/1")
+
+    assert token.headers["Cache-Control"] == NO_STORE_HEADERS["Cache-Control"]
+    assert token.headers["Pragma"] == "no-cache"
+    assert "Cache-Control" not in other.headers
+
+
+async def _requests_per_second(app: FastAPI, method: str, url: str, headers: dict, count: int) -> float:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.request(method, url, headers=headers)
+        start = time.perf_counter()
+        for _ in range(count):
+            response = await client.request(method, url, headers=headers)
+            assert response.status_code == status.HTTP_200_OK
+        return count / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+@pytest.mark.anyio
+async def test_benchmark_middleware_throughput(fastapi_app: FastAPI, admin_token, dbsession: AsyncSession):
+    dbsession.add_all(
+        ChallengeModel(challenge_name=f"Challenge {i}", challenge_created_time=datetime.now()) for i in range(20)
+    )
+    await dbsession.commit()
+
+    # The same application with the former BaseHTTPMiddleware based stack
+    before_app = FastAPI()
+    before_app.router = fastapi_app.router
+    before_app.state = State(dict(fastapi_app.state._state))
+    before_app.exception_handlers = fastapi_app.exception_handlers
+    before_app.dependency_overrides = fastapi_app.dependency_overrides
+    before_app.user_middleware = [
+        Middleware(SlowAPIMiddleware) if middleware.cls is RateLimitMiddleware else middleware
+        for middleware in fastapi_app.user_middleware
+        if middleware.cls is not CacheControlMiddleware
+    ] + [Middleware(_BaseHTTPCacheControlMiddleware)]
+    before_app.state.limiter = Limiter(key_func=get_remote_address, default_limits=["100000/minute"])
+    fastapi_app.state.limiter = RateLimiter(RateLimit.parse("100000/minute"), InMemoryRateLimitBackend())
+
+    endpoints = (
+        ("health check", "GET", fastapi_app.url_path_for("health_check"), {}, 200),
+        (
+            "challenge listing",
+            "POST",
+            fastapi_app.url_path_for("list_challenges_route_admin"),
+            {"Authorization": f"Bearer {admin_token}"},
+            30,
+        ),
+    )
+    # The listing is dominated by the database and serialization, the middleware overhead shows on cheap requests
+    for name, method, url, headers, count in endpoints:
+        before, after = [], []
+        for _ in range(3):
+            before.append(await _requests_per_second(before_app, method, url, headers, count))
+            after.append(await _requests_per_second(fastapi_app, method, url, headers, count))
+        logger.info(f"Throughput of {name}: {max(before):.0f} requests/s before, {max(after):.0f} requests/s after")
@@ -0,0 +1,132 @@
+# backend/BMC_API/tests/test_profiler.py
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from BMC_API.src.core.profiler import AWAIT_FRAME, SPEEDSCOPE_SCHEMA, ProfilerBusyError, SamplingProfiler
+from BMC_API.src.domain.entities.challenge_model import ChallengeModel
+
+pytest_plugins = ["BMC_API.tests.fixtures.admin_user_fixtures", "BMC_API.tests.fixtures.user_fixtures"]
+
+
+def _render_pdf(seconds: float) -> None:
+    """Stands in for CPU bound work on the event loop, e.g. rendering a PDF."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def _handle_request() -> None:
+    _render_pdf(0.05)
+    await asyncio.sleep(0.05)
+
+
+@pytest.mark.anyio
+async def test_worker_profile():
+    profiler = SamplingProfiler(interval=0.002, max_duration=5)
+
+    with profiler.session("worker") as profile:
+        assert profiler.busy
+        with pytest.raises(ProfilerBusyError):
+            with profiler.session("another"):
+                pass
+        await asyncio.sleep(0.05)
+        _render_pdf(0.1)
+
+    assert not profiler.busy
+    assert profile.sample_count >= 10
+    assert profile.idle_count >= 5  # The loop waited in the selector during the sleep
+    collapsed = profile.collapsed()
+    assert "test_worker_profile (BMC_API/tests/test_profiler.py:" in collapsed
+    assert ";_render_pdf (BMC_API/tests/test_profiler.py:" in collapsed
+    assert "selectors.py" not in collapsed
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in collapsed.splitlines()) == profile.sample_count
+
+
+@pytest.mark.anyio
+async def test_task_profile():
+    profiler = SamplingProfiler(interval=0.002, max_duration=5)
+    task = asyncio.create_task(_handle_request())
+
+    with profiler.session("request", task=task) as profile:
+        await task
+
+    stacks = [labels for labels, _ in profile.stacks()]
+    # Stacks start at the coroutine of the task, while it waits they end with its awaits
+    assert all(labels[0].startswith("_handle_request ") for labels in stacks)
+    assert any(labels[-1].startswith("_render_pdf ") for labels in stacks)
+    assert any(labels[-1] == AWAIT_FRAME and labels[-2].startswith("sleep ") for labels in stacks)
+
+
+@pytest.mark.anyio
+async def test_speedscope_format():
+    profiler = SamplingProfiler(interval=0.002, max_duration=5)
+    with profiler.session("worker", threads="all") as profile:
+        await asyncio.to_thread(_render_pdf, 0.05)
+
+    speedscope = profile.speedscope()
+    [sampled] = speedscope["profiles"]
+    frames = speedscope["shared"]["frames"]
+    assert speedscope["$schema"] == SPEEDSCOPE_SCHEMA
+    assert sampled["type"] == "sampled"
+    assert len(sampled["samples"]) == len(sampled["weights"])
+    assert all(0 <= index < len(frames) for sample in sampled["samples"] for index in sample)
+    assert sampled["endValue"] == pytest.approx(profile.sample_count * 2, abs=0.01)
+    # Samples of all threads start with the name of their thread
+    assert any(frames[sample[0]]["name"].startswith("thread asyncio") for sample in sampled["samples"])
+    assert {
+        "name": "_render_pdf",
+        "file": "BMC_API/tests/test_profiler.py",
+        "line": _render_pdf.__code__.co_firstlineno,
+    } in frames
+
+
+@pytest.mark.anyio
+async def test_profile_endpoint(fastapi_app: FastAPI, client: AsyncClient, admin_token, user_token):
+    url = fastapi_app.url_path_for("profile_worker")
+    params = {"duration": 0.05, "format": "collapsed", "include_idle": True}
+
+    forbidden = await client.post(url, params=params, headers={"Authorization": f"Bearer {user_token}"})
+    response = await client.post(url, params=params, headers={"Authorization": f"Bearer {admin_token}"})
+    fastapi_app.state.profiler = None
+    disabled = await client.post(url, params=params, headers={"Authorization": f"Bearer {admin_token}"})
+
+    assert forbidden.status_code == status.HTTP_403_FORBIDDEN
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Disposition"].endswith('.collapsed.txt"')
+    assert "profile_worker (BMC_API/src/api/routes/admin/admin_monitoring.py:" not in response.text
+    assert "select (" in response.text  # The loop was idle while the endpoint slept
+    assert disabled.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_profile_request(fastapi_app: FastAPI, client: AsyncClient, admin_token, dbsession: AsyncSession):
+    dbsession.add(ChallengeModel(challenge_name="Challenge", challenge_created_time=datetime.now()))
+    await dbsession.commit()
+    token_response = await client.post(
+        fastapi_app.url_path_for("create_profile_token"), headers={"Authorization": f"Bearer {admin_token}"}
+    )
+    profile_token = token_response.json()["profile_token"]
+    url = fastapi_app.url_path_for("list_challenges_route_admin")
+    authorization = {"Authorization": f"Bearer {admin_token}"}
+
+    profiled = await client.post(url, headers={**authorization, "X-Profile": profile_token})
+    collapsed = await client.post(
+        url, headers={**authorization, "X-Profile": profile_token, "X-Profile-Format": "collapsed"}
+    )
+    # Access tokens are no profile tokens, the request is handled as usual
+    unprofiled = await client.post(url, headers={**authorization, "X-Profile": admin_token})
+
+    assert token_response.json()["expires_in"] == 600
+    assert profiled.status_code == status.HTTP_200_OK
+    assert profiled.headers["X-Profiled-Status"] == "200"
+    assert profiled.json()["profiles"][0]["name"] == f"POST {url}"
+    assert "ProfilingMiddleware.__call__ (BMC_API/src/api/middleware/profiling_middleware.py:" in collapsed.text
+    assert unprofiled.status_code == status.HTTP_200_OK
+    assert "X-Profiled-Status" not in unprofiled.headers
+    assert "profiles" not in unprofiled.json()
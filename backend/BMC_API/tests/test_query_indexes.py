@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from BMC_API.src.domain.entities.challenge_history_model import ChallengeHistoryModel
+from BMC_API.src.domain.entities.challenge_model import ChallengeModel
+from BMC_API.src.domain.entities.task_history_model import TaskHistoryModel
+from BMC_API.src.domain.entities.task_model import TaskModel
+from BMC_API.src.infrastructure.persistence.dao.base_dao import QueryHelper
+
+
+async def _query_plan(session: AsyncSession, model, search_filters: dict, sort_by: str, sort_desc: bool) -> str:
+    """Plan of the paginated statement that `BaseDAO.list` executes, taken from the statement cache."""
+    query, _, params = QueryHelper(model).build_list_statements(search_filters, None, sort_by, sort_desc, True)
+    compiled = query.compile(session.bind)
+    values = compiled.construct_params({**params, "offset": 0, "limit": 10})
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {compiled}", tuple(values[name] for name in compiled.positiontup)
+    )
+    return "\n".join(row[-1] for row in result.all())
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "model, search_filters, sort_by, sort_desc, index_name",
+    [
+        (
+            ChallengeHistoryModel,
+            {"challenge_id": 1},
+            "timestamp",
+            True,
+            "ix_challenge_histories_challenge_id_timestamp",
+        ),
+        (TaskHistoryModel, {"task_id": 1}, "timestamp", True, "ix_task_histories_task_id_timestamp"),
+        (
+            ChallengeModel,
+            {"challenge_owner_id": 1},
+            "challenge_created_time",
+            True,
+            "ix_challenges_owner_id_created_time",
+        ),
+        (ChallengeModel, {"challenge_conference_id": 1}, "id", False, "ix_challenges_conference_id_status"),
+        (ChallengeModel, {"challenge_status": "DRAFT"}, "id", False, "ix_challenges_status"),
+        (TaskModel, {"task_owner_id": 1}, "id", False, "ix_tasks_task_owner_id"),
+        (TaskModel, {"task_challenge_id": 1}, "id", False, "ix_tasks_task_challenge_id"),
+    ],
+)
+async def test_hot_queries_use_index(
+    dbsession: AsyncSession, model, search_filters: dict, sort_by: str, sort_desc: bool, index_name: str
+):
+    plan = await _query_plan(dbsession, model, search_filters, sort_by, sort_desc)
+
+    assert index_name in plan
+
+
+@pytest.mark.anyio
+async def test_history_lookup_needs_no_temp_sort(dbsession: AsyncSession):
+    plan = await _query_plan(dbsession, ChallengeHistoryModel, {"challenge_id": 1}, "timestamp", True)
+
+    assert "USE TEMP B-TREE" not in plan
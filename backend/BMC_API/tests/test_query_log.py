@@ -0,0 +1,92 @@
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from BMC_API.src.infrastructure.persistence.query_log import (
+    QueryLog,
+    instrument_engine,
+    normalize_sql,
+)
+
+
+def test_normalize_sql_groups_literals_and_parameter_lists():
+    assert normalize_sql("SELECT *\n  FROM tasks WHERE id IN (?, ?, ?) AND name = 'x' LIMIT 10") == (
+        "SELECT * FROM tasks WHERE id IN (?, ...) AND name = ? LIMIT ?"
+    )
+    assert normalize_sql("SELECT anon_1.id FROM t AS anon_1") == "SELECT anon_1.id FROM t AS anon_1"
+
+
+async def _instrumented_engine(query_log: QueryLog):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine, query_log)
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        await connection.execute(text("INSERT INTO items (name) VALUES ('a'), ('b'), ('c')"))
+    return engine
+
+
+@pytest.mark.anyio
+async def test_records_duration_rows_and_plan_of_slow_queries():
+    query_log = QueryLog(size=100, slow_threshold_ms=0)
+    engine = await _instrumented_engine(query_log)
+    async with engine.connect() as connection:
+        for name in ("a", "b"):
+            await connection.execute(text("SELECT * FROM items WHERE name != :name"), {"name": name})
+    await engine.dispose()
+
+    top = {query["sql"]: query for query in query_log.top(limit=10)}
+    select_query = top["SELECT * FROM items WHERE name != ?"]
+    assert select_query["count"] == 2
+    assert select_query["slow_count"] == 2
+    assert select_query["avg_rows"] is None  # SQLite does not report the row count of SELECT statements
+    assert any("SCAN items" in line for line in select_query["plan"])
+    assert top["INSERT INTO items (name) VALUES (?), (?), (?)"]["avg_rows"] == 3
+    # EXPLAIN statements themselves are not recorded
+    assert not any(sql.startswith("EXPLAIN") for sql in top)
+
+
+@pytest.mark.anyio
+async def test_fast_queries_have_no_plan_and_buffer_is_bounded():
+    query_log = QueryLog(size=3, slow_threshold_ms=10_000)
+    engine = await _instrumented_engine(query_log)
+    async with engine.connect() as connection:
+        for _ in range(5):
+            await connection.execute(text("SELECT id FROM items"))
+    await engine.dispose()
+
+    (query,) = query_log.top()
+    assert query["count"] == 3
+    assert query["slow_count"] == 0
+    assert query["plan"] is None
+    assert query_log.recorded == 7
+
+
+@pytest.mark.anyio
+async def test_failed_statements_are_not_recorded():
+    query_log = QueryLog(size=10, slow_threshold_ms=10_000)
+    engine = await _instrumented_engine(query_log)
+    async with engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            await connection.execute(text("SELECT * FROM missing_table"))
+        await connection.execute(text("SELECT id FROM items"))
+    await engine.dispose()
+
+    recorded = [query["sql"] for query in query_log.top()]
+    assert "SELECT * FROM missing_table" not in recorded
+    assert "SELECT id FROM items" in recorded
+
+
+@pytest.mark.anyio
+async def test_queries_are_correlated_with_the_current_trace():
+    query_log = QueryLog(size=10, slow_threshold_ms=10_000)
+    engine = await _instrumented_engine(query_log)
+    tracer = TracerProvider().get_tracer(__name__)
+    with tracer.start_as_current_span("request") as span:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT id FROM items"))
+    await engine.dispose()
+
+    query = next(query for query in query_log.top() if query["sql"] == "SELECT id FROM items")
+    assert query["slowest_trace_id"] == format(span.get_span_context().trace_id, "032x")
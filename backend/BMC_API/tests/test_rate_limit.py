@@ -0,0 +1,135 @@
+# backend/BMC_API/tests/test_rate_limit.py
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from jose import jwt
+from redis.asyncio import Redis
+
+from BMC_API.src.api.middleware.rate_limit_middleware import rate_limit_key
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.core.rate_limit import RateLimit, RateLimiter, take_tokens
+from BMC_API.src.infrastructure.rate_limit.backends import InMemoryRateLimitBackend, RedisRateLimitBackend
+
+
+def _token(email: str, expires_in: timedelta = timedelta(minutes=5)) -> str:
+    claims = {"sub": email, "type": "access", "exp": datetime.now() + expires_in}
+    return jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def _scope(authorization: str | None = None, client: str = "10.0.0.1") -> dict:
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return {"type": "http", "headers": headers, "client": (client, 50000)}
+
+
+def test_parse_rate_limit():
+    assert (RateLimit.parse("4/second").amount, RateLimit.parse("4/second").period) == (4, 1)
+    assert RateLimit.parse("100 per minute").rate == pytest.approx(100 / 60)
+    assert RateLimit.parse("1000/5 minutes").period == 300
+    with pytest.raises(ValueError):
+        RateLimit.parse("4 per fortnight")
+
+
+def test_take_tokens():
+    limit = RateLimit(10, 1)
+
+    assert take_tokens(10, 0, limit, 4) == (True, 6)
+    assert take_tokens(2, 0, limit, 4) == (False, 2)
+    # Refilled at 10 tokens per second, up to the amount of the limit
+    assert take_tokens(2, 0.2, limit, 4) == (True, 0)
+    assert take_tokens(2, 60, limit, 1) == (True, 9)
+
+
+def test_rate_limit_key():
+    assert rate_limit_key(_scope()) == "ip:10.0.0.1"
+    assert rate_limit_key(_scope(f"Bearer {_token('user@email.com')}")) == "user:user@email.com"
+    # Invalid and expired tokens are limited by address
+    assert rate_limit_key(_scope("Bearer invalid")) == "ip:10.0.0.1"
+    assert rate_limit_key(_scope(f"Bearer {_token('user@email.com', timedelta(minutes=-5))}")) == "ip:10.0.0.1"
+
+
+@pytest.mark.anyio
+async def test_in_memory_backend_evicts_least_recently_used_buckets():
+    backend = InMemoryRateLimitBackend(max_entries=2)
+    limit = RateLimit(2, 60)
+
+    await backend.acquire("a", limit, 2)
+    await backend.acquire("b", limit)
+    await backend.acquire("a", limit)
+    await backend.acquire("c", limit)
+
+    assert len(backend) == 2
+    assert not (await backend.acquire("a", limit)).allowed
+    # "b" was evicted, its bucket starts full again
+    assert (await backend.acquire("b", limit)).remaining == 1
+
+
+@pytest.mark.anyio
+async def test_route_costs_and_user_buckets(fastapi_app: FastAPI, client: AsyncClient):
+    fastapi_app.state.limiter = RateLimiter(
+        RateLimit.parse("3/minute"),
+        InMemoryRateLimitBackend(),
+        route_costs={"health_check": 2, "redis_health": 0},
+    )
+    url = fastapi_app.url_path_for("health_check")
+
+    first = await client.get(url)
+    second = await client.get(url)
+    # Another user, and routes with a cost of 0, are not limited by the exhausted bucket
+    other_user = await client.get(url, headers={"Authorization": f"Bearer {_token('other@email.com')}"})
+    exempt = await client.get(fastapi_app.url_path_for("redis_health"))
+
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["X-RateLimit-Remaining"] == "1"
+    assert second.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert second.headers["Retry-After"] == "20"
+    assert other_user.status_code == status.HTTP_200_OK
+    assert exempt.status_code != status.HTTP_429_TOO_MANY_REQUESTS
+    assert "X-RateLimit-Limit" not in exempt.headers
+
+
+@pytest.mark.anyio
+async def test_costs_are_capped_to_the_limit():
+    limiter = RateLimiter(RateLimit(5, 1), InMemoryRateLimitBackend(), route_costs={"download": 20})
+
+    assert limiter.cost("download") == 5
+    assert limiter.cost("other") == 1
+    assert (await limiter.acquire("ip:10.0.0.1", limiter.cost("download"))).allowed
+
+
+@pytest.mark.anyio
+async def test_redis_backend_shares_buckets_between_workers(fake_redis: Redis):
+    pytest.importorskip("lupa")  # Lua scripts of the fake redis server
+    fallback = InMemoryRateLimitBackend()
+    workers = [RedisRateLimitBackend(fake_redis, fallback), RedisRateLimitBackend(fake_redis, fallback)]
+    limit = RateLimit(5, 60)
+
+    results = [await workers[i % 2].acquire("user:user@email.com", limit, 2) for i in range(3)]
+
+    assert [result.allowed for result in results] == [True, True, False]
+    assert results[1].remaining == pytest.approx(1, abs=0.01)
+    assert results[2].retry_after == pytest.approx(12, abs=0.2)
+    assert 0 < await fake_redis.pttl("ratelimit:user:user@email.com") <= 60000
+    assert workers[0].fallback_count == workers[1].fallback_count == 0
+    assert len(fallback) == 0
+
+
+@pytest.mark.anyio
+async def test_redis_backend_falls_back_to_memory():
+    unreachable = Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.05)
+    fallback = InMemoryRateLimitBackend()
+    backend = RedisRateLimitBackend(unreachable, fallback, retry_after=60)
+    limit = RateLimit(2, 60)
+
+    start = time.perf_counter()
+    results = [await backend.acquire("ip:10.0.0.1", limit) for _ in range(3)]
+    elapsed = time.perf_counter() - start
+
+    assert [result.allowed for result in results] == [True, True, False]
+    assert backend.fallback_count == 3
+    assert not backend.available
+    # Redis is only tried by the first request until the retry interval passed
+    assert elapsed < 1
+    await unreachable.close()
@@ -0,0 +1,159 @@
+# backend/BMC_API/tests/test_repository_cache.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from BMC_API.src.domain.entities.challenge_model import ChallengeModel
+from BMC_API.src.domain.entities.task_model import TaskModel
+from BMC_API.src.domain.entities.user_model import UserModel
+from BMC_API.src.infrastructure.cache.backends import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+)
+from BMC_API.src.infrastructure.cache.tagged_cache import TaggedCache
+from BMC_API.src.infrastructure.persistence.dao.challenge_dao import (
+    SQLAlchemyChallengeRepository,
+)
+from BMC_API.src.infrastructure.persistence.dao.task_dao import SQLAlchemyTaskRepository
+from BMC_API.src.infrastructure.persistence.dao.user_dao import SQLAlchemyUserRepository
+
+
+@pytest.fixture(params=["memory", "redis"])
+def tagged_cache(request, fake_redis):
+    if request.param == "memory":
+        return TaggedCache(InMemoryCacheBackend(max_entries=100))
+    return TaggedCache(RedisCacheBackend(fake_redis))
+
+
+@pytest.mark.anyio
+async def test_tag_invalidation(tagged_cache: TaggedCache):
+    versions = await tagged_cache.tag_versions(["a", "b"])
+    await tagged_cache.set("key", {"value": 1}, versions)
+    assert await tagged_cache.get("key") == (True, {"value": 1})
+
+    await tagged_cache.invalidate("b")
+    assert await tagged_cache.get("key") == (False, None)
+    assert tagged_cache.stats()["hits"] == 1
+    assert tagged_cache.stats()["misses"] == 1
+    assert tagged_cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.anyio
+async def test_in_memory_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2)
+    await backend.set("a", b"1")
+    await backend.set("b", b"2")
+    await backend.get("a")
+    await backend.set("c", b"3", expire=timedelta(minutes=1))
+
+    assert await backend.get_many(["a", "b", "c"]) == [b"1", None, b"3"]
+    assert backend.evictions == 1
+
+
+@pytest.mark.anyio
+async def test_cached_dao_get_and_cascading_invalidation(dbsession: AsyncSession, tagged_cache: TaggedCache):
+    challenge_repository = SQLAlchemyChallengeRepository(dbsession, cache=tagged_cache)
+    task_repository = SQLAlchemyTaskRepository(dbsession, cache=tagged_cache)
+    challenge = await challenge_repository.create_obj(
+        ChallengeModel(challenge_name="Cached", challenge_created_time=datetime.now())
+    )
+
+    assert (await challenge_repository.get(challenge.id)).challenge_name == "Cached"
+    assert (await challenge_repository.get(challenge.id)).challenge_name == "Cached"
+    assert (tagged_cache.hits, tagged_cache.misses) == (1, 1)
+
+    # A task write drops the cached parent challenge, which embeds its tasks
+    await task_repository.create_obj(
+        TaskModel(task_name="Task", task_created_time=datetime.now(), task_challenge_id=challenge.id)
+    )
+    dbsession.expunge_all()
+    cached = await challenge_repository.get(challenge.id)
+    assert tagged_cache.misses == 2
+    assert [task.task_name for task in cached.challenge_tasks] == ["Task"]
+
+
+@pytest.mark.anyio
+async def test_cached_dao_list_is_keyed_by_params(dbsession: AsyncSession, tagged_cache: TaggedCache):
+    repository = SQLAlchemyChallengeRepository(dbsession, cache=tagged_cache)
+    challenge = await repository.create_obj(
+        ChallengeModel(challenge_name="First", challenge_created_time=datetime.now())
+    )
+
+    await repository.list(search_filters={"challenge_name": "First"})
+    rows, _, total_records = await repository.list(search_filters={"challenge_name": "First"})
+    await repository.list(search_filters={"challenge_name": "Other"}, output_filters=["challenge_name"])
+    assert (tagged_cache.hits, tagged_cache.misses) == (1, 2)
+    assert total_records == 1
+    assert rows[0] in dbsession
+
+    await repository.update(challenge.id, {"challenge_name": "Renamed"})
+    rows, _, _ = await repository.list(search_filters={"challenge_name": "First"})
+    assert rows == []
+    assert tagged_cache.misses == 3
+
+
+@pytest.mark.anyio
+async def test_owner_writes_invalidate_cached_entities(dbsession: AsyncSession, tagged_cache: TaggedCache):
+    user_repository = SQLAlchemyUserRepository(dbsession, cache=tagged_cache)
+    challenge_repository = SQLAlchemyChallengeRepository(dbsession, cache=tagged_cache)
+    task_owner = await user_repository.create_obj(
+        UserModel(email="task.owner@example.com", password="hash", created_time=datetime.now())
+    )
+    challenge = await challenge_repository.create_obj(
+        ChallengeModel(challenge_name="Owned", challenge_created_time=datetime.now())
+    )
+    await SQLAlchemyTaskRepository(dbsession, cache=tagged_cache).create_obj(
+        TaskModel(
+            task_name="Task",
+            task_created_time=datetime.now(),
+            task_challenge_id=challenge.id,
+            task_owner_id=task_owner.id,
+        )
+    )
+    dbsession.expunge_all()
+    await challenge_repository.get(challenge.id)
+    await challenge_repository.list()
+    assert (await challenge_repository.get(challenge.id)).challenge_tasks[0].task_owner.disabled is False
+    assert tagged_cache.hits == 1
+
+    # The owner of a task of the challenge is embedded in the cached challenge and the cached list
+    await user_repository.update(task_owner.id, {"disabled": True})
+    dbsession.expunge_all()
+    cached = await challenge_repository.get(challenge.id)
+    rows, _, _ = await challenge_repository.list()
+    assert tagged_cache.hits == 1
+    assert cached.challenge_tasks[0].task_owner.disabled is True
+    assert rows[0].challenge_tasks[0].task_owner.disabled is True
+
+
+@pytest.mark.anyio
+async def test_owner_write_while_loading_is_not_cached(
+    dbsession: AsyncSession, tagged_cache: TaggedCache, monkeypatch: pytest.MonkeyPatch
+):
+    user_repository = SQLAlchemyUserRepository(dbsession, cache=tagged_cache)
+    challenge_repository = SQLAlchemyChallengeRepository(dbsession, cache=tagged_cache)
+    owner = await user_repository.create_obj(
+        UserModel(email="owner@example.com", password="hash", created_time=datetime.now())
+    )
+    challenge = await challenge_repository.create_obj(
+        ChallengeModel(challenge_name="Owned", challenge_created_time=datetime.now(), challenge_owner_id=owner.id)
+    )
+    dbsession.expunge_all()
+    tag_versions = tagged_cache.tag_versions
+
+    async def owner_write_after_loading(tags):
+        tags = list(tags)
+        if f"UserModel:{owner.id}" in tags:
+            # The owner write committed while the challenge was loaded, its invalidation lands before the
+            # versions of the owner tag are read
+            monkeypatch.setattr(tagged_cache, "tag_versions", tag_versions)
+            await user_repository.update(owner.id, {"disabled": True})
+        return await tag_versions(tags)
+
+    for load in (lambda: challenge_repository.get(challenge.id), challenge_repository.list):
+        monkeypatch.setattr(tagged_cache, "tag_versions", owner_write_after_loading)
+        await load()
+        dbsession.expunge_all()
+        await load()
+    assert tagged_cache.hits == 0
@@ -0,0 +1,80 @@
+# backend/BMC_API/tests/test_response_cache.py
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic_core import to_json
+
+from BMC_API.src.application.dto.challenge_dto import ChallengeModelBaseOutputDTO
+from BMC_API.src.application.dto.task_dto import TaskModelBaseOutputDTO
+from BMC_API.src.application.interfaces.read_through_cache import ReadThroughCache
+from BMC_API.src.core.etag import compute_etag, entity_etag, etag_matches
+from BMC_API.src.infrastructure.cache.backends import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache_backend(request, fake_redis):
+    if request.param == "memory":
+        return InMemoryCacheBackend()
+    return RedisCacheBackend(fake_redis)
+
+
+@pytest.mark.anyio
+async def test_backend_set_get_delete(cache_backend):
+    await cache_backend.set("a", b"1", expire=timedelta(minutes=1))
+    assert await cache_backend.get("a") == b"1"
+    await cache_backend.delete("a", "missing")
+    assert await cache_backend.get("a") is None
+
+
+@pytest.mark.anyio
+async def test_in_memory_backend_expires():
+    backend = InMemoryCacheBackend()
+    await backend.set("a", b"1", expire=timedelta(seconds=-1))
+    assert await backend.get("a") is None
+
+
+@pytest.mark.anyio
+async def test_read_through_loads_once_until_invalidated(cache_backend):
+    cache = ReadThroughCache(cache_backend)
+    calls = []
+
+    async def loader() -> bytes:
+        calls.append(1)
+        return b'{"value":\n1}'
+
+    first = await cache.get_or_load("key", loader)
+    second = await cache.get_or_load("key", loader)
+    assert first == second
+    assert second.body == b'{"value":\n1}'
+    assert second.etag == compute_etag(b'{"value":\n1}', weak=True)
+    assert len(calls) == 1
+
+    await cache.invalidate("key")
+    await cache.get_or_load("key", loader)
+    assert len(calls) == 2
+
+
+def test_etag_matches():
+    etag = compute_etag(b"body")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_entity_etag_covers_every_field():
+    modified = datetime(2025, 1, 1)
+    challenge = ChallengeModelBaseOutputDTO(
+        id=1, version=1, challenge_modified_time=modified, challenge_tasks=[TaskModelBaseOutputDTO(id=2, version=1)]
+    )
+    etag = entity_etag(to_json(challenge))
+    assert etag.startswith('W/"')
+    assert entity_etag(to_json(challenge.model_copy())) == etag
+    assert entity_etag(to_json(challenge.model_copy(update={"challenge_name": "Renamed"}))) != etag
+
+    challenge.challenge_tasks[0].task_name = "Renamed task"
+    assert entity_etag(to_json(challenge)) != etag
@@ -0,0 +1,183 @@
+# backend/BMC_API/tests/test_response_compression.py
+import json
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import ASGITransport, AsyncClient
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from BMC_API.src.api.middleware.compression_middleware import CompressionMiddleware, choose_encoding
+from BMC_API.src.domain.entities.challenge_model import ChallengeModel
+from BMC_API.src.domain.entities.challenge_history_model import ChallengeHistoryModel
+from BMC_API.src.domain.entities.task_model import TaskModel
+
+pytest_plugins = ["BMC_API.tests.fixtures.admin_user_fixtures"]
+
+LISTING = [{"id": i, "challenge_name": f"Challenge {i}", "challenge_status": "Draft"} for i in range(100)]
+
+
+async def _listing(request):
+    return JSONResponse(LISTING, headers={"ETag": '"listing"'})
+
+
+async def _small(request):
+    return JSONResponse({"status": "ok"})
+
+
+async def _pdf(request):
+    return Response(b"%PDF-1.7" + bytes(4096), media_type="application/pdf")
+
+
+async def _stream(request):
+    async def lines():
+        for item in LISTING:
+            yield json.dumps(item) + "\n"
+
+    return StreamingResponse(lines(), media_type="text/plain")
+
+
+def _app(**options) -> Starlette:
+    app = Starlette(
+        routes=[
+            Route("/listing", _listing),
+            Route("/small", _small),
+            Route("/pdf", _pdf),
+            Route("/stream", _stream),
+        ]
+    )
+    return CompressionMiddleware(app, brotli_enabled=False, **options)
+
+
+async def _get(app, path: str, accept_encoding: str = "gzip"):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+def test_choose_encoding():
+    assert choose_encoding("gzip, deflate, br", ["br", "gzip"]) == "br"
+    assert choose_encoding("gzip;q=1.0, br;q=0", ["br", "gzip"]) == "gzip"
+    assert choose_encoding("*", ["br", "gzip"]) == "br"
+    assert choose_encoding("identity", ["br", "gzip"]) is None
+    assert choose_encoding("", ["gzip"]) is None
+    # The highest quality value wins, ties go to the order of the server
+    assert choose_encoding("br;q=0.5, gzip;q=1", ["br", "gzip"]) == "gzip"
+    assert choose_encoding("gzip;q=0.8, br;q=0.8", ["br", "gzip"]) == "br"
+    assert choose_encoding("gzip;q=0.5, *;q=0.9", ["br", "gzip"]) == "br"
+    assert choose_encoding("identity, gzip;q=0.5", ["br", "gzip"]) is None
+
+
+@pytest.mark.anyio
+async def test_large_json_is_compressed():
+    response = await _get(_app(), "/listing")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) == response.num_bytes_downloaded
+    assert response.headers["ETag"] == 'W/"listing"'
+    assert response.json() == LISTING
+
+
+@pytest.mark.anyio
+async def test_uncompressed_responses():
+    small = await _get(_app(), "/small")
+    pdf = await _get(_app(), "/pdf")
+    not_accepted = await _get(_app(), "/listing", accept_encoding="identity")
+    not_allowed = await _get(_app(content_types=("text/",)), "/listing")
+
+    for response in (small, pdf, not_accepted, not_allowed):
+        assert "Content-Encoding" not in response.headers
+    assert pdf.content.startswith(b"%PDF")
+    assert not_accepted.headers["ETag"] == '"listing"'
+
+
+@pytest.mark.anyio
+async def test_streaming_response_is_compressed_per_chunk():
+    response = await _get(_app(), "/stream")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert [json.loads(line) for line in response.text.splitlines()] == LISTING
+
+
+@pytest.mark.anyio
+async def test_brotli_is_preferred():
+    pytest.importorskip("brotli")
+    app = CompressionMiddleware(Starlette(routes=[Route("/listing", _listing)]))
+
+    response = await _get(app, "/listing", accept_encoding="gzip, br")
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.json() == LISTING
+
+
+async def _create_listing_data(session: AsyncSession, count: int) -> int:
+    """Challenges with tasks, and history snapshots of the first one, whose id is returned."""
+    now = datetime.now()
+    challenges = [
+        ChallengeModel(
+            challenge_name=f"Challenge {i} on multi-organ segmentation",
+            challenge_acronym=f"MOS{i}",
+            challenge_abstract="Segmentation of organs at risk in CT scans of the abdomen. " * 4,
+            challenge_keywords=["CT", "segmentation", "abdomen"],
+            challenge_created_time=now,
+            challenge_status="Draft",
+        )
+        for i in range(count)
+    ]
+    session.add_all(challenges)
+    await session.flush()
+    session.add_all(
+        TaskModel(
+            task_name=f"Task {j} of challenge {challenge.id}",
+            task_abstract="Delineation of the liver, the spleen and the kidneys. " * 4,
+            task_created_time=now,
+            task_challenge_id=challenge.id,
+        )
+        for challenge in challenges
+        for j in range(3)
+    )
+    session.add_all(
+        ChallengeHistoryModel(
+            challenge_id=challenges[0].id,
+            timestamp=now,
+            version=version,
+            old_status="Draft",
+            new_status="Draft submitted",
+            snapshot={
+                "challenge_name": challenges[0].challenge_name,
+                "challenge_abstract": challenges[0].challenge_abstract,
+            },
+        )
+        for version in range(50)
+    )
+    await session.commit()
+    return challenges[0].id
+
+
+@pytest.mark.anyio
+async def test_benchmark_compressed_listing_sizes(
+    client: AsyncClient, fastapi_app: FastAPI, admin_token, dbsession: AsyncSession
+):
+    first_id = await _create_listing_data(dbsession, 200)
+    shapes = (
+        ("listing of 200 challenges with tasks", "POST", fastapi_app.url_path_for("list_challenges_route_admin")),
+        ("50 history snapshots", "GET", fastapi_app.url_path_for("get_challenge_history_admin", id=first_id)),
+    )
+
+    for name, method, url in shapes:
+        sizes = {}
+        for encoding in ("identity", "gzip"):
+            response = await client.request(
+                method, url, headers={"Authorization": f"Bearer {admin_token}", "Accept-Encoding": encoding}
+            )
+            assert response.status_code == status.HTTP_200_OK
+            sizes[encoding] = response.num_bytes_downloaded
+        logger.info(
+            f"Compressed {name}: {sizes['identity']} bytes, gzip {sizes['gzip']} bytes "
+            f"({100 * (1 - sizes['gzip'] / sizes['identity']):.1f}% saved)"
+        )
+        assert sizes["gzip"] < sizes["identity"] / 4
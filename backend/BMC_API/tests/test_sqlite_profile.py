@@ -0,0 +1,43 @@
+# backend/BMC_API/tests/test_sqlite_profile.py
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from BMC_API.src.core.config.settings import settings
+from BMC_API.src.infrastructure.persistence.sqlite import (
+    configure_sqlite_engine,
+    verify_sqlite_pragmas,
+)
+
+
+@pytest.mark.anyio
+async def test_profile_is_applied_on_connect(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "db_sqlite_busy_timeout_in_ms", 1234)
+    monkeypatch.setattr(settings, "db_sqlite_foreign_keys", True)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'profile.sqlite3'}")
+    configure_sqlite_engine(engine)
+    try:
+        effective = await verify_sqlite_pragmas(engine)
+        async with engine.connect() as connection:
+            assert (await connection.execute(text("PRAGMA busy_timeout"))).scalar() == 1234
+    finally:
+        await engine.dispose()
+
+    assert effective["journal_mode"] == "wal"
+    assert effective["synchronous"] == 1
+    assert effective["temp_store"] == 2
+    assert effective["foreign_keys"] == 1
+    assert effective["cache_size"] == settings.db_sqlite_cache_size
+
+
+@pytest.mark.anyio
+async def test_verify_reports_unsupported_journal_mode():
+    # In-memory databases can not use WAL, SQLite keeps the memory journal
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    configure_sqlite_engine(engine)
+    try:
+        effective = await verify_sqlite_pragmas(engine)
+    finally:
+        await engine.dispose()
+
+    assert effective["journal_mode"] == "memory"
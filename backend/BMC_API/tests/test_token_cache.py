@@ -0,0 +1,61 @@
+# backend/BMC_API/tests/test_token_cache.py
+from datetime import timedelta
+
+import pytest
+
+from BMC_API.src.infrastructure.external_services.redis.token_cache_impl import (
+    InMemoryTokenCache,
+    RedisTokenCache,
+)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def token_cache(request, fake_redis):
+    if request.param == "memory":
+        return InMemoryTokenCache()
+    return RedisTokenCache(fake_redis)
+
+
+@pytest.mark.anyio
+async def test_set_and_get_token(token_cache):
+    await token_cache.set_token("a", "1", timedelta(minutes=1))
+    assert await token_cache.get_token("a") == "1"
+    assert await token_cache.get_token("missing") is None
+
+
+@pytest.mark.anyio
+async def test_set_many_get_many(token_cache):
+    await token_cache.set_many(
+        {
+            "access": ("1", timedelta(minutes=1)),
+            "refresh": ("2", timedelta(days=1)),
+        }
+    )
+    assert await token_cache.get_many(["access", "missing", "refresh"]) == ["1", None, "2"]
+
+
+@pytest.mark.anyio
+async def test_delete_many(token_cache):
+    await token_cache.set_many({"a": ("1", timedelta(minutes=1)), "b": ("2", timedelta(minutes=1))})
+    await token_cache.delete_many(["a", "b", "missing"])
+    assert await token_cache.get_many(["a", "b"]) == [None, None]
+
+
+@pytest.mark.anyio
+async def test_empty_batches_are_noops(token_cache):
+    await token_cache.set_many({})
+    await token_cache.delete_many([])
+    assert await token_cache.get_many([]) == []
+
+
+@pytest.mark.anyio
+async def test_in_memory_token_expires(monkeypatch):
+    cache = InMemoryTokenCache()
+    now = [1000.0]
+    monkeypatch.setattr(
+        "BMC_API.src.infrastructure.external_services.redis.token_cache_impl.time.monotonic", lambda: now[0]
+    )
+    await cache.set_token("a", "1", timedelta(seconds=10))
+    assert await cache.get_token("a") == "1"
+    now[0] += 11
+    assert await cache.get_token("a") is None
@@ -128,6 +128,9 @@ class TestUserRoutes:
         assert "access_token" in response.json()
         assert "refresh_token" in response.json()
         assert response.json()["token_type"] == "bearer"
+        # Issued tokens are never stored by browsers or proxies
+        assert response.headers["Cache-Control"].startswith("no-store")
+        assert response.headers["Pragma"] == "no-cache"
 
     async def test_login_invalid_credentials(
         self,
@@ -504,13 +507,13 @@ class TestUserRoutes:
             RedisTokenCache,
         )
 
-        async def fake_get_token(self, token: str) -> bool:
-            return True
+        async def fake_get_many(self, keys) -> list:
+            return [True, None]
 
         monkeypatch.setattr(
             RedisTokenCache,
-            "get_token",
-            fake_get_token,
+            "get_many",
+            fake_get_many,
         )
 
         # Act: attempt to refresh with the blacklisted token
@@ -1,5 +1,6 @@
 # backend/BMC_API/tests/unit/test_user_service.py
 import json
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -15,6 +16,8 @@ from BMC_API.src.core.exceptions import (
     UserNotFoundException,
 )
 from BMC_API.src.domain.entities.user_model import UserModel
+from BMC_API.src.domain.interfaces.token_cache import revoked_user_key
+from BMC_API.src.infrastructure.external_services.redis.token_cache_impl import InMemoryTokenCache
 
 pytest_plugins = [
     "BMC_API.tests.fixtures.user_fixtures",
@@ -267,8 +270,10 @@ class TestUserService:
             mock_decode_access.assert_any_call("mock_refresh_token")
             assert mock_decode_access.call_count == 2
 
-            # Check if token cache was called to set tokens
-            assert mock_token_cache.set_token.call_count == 2
+            # Check if both tokens were blacklisted in a single batched call
+            assert mock_token_cache.set_many.call_count == 1
+            blacklisted = mock_token_cache.set_many.call_args.args[0]
+            assert set(blacklisted) == {"mock_access_token", "mock_refresh_token"}
 
     async def test_confirm_email_success(self):
         # Arrange
@@ -393,11 +398,7 @@ class TestUserService:
 
         # stubbed token cache that says token is blacklisted
         token_cache = AsyncMock()
-
-        async def fake_get(token):
-            return True
-
-        token_cache.get_token.side_effect = fake_get
+        token_cache.get_many.return_value = ["2026-01-01", None]
 
         # decode_token returns a valid refresh token payload
         monkeypatch.setattr(auth, "decode_token", lambda t: {"type": "refresh", "sub": "user@example.com"})
@@ -406,7 +407,10 @@ class TestUserService:
         with pytest.raises(InvalidTokenException):
             await service.refresh_token(admin_service, token_data, token_cache)
 
-        admin_service.update.assert_awaited_once_with(id=42, user_update={"disabled": True})
+        token_cache.get_many.assert_awaited_once_with(["blacklisted", revoked_user_key("user@example.com")])
+        admin_service.update.assert_awaited_once_with(id=42, user_update={"disabled": True}, token_cache=token_cache)
+        token_cache.set_many.assert_awaited_once()
+        assert set(token_cache.set_many.call_args.args[0]) == {"foo", "blacklisted"}
 
     async def test_refresh_token_success(self, monkeypatch):
         mock_repo = AsyncMock()
@@ -417,10 +421,7 @@ class TestUserService:
         # decode_token returns a valid refresh payload
         monkeypatch.setattr(auth, "decode_token", lambda t: {"type": "refresh", "sub": "user@example.com"})
 
-        async def fake_get(token):
-            return False
-
-        token_cache.get_token.side_effect = fake_get
+        token_cache.get_many.return_value = [None, None]
 
         # generate_bearer_tokens returns known tokens
         expected = Token(access_token="new_access", refresh_token="new_refresh")
@@ -430,3 +431,18 @@ class TestUserService:
         result = await service.refresh_token(admin_service, token_data, token_cache)
 
         assert result == expected
+
+    async def test_refresh_token_of_disabled_user(self, monkeypatch):
+        service = UserService(repository=AsyncMock())
+        admin_service = AsyncMock()
+        token_cache = InMemoryTokenCache()
+        await token_cache.set_token(revoked_user_key("user@example.com"), "2026-01-01", timedelta(days=1))
+
+        monkeypatch.setattr(auth, "decode_token", lambda t: {"type": "refresh", "sub": "user@example.com"})
+        token_data = Token(access_token="foo", refresh_token="valid")
+
+        with pytest.raises(InvalidTokenException):
+            await service.refresh_token(admin_service, token_data, token_cache)
+
+        # Not a stolen token, the user is not disabled again
+        admin_service.update.assert_not_awaited()